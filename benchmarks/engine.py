@@ -0,0 +1,377 @@
+"""
+Benchmark the engine's own overhead with instant scripted players.
+
+Plays synthetic games over a grid of player counts, round counts, phase sets
+and memory strategies. Scripted players answer immediately (in the formats
+the phases parse), so every measured second is spent in the engine: phases,
+history rendering, memory consolidation, stats and logging. Each game runs in
+a fresh process, so peak RSS is measured per game.
+
+For every game the results record the CPU time of each phase (summed over
+rounds), the time spent in History.render_for_player and
+render_segments_for_player, peak RSS, and the time of _compute_stats and
+_write_log (which includes _compute_stats) along with the log size.
+
+Usage:
+    uv run python benchmarks/engine.py [--players 5 10 20] [--rounds 4]
+        [--phase-sets default sidebars memory quips]
+        [--memory none summarization] [--output results.json]
+
+Compare two result files (e.g. from two commits):
+    uv run python benchmarks/engine.py --compare before.json after.json
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List
+
+from agent_island import GameConfig, GameEngine, Player, PlayerConfig
+from agent_island.memory import STRATEGY_REGISTRY, create_strategy
+from agent_island.mock_server import answer
+from agent_island.player import ChoiceResponse, FreeResponse
+
+# Phases of every round but the last, and per-phase config, by phase set
+PHASE_SETS: Dict[str, tuple[List[str], Dict[str, dict]]] = {
+    "default": (
+        ["sidebars", "pitches", "votes", "elimination", "consolidate_memory"],
+        {},
+    ),
+    "sidebars": (
+        ["sidebars", "pitches", "votes", "elimination"],
+        {"sidebars": {"num_exchanges": 8}},
+    ),
+    "memory": (["pitches", "votes", "elimination", "consolidate_memory"], {}),
+    "quips": (["pitches", "votes", "elimination"], {}),
+}
+
+# Phases of the final round, by phase set
+FINAL_PHASES: Dict[str, List[str]] = {
+    "default": ["pitches", "votes"],
+    "sidebars": ["sidebars", "pitches", "votes"],
+    "memory": ["pitches", "votes"],
+    "quips": ["pitches", "votes", "opponent_quips"],
+}
+
+RULES_PROMPT = "You are a player in a game. " * 40
+RESPONSE_WORDS = 80
+
+
+class ScriptedPlayer(Player):
+    """
+    A player that answers instantly with canned text.
+
+    Free responses come from the mock server's answer generator (so quips
+    are well formed), choices are a deterministic pick among the options,
+    and every response carries usage metadata like an AI player's.
+    """
+
+    def __init__(self, config: PlayerConfig):
+        self.config = config
+        self.memory = create_strategy(config.memory_strategy)
+
+    def free_response(
+        self, system_prompt: str, context: str, action: str, llm_instructions: str = ""
+    ) -> FreeResponse:
+        text = answer(f"{action}\n{llm_instructions}", RESPONSE_WORDS)
+        return FreeResponse(
+            text=text,
+            reasoning="Scripted.",
+            metadata=_usage(system_prompt, context, action, text),
+        )
+
+    def choice_response(
+        self,
+        system_prompt: str,
+        context: str,
+        options: list[str],
+        action: str,
+        llm_instructions: str = "",
+    ) -> ChoiceResponse:
+        selected = options[zlib.crc32(action.encode("utf-8")) % len(options)]
+        text = f"<choice>{selected}</choice>\n" + answer(action, RESPONSE_WORDS)
+        return ChoiceResponse(
+            selected=selected,
+            text=text,
+            reasoning="Scripted.",
+            metadata=_usage(system_prompt, context, action, text),
+        )
+
+
+def _usage(system_prompt: str, context: str, action: str, text: str) -> dict:
+    input_tokens = (len(system_prompt) + len(context) + len(action)) // 4
+    completion_tokens = len(text) // 4
+    return {
+        "input_tokens": input_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": input_tokens + completion_tokens,
+        "cost": input_tokens * 1e-6 + completion_tokens * 4e-6,
+    }
+
+
+class InstrumentedEngine(GameEngine):
+    """GameEngine that times its phases, history rendering, stats and log."""
+
+    def __init__(self, game_config: GameConfig, players: list[Player]):
+        super().__init__(game_config, players)
+        self.phase_cpu_s: Dict[str, float] = {}
+        self.phase_wall_s: Dict[str, float] = {}
+        self.render = {"calls": 0, "seconds": 0.0}
+        self.stats_s = 0.0
+        self.write_log_s = 0.0
+        for name in ("render_for_player", "render_segments_for_player"):
+            setattr(self.history, name, self._timed_render(getattr(self.history, name)))
+
+    def _timed_render(self, render: Callable) -> Callable:
+        def timed(player_id: str) -> Any:
+            start = time.perf_counter()
+            try:
+                return render(player_id)
+            finally:
+                self.render["seconds"] += time.perf_counter() - start
+                self.render["calls"] += 1
+
+        return timed
+
+    def _get_phases_for_round(
+        self, round_index: int, use_async: bool = False
+    ) -> List[Callable]:
+        names = self.game_config.round_phase_overrides.get(
+            round_index, self.game_config.phases
+        )
+        phases = super()._get_phases_for_round(round_index, use_async)
+        return [self._timed_phase(name, phase) for name, phase in zip(names, phases)]
+
+    def _timed_phase(self, name: str, phase: Callable) -> Callable:
+        def record(cpu_start: float, wall_start: float) -> None:
+            cpu = time.process_time() - cpu_start
+            wall = time.perf_counter() - wall_start
+            self.phase_cpu_s[name] = self.phase_cpu_s.get(name, 0.0) + cpu
+            self.phase_wall_s[name] = self.phase_wall_s.get(name, 0.0) + wall
+
+        if inspect.iscoroutinefunction(phase):
+
+            async def timed_async(context: Any) -> None:
+                starts = time.process_time(), time.perf_counter()
+                await phase(context)
+                record(*starts)
+
+            return timed_async
+
+        def timed(context: Any) -> None:
+            starts = time.process_time(), time.perf_counter()
+            phase(context)
+            record(*starts)
+
+        return timed
+
+    def _compute_stats(self) -> dict:
+        start = time.perf_counter()
+        stats = super()._compute_stats()
+        self.stats_s += time.perf_counter() - start
+        return stats
+
+    def _write_log(self, *args: Any, **kwargs: Any) -> str | None:
+        start = time.perf_counter()
+        path = super()._write_log(*args, **kwargs)
+        self.write_log_s += time.perf_counter() - start
+        return path
+
+
+def run_game(
+    num_players: int, num_rounds: int, phase_set: str, memory: str, mode: str
+) -> Dict[str, Any]:
+    """Play one synthetic game and return its measurements."""
+    logging.disable(logging.INFO)
+    phases, phase_config = PHASE_SETS[phase_set]
+    players: list[Player] = [
+        ScriptedPlayer(
+            PlayerConfig(
+                player_id=f"P{i}",
+                character_prompt=f"You are player P{i}. " * 20,
+                memory_strategy=memory,
+            )
+        )
+        for i in range(num_players)
+    ]
+
+    with tempfile.TemporaryDirectory() as logs_dir:
+        config = GameConfig(
+            num_players=num_players,
+            num_rounds=num_rounds,
+            phases=phases,
+            rules_prompt=RULES_PROMPT,
+            logs_dir=logs_dir,
+            round_phase_overrides={num_rounds: FINAL_PHASES[phase_set]},
+            round_type_overrides={num_rounds: "final"},
+            phase_config=phase_config,
+            game_id=f"bench-{num_players}-{num_rounds}-{phase_set}-{memory}",
+        )
+        engine = InstrumentedEngine(config, players)
+
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        if mode == "async":
+            log_path = asyncio.run(engine.play_async())
+        else:
+            log_path = engine.play()
+        cpu_s = time.process_time() - cpu_start
+        wall_s = time.perf_counter() - wall_start
+        log_bytes = os.path.getsize(log_path)
+
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_rss_mb = max_rss / (2**20 if sys.platform == "darwin" else 2**10)
+
+    return {
+        "players": num_players,
+        "rounds": num_rounds,
+        "phase_set": phase_set,
+        "memory": memory,
+        "mode": mode,
+        "wall_s": round(wall_s, 4),
+        "cpu_s": round(cpu_s, 4),
+        "phase_cpu_s": {k: round(v, 4) for k, v in engine.phase_cpu_s.items()},
+        "phase_wall_s": {k: round(v, 4) for k, v in engine.phase_wall_s.items()},
+        "render_calls": engine.render["calls"],
+        "render_s": round(engine.render["seconds"], 4),
+        "compute_stats_s": round(engine.stats_s, 4),
+        "write_log_s": round(engine.write_log_s, 4),
+        "log_bytes": log_bytes,
+        "peak_rss_mb": round(peak_rss_mb, 1),
+    }
+
+
+def _grid(args: argparse.Namespace) -> List[tuple]:
+    grid = []
+    for num_players in args.players:
+        for num_rounds in args.rounds or [num_players - 1]:
+            # Every round but the final one eliminates a player
+            if not 2 <= num_rounds <= num_players:
+                print(
+                    f"Skipping {num_players} players x {num_rounds} rounds "
+                    "(needs 2 <= rounds <= players)"
+                )
+                continue
+            for phase_set in args.phase_sets:
+                for memory in args.memory:
+                    grid.append((num_players, num_rounds, phase_set, memory, args.mode))
+    return grid
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _key(result: Dict[str, Any]) -> tuple:
+    return tuple(
+        result[k] for k in ("players", "rounds", "phase_set", "memory", "mode")
+    )
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """Print the change of the main measurements between two result files."""
+    with open(before_path) as f:
+        before = {_key(r): r for r in json.load(f)["results"]}
+    with open(after_path) as f:
+        after = json.load(f)["results"]
+
+    metrics = ("cpu_s", "render_s", "write_log_s", "log_bytes", "peak_rss_mb")
+    print("game".ljust(40) + "".join(m.rjust(14) for m in metrics))
+    for result in after:
+        old = before.get(_key(result))
+        if old is None:
+            continue
+        label = "{players}p x {rounds}r {phase_set}/{memory}/{mode}".format(**result)
+        cells = []
+        for metric in metrics:
+            ratio = result[metric] / old[metric] if old[metric] else float("nan")
+            cells.append(f"{ratio:13.2f}x")
+        print(label.ljust(40) + "".join(cells))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, nargs="+", default=[5, 10, 20])
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        nargs="+",
+        default=None,
+        help="Round counts (default: one fewer than the number of players)",
+    )
+    parser.add_argument(
+        "--phase-sets", nargs="+", choices=list(PHASE_SETS), default=list(PHASE_SETS)
+    )
+    parser.add_argument(
+        "--memory",
+        nargs="+",
+        choices=list(STRATEGY_REGISTRY),
+        default=["none", "summarization"],
+    )
+    parser.add_argument("--mode", choices=["sync", "async"], default="sync")
+    parser.add_argument(
+        "--output", default=None, help="Write results to this JSON file"
+    )
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BEFORE", "AFTER"),
+        help="Compare two result files instead of running",
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    results = []
+    # A fresh process per game keeps peak RSS (and caches) per game
+    context = multiprocessing.get_context("spawn")
+    for point in _grid(args):
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            result = executor.submit(run_game, *point).result()
+        results.append(result)
+        print(
+            "{players:>3}p x {rounds:>2}r {phase_set:>8}/{memory:<20} "
+            "cpu {cpu_s:7.3f}s  render {render_s:7.3f}s ({render_calls} calls)  "
+            "stats {compute_stats_s:6.3f}s  log {write_log_s:6.3f}s "
+            "{log_bytes:>10,}B  rss {peak_rss_mb:6.1f}MB".format(**result)
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "commit": _commit(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+        print(f"Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark History.render_for_player against a full rescan of the history.
+
+Simulates a game without LLM calls: every round, each player renders their
+history before a public pitch and again before a private vote, which mirrors
+how the pitches and votes phases call render_for_player.
+
+Usage:
+    uv run python benchmarks/render_history.py [--players 20] [--rounds 30]
+"""
+
+import argparse
+import time
+from typing import List
+
+from agent_island.history import History
+
+
+def render_full_rescan(history: History, player_id: str) -> str:
+    """Reference implementation: rescan every event of every round."""
+    parts: List[str] = [
+        "The following are the game events currently visible to you:",
+        "<game_history>",
+    ]
+    for round_log in history.rounds.values():
+        visible = [e for e in round_log.events if player_id in e.active_visibility]
+        if not visible:
+            continue
+        parts.append(f"Round {round_log.round_index}:")
+        for event in visible:
+            parts.append(f"{event.heading}:")
+            parts.append(f"{event.content}\n")
+    parts.append("</game_history>")
+    return "\n".join(parts)
+
+
+def simulate(num_players: int, num_rounds: int, cached: bool) -> tuple[float, int]:
+    """
+    Play a synthetic game and time every render.
+
+    Returns:
+        (seconds spent rendering, number of renders)
+    """
+    player_ids = [f"P{i}" for i in range(num_players)]
+    history = History()
+    history.player_ids = player_ids
+    render = (
+        history.render_for_player
+        if cached
+        else lambda pid: render_full_rescan(history, pid)
+    )
+
+    elapsed = 0.0
+    renders = 0
+    pitch = "I deserve to advance because " + "of my strategy. " * 20
+
+    for round_index in range(1, num_rounds + 1):
+        history.start_round(round_index, round_index == num_rounds, player_ids, [])
+        history.narrate(
+            round_index, "Narrator", "Welcome!", player_ids, player_ids.copy()
+        )
+
+        for player_id in player_ids:
+            start = time.perf_counter()
+            render(player_id)
+            elapsed += time.perf_counter() - start
+            renders += 1
+            history.add_event(
+                round_index=round_index,
+                heading=f"Player {player_id}'s Pitch",
+                role=f"player {player_id}",
+                prompt="N/A",
+                content=pitch,
+                visibility=player_ids,
+                active_visibility=player_ids.copy(),
+            )
+
+        for player_id in player_ids:
+            start = time.perf_counter()
+            render(player_id)
+            elapsed += time.perf_counter() - start
+            renders += 1
+            history.add_event(
+                round_index=round_index,
+                heading=f"Player {player_id}'s Vote",
+                role=f"player {player_id}",
+                prompt="N/A",
+                content="<choice>P0</choice> Because.",
+                visibility=[player_id],
+                active_visibility=[player_id],
+            )
+
+    return elapsed, renders
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=30)
+    args = parser.parse_args()
+
+    rescan, renders = simulate(args.players, args.rounds, cached=False)
+    cached, _ = simulate(args.players, args.rounds, cached=True)
+
+    print(f"{args.players} players x {args.rounds} rounds, {renders} renders")
+    print(f"  full rescan: {rescan:8.3f}s ({rescan / renders * 1e6:8.1f}us/render)")
+    print(f"  cached:      {cached:8.3f}s ({cached / renders * 1e6:8.1f}us/render)")
+    print(f"  speedup:     {rescan / cached:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -52,6 +52,33 @@ def parse_event(event: dict) -> tuple[str, str, str, str, str, list[str]]:
     return heading, role, prompt, reasoning, content, visibility
 
 
+def resolve_prompts(game_log: dict) -> None:
+    """
+    Rebuild each event's prompt from the log's prompt segment table.
+
+    Prompts are stored as lists of segment IDs (``prompt_segments``) that
+    index into the top-level ``prompt_segments`` table. A table entry is
+    either text or a list of segment IDs to concatenate.
+    """
+    segments = game_log.get("prompt_segments") or {}
+
+    def expand(segment_ids: list[str]) -> str:
+        texts: list[str] = []
+        stack = list(reversed(segment_ids))
+        while stack:
+            value = segments[stack.pop()]
+            if isinstance(value, str):
+                texts.append(value)
+            else:
+                stack.extend(reversed(value))
+        return "".join(texts)
+
+    for round_log in game_log.get("history", {}).values():
+        for event in round_log.get("events", []):
+            if "prompt" not in event and "prompt_segments" in event:
+                event["prompt"] = expand(event["prompt_segments"])
+
+
 def render_html_event(
     event: dict, include_prompt: bool = False, include_reasoning: bool = False
 ) -> str:
@@ -328,9 +355,19 @@ if __name__ == "__main__":
         with open(css_path) as f:
             css = f.read()
 
-    with open(f"logs/{args.filename}.json", "r") as f:
+    log_path = f"logs/{args.filename}.json"
+    if not os.path.exists(log_path) and os.path.exists(f"logs/{args.filename}.jsonl"):
+        # Game was killed before the final JSON log was written
+        from agent_island import compact_log
+
+        compact_log(f"logs/{args.filename}.jsonl", log_path)
+
+    with open(log_path, "r") as f:
         game_history = json.load(f)
 
+    if args.include_prompts:
+        resolve_prompts(game_history)
+
     html_content = build_outputs(
         game_history["history"],
         players=game_history.get("players", {}),
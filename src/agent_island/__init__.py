@@ -1,10 +1,15 @@
+from .cassette import Cassette, CassetteMiss
 from .engine import GameConfig, GameEngine
+from .game_log import compact_log
 from .loaders import (
     create_players,
     load_game_config_from_toml,
+    load_game_log,
     load_player_configs_from_toml,
+    load_rate_limits_from_toml,
+    resolve_prompt,
 )
-from .phases import PHASE_REGISTRY
+from .phases import ASYNC_PHASE_REGISTRY, PHASE_REGISTRY
 from .player import (
     AIPlayer,
     ChoiceCollector,
@@ -15,10 +20,17 @@ from .player import (
     RemoteChoiceCollector,
     RemoteFreeCollector,
 )
+from .ratelimit import RateLimits, configure_rate_limits
+from .retry import CircuitOpenError, DeadlineExceeded, RetryPolicy
 
 __all__ = [
     "AIPlayer",
+    "ASYNC_PHASE_REGISTRY",
+    "Cassette",
+    "CassetteMiss",
     "ChoiceCollector",
+    "CircuitOpenError",
+    "DeadlineExceeded",
     "FreeCollector",
     "GameConfig",
     "GameEngine",
@@ -26,9 +38,16 @@ __all__ = [
     "PHASE_REGISTRY",
     "Player",
     "PlayerConfig",
+    "RateLimits",
     "RemoteChoiceCollector",
     "RemoteFreeCollector",
+    "RetryPolicy",
+    "compact_log",
+    "configure_rate_limits",
     "create_players",
     "load_game_config_from_toml",
+    "load_game_log",
     "load_player_configs_from_toml",
+    "load_rate_limits_from_toml",
+    "resolve_prompt",
 ]
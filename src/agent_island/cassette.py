@@ -0,0 +1,125 @@
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict
+from typing import Any, Dict, List
+
+from .llm_response import LLMResponse
+
+CASSETTE_MODES = ("record", "replay")
+
+
+class CassetteMiss(LookupError):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+class Cassette:
+    """
+    Record/replay store of AIPlayer responses.
+
+    In ``record`` mode the cassette file is truncated when opened, then every
+    successful request/response pair is appended to it (JSON Lines, one pair
+    per line, flushed as written), so re-recording to a path replaces the
+    earlier recording. In
+    ``replay`` mode responses are served from the file without any network
+    access. Requests are keyed by a hash of the full request (model,
+    instructions, input and client_kwargs); a request made several times is
+    answered with its recorded responses in order.
+
+    Combined with a fixed ``game_id`` (which seeds the game's random draws), a
+    replayed game makes the same requests as the recorded one and reproduces
+    it exactly, as long as phases run sequentially (``max_concurrency = 1``).
+
+    Args:
+        path: Path to the cassette file
+        mode: "record" or "replay"
+    """
+
+    def __init__(self, path: str, mode: str) -> None:
+        if mode not in CASSETTE_MODES:
+            raise ValueError(
+                f"Unknown cassette mode '{mode}'. Available: {list(CASSETTE_MODES)}"
+            )
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._responses: Dict[str, List[Dict[str, Any]]] = {}
+        self._served: Dict[str, int] = {}
+
+        if mode == "replay":
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        break  # truncated by a killed recording
+                    entry = json.loads(line)
+                    self._responses.setdefault(entry["key"], []).append(
+                        entry["response"]
+                    )
+            self._file = None
+        else:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(path, "w", encoding="utf-8")
+
+    @staticmethod
+    def key(request: Dict[str, Any]) -> str:
+        """Stable hash of a request's keyword arguments."""
+        canonical = json.dumps(request, sort_keys=True, default=repr)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def replay(self, request: Dict[str, Any]) -> LLMResponse:
+        """
+        Serve the next recorded response for a request.
+
+        Args:
+            request: The request keyword arguments
+
+        Returns:
+            The recorded LLMResponse
+
+        Raises:
+            CassetteMiss: No (more) responses were recorded for the request
+        """
+        key = self.key(request)
+        with self._lock:
+            recorded = self._responses.get(key, [])
+            served = self._served.get(key, 0)
+            if served >= len(recorded):
+                raise CassetteMiss(
+                    f"No recorded response for request {key[:16]} "
+                    f"(model {request.get('model')}) in {self.path}"
+                )
+            self._served[key] = served + 1
+            response = recorded[served]
+        return LLMResponse(
+            text=response["text"],
+            reasoning=response["reasoning"],
+            metadata=response["metadata"],
+        )
+
+    def record(self, request: Dict[str, Any], response: LLMResponse) -> None:
+        """
+        Append a request/response pair to the cassette.
+
+        Args:
+            request: The request keyword arguments
+            response: The parsed response
+
+        Returns:
+            None
+        """
+        entry = {
+            "key": self.key(request),
+            "model": request.get("model"),
+            "response": asdict(response),
+        }
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None and not self._file.closed:
+            self._file.close()
@@ -5,13 +5,17 @@ import pathlib
 
 import dotenv
 
-from .engine import GameConfig, GameEngine
-from .history import Event
+from .cassette import Cassette
+from .engine import GameEngine
+from .history import Event, EventDelta
 from .loaders import (
+    create_game_config,
     create_players,
     load_game_config_from_toml,
     load_player_configs_from_toml,
+    load_rate_limits_from_toml,
 )
+from .ratelimit import configure_rate_limits
 
 LOGS_DIR = "logs"
 
@@ -65,42 +69,87 @@ def main() -> None:
         default=pathlib.Path("player_config.toml"),
         help="Path to a player config TOML file",
     )
+    parser.add_argument(
+        "--resume",
+        type=pathlib.Path,
+        default=None,
+        help="Resume a failed or killed game from its log (.json or .jsonl)",
+    )
+    cassette_group = parser.add_mutually_exclusive_group()
+    cassette_group.add_argument(
+        "--record-cassette",
+        type=pathlib.Path,
+        default=None,
+        help="Record every AI response to this cassette file (overwriting it)",
+    )
+    cassette_group.add_argument(
+        "--replay-cassette",
+        type=pathlib.Path,
+        default=None,
+        help="Serve AI responses from this cassette file (no network)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream AI pitches and sidebar messages as they are generated",
+    )
     args = parser.parse_args()
 
     api_key = os.getenv("OPENROUTER_API_KEY", "")
 
     game_data = load_game_config_from_toml(args.game_config)
     player_configs = load_player_configs_from_toml(args.player_config, api_key=api_key)
+    configure_rate_limits(load_rate_limits_from_toml(args.player_config))
 
-    if any(c.player_type == "ai" for c in player_configs) and not api_key:
+    cassette = None
+    if args.record_cassette:
+        cassette = Cassette(str(args.record_cassette), "record")
+    elif args.replay_cassette:
+        cassette = Cassette(str(args.replay_cassette), "replay")
+
+    needs_api = cassette is None or cassette.mode == "record"
+    if needs_api and any(c.player_type == "ai" for c in player_configs) and not api_key:
         raise RuntimeError("OPENROUTER_API_KEY is required for AI players but not set.")
 
-    players = create_players(player_configs, CLIFreeCollector(), CLIChoiceCollector())
-
-    game_config = GameConfig(
-        num_players=game_data["num_players"],
-        num_rounds=game_data["num_rounds"],
-        phases=game_data["phases"],
-        logs_dir=game_data.get("logs_dir", LOGS_DIR) or None,
-        rules_prompt=game_data["rules_prompt"],
-        round_phase_overrides=game_data.get("round_phase_overrides", {}),
-        round_type=game_data.get("round_type", "elimination"),
-        round_type_overrides=game_data.get("round_type_overrides", {}),
-        phase_config=game_data.get("phase_config", {}),
-        round_phase_config_overrides=game_data.get("round_phase_config_overrides", {}),
-        log_prefix=game_data.get("log_prefix", "gameplay"),
-        game_id=game_data.get("game_id"),
+    players = create_players(
+        player_configs, CLIFreeCollector(), CLIChoiceCollector(), cassette=cassette
+    )
+
+    overrides = {"stream_responses": True} if args.stream else {}
+    game_config = create_game_config(
+        game_data, logs_dir=game_data.get("logs_dir", LOGS_DIR) or None, **overrides
     )
 
     human_ids = {p.config.player_id for p in players if p.config.player_type == "human"}
 
+    # Heading of the response being streamed to stdout (if any)
+    streaming: list[str] = []
+
     def on_event(event: Event) -> None:
         if any(pid in event.visibility for pid in human_ids):
+            if streaming and streaming[0] == event.heading:
+                # Already printed as it streamed in
+                streaming.clear()
+                print()
+                return
             content = event.content
             if event.metadata and event.metadata.get("vote"):
                 content = f"Vote: {event.metadata['vote']}\n{content}"
             print(f"\n{event.heading}:\n{content}")
 
+    def on_delta(delta: EventDelta) -> None:
+        if any(pid in delta.visibility for pid in human_ids):
+            if delta.restart:
+                if streaming and streaming[0] == delta.heading:
+                    # The response is retried and streams again from the start
+                    streaming.clear()
+                    print("\n[interrupted, retrying]")
+                return
+            if not streaming or streaming[0] != delta.heading:
+                streaming[:] = [delta.heading]
+                print(f"\n{delta.heading}:")
+            print(delta.delta, end="", flush=True)
+
     if human_ids:
         # Suppress INFO noise; game events stream to stdout via on_event instead
         logging.getLogger().setLevel(logging.WARNING)
@@ -116,8 +165,16 @@ def main() -> None:
         game_config=game_config,
         players=players,
         on_event=on_event if human_ids else None,
+        on_delta=on_delta if human_ids else None,
     )
-    log_path = game.play()
+    try:
+        if args.resume:
+            log_path = game.resume(str(args.resume))
+        else:
+            log_path = game.play()
+    finally:
+        if cassette:
+            cassette.close()
     if log_path:
         print(f"\nWrote game history to {log_path}")
     else:
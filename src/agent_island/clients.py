@@ -0,0 +1,324 @@
+import asyncio
+import contextlib
+import contextvars
+import logging
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, AsyncIterator, Dict, Iterator
+
+import httpx
+from openrouter import OpenRouter
+
+logger = logging.getLogger(__name__)
+
+# Timeout for pre-warm requests, which only open connections
+PREWARM_TIMEOUT_S = 5.0
+
+
+@dataclass(frozen=True)
+class ClientPoolConfig:
+    """
+    HTTP connection pool settings for the shared OpenRouter clients.
+
+    Args:
+        max_connections: Maximum open connections per client
+        max_keepalive_connections: Maximum idle connections kept open
+        keepalive_expiry: Seconds an idle connection is kept open
+        server_url: API base URL (None for OpenRouter's), e.g. a local
+            mock_server for offline load tests
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    server_url: str | None = None
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+@dataclass
+class TransferMeter:
+    """
+    HTTP body bytes of the requests made while the meter is active.
+
+    Args:
+        sent: Request body bytes
+        received: Response body bytes as received (before decompression)
+    """
+
+    sent: int = 0
+    received: int = 0
+
+
+# Meter of the requests made in the current context (None = not metered)
+_meter: contextvars.ContextVar[TransferMeter | None] = contextvars.ContextVar(
+    "transfer_meter", default=None
+)
+
+
+@contextlib.contextmanager
+def metered(meter: TransferMeter) -> Iterator[TransferMeter]:
+    """
+    Count the bytes of every request made through the shared clients in
+    this context (including tasks and copies of the context it starts).
+
+    Args:
+        meter: The meter to add the bytes to
+    """
+    token = _meter.set(meter)
+    try:
+        yield meter
+    finally:
+        _meter.reset(token)
+
+
+def _request_bytes(request: httpx.Request) -> int:
+    try:
+        return int(request.headers.get("content-length", 0))
+    except ValueError:
+        return 0
+
+
+class _MeteredStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, meter: TransferMeter) -> None:
+        self._stream = stream
+        self._meter = meter
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            self._meter.received += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+class _MeteredAsyncStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, meter: TransferMeter) -> None:
+        self._stream = stream
+        self._meter = meter
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            self._meter.received += len(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+
+
+class _MeteredTransport(httpx.BaseTransport):
+    """HTTP transport that reports body bytes to the context's TransferMeter."""
+
+    def __init__(self, limits: httpx.Limits) -> None:
+        self._transport = httpx.HTTPTransport(limits=limits)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        meter = _meter.get()
+        response = self._transport.handle_request(request)
+        if meter is not None:
+            meter.sent += _request_bytes(request)
+            response.stream = _MeteredStream(response.stream, meter)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _MeteredAsyncTransport(httpx.AsyncBaseTransport):
+    """Async variant of _MeteredTransport."""
+
+    def __init__(self, limits: httpx.Limits) -> None:
+        self._transport = httpx.AsyncHTTPTransport(limits=limits)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        meter = _meter.get()
+        response = await self._transport.handle_async_request(request)
+        if meter is not None:
+            meter.sent += _request_bytes(request)
+            response.stream = _MeteredAsyncStream(response.stream, meter)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _LoopLocalAsyncClient:
+    """
+    Async HTTP client that keeps one httpx.AsyncClient per event loop.
+
+    Connections of an httpx.AsyncClient belong to the loop that opened them,
+    so a client shared by every game in the process must not reuse them
+    across loops (e.g. successive asyncio.run calls).
+    """
+
+    def __init__(self, limits: httpx.Limits) -> None:
+        self._limits = limits
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._template = httpx.AsyncClient(follow_redirects=True, limits=limits)
+
+    def current(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(
+                follow_redirects=True, transport=_MeteredAsyncTransport(self._limits)
+            )
+            self._clients[loop] = client
+        return client
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        return await self.current().send(request, **kwargs)
+
+    def build_request(self, method: str, url: Any, **kwargs: Any) -> httpx.Request:
+        # Building a request does no I/O, so any client will do
+        return self._template.build_request(method, url, **kwargs)
+
+    async def aclose(self) -> None:
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+_lock = threading.Lock()
+_pool_config = ClientPoolConfig()
+_clients: Dict[tuple, OpenRouter] = {}
+
+
+def configure_client_pool(**settings: Any) -> ClientPoolConfig:
+    """
+    Set the default pool settings, used by clients created from now on
+    without settings of their own.
+
+    Args:
+        **settings: ClientPoolConfig fields to change
+
+    Returns:
+        The new default pool settings
+    """
+    global _pool_config
+    with _lock:
+        _pool_config = replace(_pool_config, **settings)
+        return _pool_config
+
+
+def pool_config(**settings: Any) -> ClientPoolConfig:
+    """
+    Get the default pool settings with some fields changed, without
+    changing the defaults.
+
+    Args:
+        **settings: ClientPoolConfig fields to change
+
+    Returns:
+        The pool settings
+    """
+    with _lock:
+        return replace(_pool_config, **settings)
+
+
+def get_client(
+    api_key: str, timeout_ms: int, pool: ClientPoolConfig | None = None
+) -> OpenRouter:
+    """
+    Get the process-wide OpenRouter client for an API key, timeout and pool
+    settings.
+
+    Players with the same key, timeout and pool settings share one client,
+    and with it one HTTP connection pool (per event loop for async
+    requests), so connections and TLS sessions are reused across players
+    and games. Games with different pool settings get different clients.
+
+    Args:
+        api_key: The OpenRouter API key
+        timeout_ms: Request timeout in milliseconds
+        pool: Pool settings (None for the defaults, see
+            configure_client_pool)
+
+    Returns:
+        The shared client
+    """
+    with _lock:
+        pool = pool or _pool_config
+        key = (api_key, timeout_ms, pool)
+        client = _clients.get(key)
+        if client is None:
+            limits = pool.limits()
+            client = OpenRouter(
+                api_key=api_key,
+                timeout_ms=timeout_ms,
+                server_url=pool.server_url,
+                client=httpx.Client(
+                    follow_redirects=True, transport=_MeteredTransport(limits)
+                ),
+                async_client=_LoopLocalAsyncClient(limits),
+            )
+            _clients[key] = client
+        return client
+
+
+def prewarm(client: Any, connections: int) -> None:
+    """
+    Open connections in a client's pool before the first model call.
+
+    Sends ``connections`` concurrent HEAD requests to the API base URL so the
+    TCP and TLS handshakes happen up front; the connections then stay in the
+    keep-alive pool. Failures are logged and ignored.
+
+    Args:
+        client: The OpenRouter client
+        connections: Number of connections to open
+
+    Returns:
+        None
+    """
+    try:
+        http = client.sdk_configuration.client
+        url, _ = client.sdk_configuration.get_server_details()
+    except Exception as exc:
+        logger.debug("Skipping pre-warm of %r: %s", client, exc)
+        return
+
+    def head(_: int) -> None:
+        http.head(url, timeout=PREWARM_TIMEOUT_S)
+
+    with ThreadPoolExecutor(max_workers=max(connections, 1)) as executor:
+        try:
+            list(executor.map(head, range(connections)))
+        except Exception as exc:
+            logger.warning("Pre-warming connections to %s failed: %s", url, exc)
+
+
+async def prewarm_async(client: Any, connections: int) -> None:
+    """
+    Async variant of :func:`prewarm` for the running event loop's pool.
+
+    Args:
+        client: The OpenRouter client
+        connections: Number of connections to open
+
+    Returns:
+        None
+    """
+    try:
+        http = client.sdk_configuration.async_client
+        url, _ = client.sdk_configuration.get_server_details()
+        if isinstance(http, _LoopLocalAsyncClient):
+            http = http.current()
+    except Exception as exc:
+        logger.debug("Skipping pre-warm of %r: %s", client, exc)
+        return
+
+    try:
+        await asyncio.gather(
+            *(http.head(url, timeout=PREWARM_TIMEOUT_S) for _ in range(connections))
+        )
+    except Exception as exc:
+        logger.warning("Pre-warming connections to %s failed: %s", url, exc)
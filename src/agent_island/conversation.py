@@ -0,0 +1,120 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+
+_UPDATE_PREFIX = "New game events visible to you since your last message:\n"
+
+
+def context_delta(previous: str, current: str) -> str | None:
+    """
+    Text inserted into ``previous`` to produce ``current``.
+
+    A player's rendered context only grows while no events are hidden from
+    them: new events are inserted before the closing ``</game_history>`` tag.
+
+    Args:
+        previous: The context already sent
+        current: The new context
+
+    Returns:
+        The inserted text ("" if unchanged), or None if ``current`` is not
+        ``previous`` with a single insertion (e.g. after memory consolidation)
+    """
+    if current == previous:
+        return ""
+    limit = min(len(previous), len(current))
+    start = 0
+    while start < limit and previous[start] == current[start]:
+        start += 1
+    tail = previous[start:]
+    end = len(current) - len(tail)
+    if end < start or not current.endswith(tail):
+        return None
+    return current[start:end]
+
+
+@dataclass
+class _Thread:
+    """An append-only conversation: the input messages and the context they cover."""
+
+    context: str = ""
+    messages: List[Dict[str, str]] = field(default_factory=list)
+
+
+class ConversationState:
+    """
+    Local append-only conversations of one AI player.
+
+    The Responses API is stateless, so every request carries the full input.
+    In chained mode the input is a conversation that only ever grows: the
+    first request sends the full context, and later ones append the
+    player's previous response and a message with just the newly visible
+    events and the action. Every request then shares its whole prefix with
+    the previous one, so the provider's prompt cache covers everything but
+    the new turn, and the model no longer re-reads a re-rendered transcript.
+
+    There is one conversation per system prompt. A conversation starts over
+    from the full context whenever the context changed other than by new
+    events (e.g. after memory consolidation hid events or changed the
+    player's memory).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._threads: Dict[str, _Thread] = {}
+
+    def build_input(
+        self, instructions: str, context: str, tail: str
+    ) -> Tuple[List[Dict[str, str]], int, Callable[[str], None]]:
+        """
+        Build the input of a request.
+
+        Args:
+            instructions: The system prompt (selects the conversation)
+            context: The player's full rendered context
+            tail: The action and instructions that follow the context
+
+        Returns:
+            tuple: (input messages, turn number starting at 1 for a full
+            context, callback to commit the turn with the response text)
+        """
+        with self._lock:
+            thread = self._threads.get(instructions)
+            delta = context_delta(thread.context, context) if thread else None
+            if thread is None or delta is None:
+                thread = _Thread()
+                content = f"{context}\n\n{tail}"
+            elif delta.strip():
+                content = f"{_UPDATE_PREFIX}{delta.strip()}\n\n{tail}"
+            else:
+                content = tail
+            base = len(thread.messages)
+            user = {"type": "message", "role": "user", "content": content}
+            messages = [*thread.messages, user]
+
+        def commit(response_text: str) -> None:
+            assistant = {
+                "type": "message",
+                "role": "assistant",
+                "content": response_text,
+            }
+            with self._lock:
+                current = self._threads.get(instructions)
+                if base and (current is not thread or len(thread.messages) != base):
+                    return  # another call advanced the conversation first
+                thread.messages = [*messages, assistant]
+                thread.context = context
+                self._threads[instructions] = thread
+
+        return messages, base // 2 + 1, commit
+
+    def reset(self) -> None:
+        with self._lock:
+            self._threads.clear()
+
+
+def input_chars(value: Any) -> int:
+    """Characters of a request's ``input`` (text or message list)."""
+    if isinstance(value, str):
+        return len(value)
+    return sum(len(m.get("content") or "") for m in value or [])
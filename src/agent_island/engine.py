@@ -1,4 +1,4 @@
-import json
+import asyncio
 import logging
 import os
 import random
@@ -8,10 +8,15 @@ from datetime import datetime
 from functools import partial
 from typing import Callable, List
 
+from .clients import pool_config, prewarm, prewarm_async
+from .game_log import JsonlLogSink, compact_log, load_checkpoint
 from .history import History
-from .phases import PHASE_REGISTRY
-from .player import Player
+from .memory import strategy_from_dict
+from .phases import ASYNC_PHASE_REGISTRY, PHASE_REGISTRY
+from .player import AIPlayer, Player
+from .retry import RetryPolicy
 from .round import Round, RoundContext
+from .timing import new_timings, timing_stats
 
 
 @dataclass
@@ -32,6 +37,17 @@ class GameConfig:
         round_phase_config_overrides: Per-round phase config overrides
         log_prefix: Optional prefix for log filenames (default: "gameplay")
         game_id: Optional game ID for reproducibility
+        client_pool: Connection pool settings for the shared OpenRouter
+            clients of the game's AI players (ClientPoolConfig fields; empty
+            keeps the defaults, see clients.configure_client_pool)
+        prewarm_clients: Open AI players' connections before the first round
+        retry: Retry policy of the AI players (RetryPolicy fields; empty
+            keeps each player's own policy)
+        stream_responses: Stream AI players' pitches and sidebar messages
+            (to ``on_delta`` subscribers, recording time-to-first-token and
+            tokens/sec in the event metadata)
+        prompt_cache_hints: Add provider prompt-caching hints to AI players'
+            requests (see prompts.cache_hints)
     """
 
     num_players: int
@@ -48,6 +64,37 @@ class GameConfig:
     )
     log_prefix: str = field(default="gameplay")
     game_id: str | None = field(default=None)
+    client_pool: dict = field(default_factory=dict)
+    prewarm_clients: bool = field(default=True)
+    retry: dict = field(default_factory=dict)
+    stream_responses: bool = field(default=False)
+    prompt_cache_hints: bool = field(default=False)
+
+
+def prompt_cache_stats(usage: dict) -> dict:
+    """
+    Prompt cache hit rates from the "usage" section of the game stats.
+
+    Args:
+        usage: Token counts overall and per player (see
+            GameEngine._compute_stats)
+
+    Returns:
+        dict with the overall hit rate and hit rates by player (cached input
+        tokens over input tokens; 0.0 without input tokens)
+    """
+
+    def hit_rate(counts: dict) -> float:
+        input_tokens = counts.get("input_tokens", 0)
+        return counts.get("cached_tokens", 0) / input_tokens if input_tokens else 0.0
+
+    return {
+        "hit_rate": hit_rate(usage),
+        "by_player": {
+            player_id: hit_rate(counts)
+            for player_id, counts in usage.get("by_player", {}).items()
+        },
+    }
 
 
 class GameEngine:
@@ -56,6 +103,7 @@ class GameEngine:
         game_config: GameConfig,
         players: list[Player],
         on_event=None,
+        on_delta=None,
     ):
         """
         Initialize the GameEngine
@@ -64,12 +112,37 @@ class GameEngine:
             game_config: GameConfig object
             players: List of fully-constructed Player objects
             on_event: Optional callback fired for each new History event
+            on_delta: Optional callback receiving the text of streamed player
+                responses (EventDelta) before their events are added
         """
         self.game_config = game_config
         self.players = players
         self.logger = logging.getLogger(__name__)
         self._validate_config()
-        self.history = History(on_event=on_event)
+        self.history = History(on_event=on_event, on_delta=on_delta)
+        # Source of all random draws in the game, seeded from the game ID
+        self.rng = random.Random()
+        # Phase and round durations (see timing.new_timings)
+        self.timings = new_timings()
+        self.retry_policy: RetryPolicy | None = None
+        if game_config.retry:
+            self.retry_policy = RetryPolicy(**game_config.retry)
+            for player in players:
+                if isinstance(player, AIPlayer):
+                    player.retry_policy = self.retry_policy
+        # Games with different pool settings use different clients
+        self.client_pool = pool_config(**game_config.client_pool)
+        for player in players:
+            if isinstance(player, AIPlayer):
+                player.client_pool = self.client_pool
+        if game_config.stream_responses:
+            for player in players:
+                if isinstance(player, AIPlayer):
+                    player.stream = True
+        if game_config.prompt_cache_hints:
+            for player in players:
+                if isinstance(player, AIPlayer):
+                    player.prompt_cache_hints = True
 
     def _validate_config(self) -> None:
         """Validate game config against player configs and phase registry."""
@@ -119,7 +192,9 @@ class GameEngine:
                         f"Valid phases: {list(PHASE_REGISTRY.keys())}"
                     )
 
-    def _get_phases_for_round(self, round_index: int) -> List[Callable]:
+    def _get_phases_for_round(
+        self, round_index: int, use_async: bool = False
+    ) -> List[Callable]:
         """
         Get the phase callables for a given round.
 
@@ -130,13 +205,12 @@ class GameEngine:
 
         Args:
             round_index: 1-indexed round number
+            use_async: Prefer async variants from ASYNC_PHASE_REGISTRY
 
         Returns:
             List of phase callables
         """
-        phase_names = self.game_config.round_phase_overrides.get(
-            round_index, self.game_config.phases
-        )
+        phase_names = self._get_phase_names(round_index)
 
         # Merge game-level and round-level phase config
         round_pc = self.game_config.round_phase_config_overrides.get(round_index, {})
@@ -145,11 +219,19 @@ class GameEngine:
         phases: List[Callable] = []
         for name in phase_names:
             fn = PHASE_REGISTRY[name]
+            if use_async:
+                fn = ASYNC_PHASE_REGISTRY.get(name, fn)
             if name in merged_pc:
                 fn = partial(fn, **merged_pc[name])
             phases.append(fn)
         return phases
 
+    def _get_phase_names(self, round_index: int) -> List[str]:
+        """Get the phase names of a given round (override or default)."""
+        return self.game_config.round_phase_overrides.get(
+            round_index, self.game_config.phases
+        )
+
     def _get_round_type(self, round_index: int) -> str:
         """Get the round type for a given round (override or default)."""
         return self.game_config.round_type_overrides.get(
@@ -195,6 +277,8 @@ class GameEngine:
             logger=self.logger,
             history=self.history,
             rules_prompt=self.game_config.rules_prompt,
+            rng=self.rng,
+            timings=self.timings,
         )
 
     def play(self) -> str | None:
@@ -207,12 +291,175 @@ class GameEngine:
         Returns:
             str | None: Path to the written log file, or None if logging is disabled
         """
+        game_id, timestamp, active_player_ids = self._start_game()
+        return self._play_rounds(game_id, timestamp, active_player_ids)
+
+    async def play_async(self) -> str | None:
+        """
+        Play the game on the running event loop.
+
+        Phases are awaited using their async variants, so AI players make
+        non-blocking requests and many games can share one event loop. The
+        resulting history and log are the same as for :meth:`play`.
+
+        Args:
+            None
+
+        Returns:
+            str | None: Path to the written log file, or None if logging is disabled
+        """
+        game_id, timestamp, active_player_ids = self._start_game()
+        return await self._play_rounds_async(game_id, timestamp, active_player_ids)
+
+    def resume(self, log_path: str) -> str | None:
+        """
+        Resume a failed or killed game from its streamed log.
+
+        The history, active players, memory strategy state and RNG state are
+        restored from the last checkpoint in the log (written after every
+        completed phase), and play continues with the first phase that did not
+        complete. Work after the checkpoint is discarded from the log and
+        redone, so only the LLM calls of the interrupted phase are repeated.
+
+        The engine must be fresh (not played yet) and built with the same
+        game config and players as the original game. Restored events are
+        not passed to ``on_event``.
+
+        Args:
+            log_path: The game's JSONL log, or its JSON log (the JSONL log
+                next to it is used)
+
+        Returns:
+            str | None: Path to the written log file
+        """
+        game_id, timestamp, active_player_ids, checkpoint = self._restore_game(log_path)
+        return self._play_rounds(game_id, timestamp, active_player_ids, checkpoint)
+
+    async def resume_async(self, log_path: str) -> str | None:
+        """
+        Resume a failed or killed game on the running event loop.
+
+        See :meth:`resume`.
+
+        Args:
+            log_path: The game's JSONL log, or its JSON log
+
+        Returns:
+            str | None: Path to the written log file
+        """
+        game_id, timestamp, active_player_ids, checkpoint = self._restore_game(log_path)
+        return await self._play_rounds_async(
+            game_id, timestamp, active_player_ids, checkpoint
+        )
+
+    def _play_rounds(
+        self,
+        game_id: str,
+        timestamp: str,
+        active_player_ids: List[str],
+        checkpoint: dict | None = None,
+    ) -> str | None:
+        """
+        Play the remaining rounds and write the log.
+
+        Args:
+            game_id: The game ID
+            timestamp: The game timestamp
+            active_player_ids: Active players of the first round to play
+            checkpoint: Checkpoint to resume from (None for a new game)
+
+        Returns:
+            str | None: Path to the written log file, or None if logging is disabled
+        """
+        first_round = checkpoint["round_index"] if checkpoint else 1
+        try:
+            for client, connections in self._clients_to_prewarm():
+                prewarm(client, connections)
+            for round_index in range(first_round, self.game_config.num_rounds + 1):
+                round, round_context = self._create_round(
+                    round_index, active_player_ids
+                )
+                start_phase = self._resume_round(round_context, checkpoint)
+                round.play(start_phase=start_phase)
+                active_player_ids = self._finish_round(round_context)
+
+        except Exception as exc:
+            self.logger.error("Game %s failed: %s", game_id, exc)
+            self._write_log(game_id, timestamp, status="failed", error=str(exc))
+            raise
+
+        log_path = self._write_log(game_id, timestamp, status="completed", error=None)
+        return log_path
+
+    async def _play_rounds_async(
+        self,
+        game_id: str,
+        timestamp: str,
+        active_player_ids: List[str],
+        checkpoint: dict | None = None,
+    ) -> str | None:
+        """Async variant of :meth:`_play_rounds`."""
+        first_round = checkpoint["round_index"] if checkpoint else 1
+        try:
+            await asyncio.gather(
+                *(
+                    prewarm_async(client, connections)
+                    for client, connections in self._clients_to_prewarm()
+                )
+            )
+            for round_index in range(first_round, self.game_config.num_rounds + 1):
+                round, round_context = self._create_round(
+                    round_index, active_player_ids, use_async=True
+                )
+                start_phase = self._resume_round(round_context, checkpoint)
+                await round.play_async(start_phase=start_phase)
+                active_player_ids = self._finish_round(round_context)
+
+        except Exception as exc:
+            self.logger.error("Game %s failed: %s", game_id, exc)
+            self._write_log(game_id, timestamp, status="failed", error=str(exc))
+            raise
+
+        log_path = self._write_log(game_id, timestamp, status="completed", error=None)
+        return log_path
+
+    def _clients_to_prewarm(self) -> List[tuple]:
+        """
+        List the clients to pre-warm.
+
+        Returns:
+            List of (client, connections) with one connection per AI player
+            using the client, capped at the pool's keep-alive limit
+        """
+        if not self.game_config.prewarm_clients:
+            return []
+
+        counts: dict[int, list] = {}
+        for player in self.players:
+            if not isinstance(player, AIPlayer):
+                continue
+            if player.cassette and player.cassette.mode == "replay":
+                continue
+            entry = counts.setdefault(id(player.client), [player.client, 0])
+            entry[1] += 1
+        return [
+            (client, min(count, self.client_pool.max_keepalive_connections))
+            for client, count in counts.values()
+        ]
+
+    def _start_game(self) -> tuple[str, str, List[str]]:
+        """
+        Resolve the game ID, seed random draws and register the players.
+
+        Returns:
+            tuple: (game_id, timestamp, active_player_ids)
+        """
         # Resolve game ID (use provided value for reproduction, else generate fresh)
         game_id = self.game_config.game_id or str(uuid.uuid4())
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         # Seed random draws from the game ID for partial reproducibility
-        random.seed(game_id)
+        self.rng.seed(game_id)
 
         # Log start of game
         self.logger.info(f"Starting game {game_id} ({timestamp})")
@@ -223,52 +470,200 @@ class GameEngine:
         active_player_ids = [player.config.player_id for player in self.players]
         self.history.player_ids = active_player_ids
 
-        num_rounds = self.game_config.num_rounds
+        # Stream the log as the game runs so a crash loses at most one round
+        if self.game_config.logs_dir is not None:
+            os.makedirs(self.game_config.logs_dir, exist_ok=True)
+            sink = JsonlLogSink(
+                self._log_path(game_id, ".jsonl"), self.history.segments
+            )
+            sink.write_header(
+                self._game_header(game_id, timestamp), self._players_log()
+            )
+            self.history.sink = sink
 
-        try:
-            for round_index in range(1, num_rounds + 1):
-                final_round = round_index == num_rounds
+        return game_id, timestamp, active_player_ids
 
-                self.logger.info(f"Round {round_index}")
+    def _restore_game(self, log_path: str) -> tuple[str, str, List[str], dict | None]:
+        """
+        Restore the game state from the last checkpoint of a streamed log.
 
-                # Resolve phases for this round (override or default)
-                phases = self._get_phases_for_round(round_index)
+        Args:
+            log_path: The game's JSONL log, or its JSON log
 
-                # Create round context and play
-                round_context = self._create_round_context(
-                    round_index=round_index,
-                    final_round=final_round,
-                    players=self.players,
-                    active_player_ids=active_player_ids,
-                )
-                round = Round(
-                    context=round_context,
-                    phases=phases,
+        Returns:
+            tuple: (game_id, timestamp, active_player_ids, checkpoint), where
+            checkpoint is None if the game must restart from round 1
+        """
+        jsonl_path = os.path.splitext(log_path)[0] + ".jsonl"
+        if not os.path.exists(jsonl_path):
+            raise FileNotFoundError(
+                f"No streamed log at {jsonl_path} (it is removed once a game completes)"
+            )
+        if self.history.rounds:
+            raise RuntimeError("resume() requires an engine that has not played")
+
+        checkpoint = load_checkpoint(jsonl_path, self.history.segments)
+
+        player_ids = [player.config.player_id for player in self.players]
+        if list(checkpoint.players) != player_ids:
+            raise ValueError(
+                f"Players {player_ids} do not match the logged players "
+                f"{list(checkpoint.players)}"
+            )
+        if checkpoint.game["num_rounds"] != self.game_config.num_rounds:
+            raise ValueError(
+                f"num_rounds ({self.game_config.num_rounds}) does not match "
+                f"the logged game ({checkpoint.game['num_rounds']})"
+            )
+
+        # Discard records of unfinished work after the checkpoint
+        with open(jsonl_path, "r+b") as f:
+            f.truncate(checkpoint.offset)
+
+        game_id = checkpoint.game["id"]
+        timestamp = checkpoint.game["timestamp"]
+        state = checkpoint.state
+        self.logger.info(
+            f"Resuming game {game_id} ({timestamp}) from "
+            + (
+                f"round {state['round_index']}, "
+                f"after {state['phases_completed']} phase(s)"
+                if state
+                else "the start"
+            )
+        )
+
+        for round_log in checkpoint.rounds.values():
+            self.history.load_round(round_log)
+
+        if state is None:
+            self.rng.seed(game_id)
+            active_player_ids = player_ids
+            self.history.player_ids = active_player_ids
+        else:
+            version, internal, gauss_next = state["rng_state"]
+            self.rng.setstate((version, tuple(internal), gauss_next))
+            # Checkpoints written before timing records existed have none
+            self.timings.update(state.get("timings", {}))
+            for player in self.players:
+                player.memory = strategy_from_dict(
+                    state["memory"][player.config.player_id]
                 )
-                round.play()
+            # Lists are shared with the restored rounds, as in a fresh game
+            active_player_ids = self.history.rounds[
+                state["round_index"]
+            ].active_player_ids
+            self.history.player_ids = self.history.rounds[1].active_player_ids
 
-                if round_context.votes:
-                    self.logger.debug(
-                        f"Vote tally: {round_context.votes.get('vote_tally')}"
-                    )
-                    self.logger.debug(
-                        f"Selected player: {round_context.votes.get('selected_player')}"
-                    )
+        sink = JsonlLogSink(jsonl_path, self.history.segments, append=True)
+        sink.restore(self.history)
+        self.history.sink = sink
 
-                # Sync active player IDs from the round context
-                # (the elimination phase may have modified it)
-                active_player_ids = list(round_context.active_player_ids)
-                self.logger.debug(f"Next round players: {active_player_ids}")
+        return game_id, timestamp, active_player_ids, state
 
-        except Exception as exc:
-            self.logger.error("Game %s failed: %s", game_id, exc)
-            log_path = self._write_log(
-                game_id, timestamp, status="failed", error=str(exc)
+    def _create_round(
+        self,
+        round_index: int,
+        active_player_ids: List[str],
+        use_async: bool = False,
+    ) -> tuple[Round, RoundContext]:
+        """
+        Create the Round (and its context) for a given round index.
+
+        Args:
+            round_index: 1-indexed round number
+            active_player_ids: Players still in the game
+            use_async: Use async phase variants
+
+        Returns:
+            tuple: (round, round_context)
+        """
+        final_round = round_index == self.game_config.num_rounds
+
+        self.logger.info(f"Round {round_index}")
+
+        # Resolve phases for this round (override or default)
+        phases = self._get_phases_for_round(round_index, use_async=use_async)
+
+        round_context = self._create_round_context(
+            round_index=round_index,
+            final_round=final_round,
+            players=self.players,
+            active_player_ids=active_player_ids,
+        )
+        round = Round(
+            context=round_context,
+            phases=phases,
+            on_phase_complete=partial(self._checkpoint, round_context),
+            phase_deadline_s=(
+                self.retry_policy.phase_deadline_s if self.retry_policy else None
+            ),
+            phase_names=self._get_phase_names(round_index),
+        )
+        return round, round_context
+
+    def _resume_round(
+        self, round_context: RoundContext, checkpoint: dict | None
+    ) -> int:
+        """
+        Restore the in-round state of a resumed round.
+
+        Args:
+            round_context: The context of the round about to be played
+            checkpoint: Checkpoint the game was resumed from (if any)
+
+        Returns:
+            Index of the first phase to play
+        """
+        if not checkpoint or checkpoint["round_index"] != round_context.round_index:
+            return 0
+        round_log = self.history.rounds[round_context.round_index]
+        round_context.eliminated_player_ids = round_log.eliminated_player_ids
+        round_context.votes = checkpoint["votes"]
+        return checkpoint["phases_completed"]
+
+    def _checkpoint(self, round_context: RoundContext, phases_completed: int) -> None:
+        """Record the state needed to resume after a completed phase."""
+        if self.history.sink is None:
+            return
+        self.history.sink.write_checkpoint(
+            {
+                "round_index": round_context.round_index,
+                "phases_completed": phases_completed,
+                "active_player_ids": round_context.active_player_ids,
+                "eliminated_player_ids": round_context.eliminated_player_ids,
+                "votes": round_context.votes,
+                "rng_state": self.rng.getstate(),
+                "memory": {
+                    player.config.player_id: player.memory.to_dict()
+                    for player in self.players
+                },
+                "timings": self.timings,
+            }
+        )
+
+    def _finish_round(self, round_context: RoundContext) -> List[str]:
+        """
+        Log the round outcome and return the active players for the next round.
+
+        Args:
+            round_context: The context of the round that just finished
+
+        Returns:
+            List of active player IDs for the next round
+        """
+        if round_context.votes:
+            self.logger.debug(f"Vote tally: {round_context.votes.get('vote_tally')}")
+            self.logger.debug(
+                f"Selected player: {round_context.votes.get('selected_player')}"
             )
-            raise
 
-        log_path = self._write_log(game_id, timestamp, status="completed", error=None)
-        return log_path
+        # Sync active player IDs from the round context
+        # (the elimination phase may have modified it)
+        active_player_ids = list(round_context.active_player_ids)
+        self.history.end_round(round_context.round_index)
+        self.logger.debug(f"Next round players: {active_player_ids}")
+        return active_player_ids
 
     def _compute_stats(self) -> dict:
         """
@@ -279,12 +674,19 @@ class GameEngine:
           - reasoning_extraction_failures: non-narrator AI player events with
             reasoning=None
           - responses: number of non-narrator model responses per player
+            (calls shared by several players, with role "shared", are
+            counted under "shared")
           - cost: sum of metadata["cost"] per player
           - usage: token counts and cost_retrieval_failures per player
+          - prompt_cache: share of input tokens served from the provider's
+            prompt cache, overall and per player
+          - timing: game, round and phase durations, and model call latency
+            (metadata["latency_s"], "queue_s", "retry_s") and bytes
+            transferred by model and by phase (see timing.timing_stats)
 
         Returns:
             dict with choice_parse_failures, reasoning_extraction_failures,
-            responses, cost, usage
+            responses, cost, usage, prompt_cache, timing
         """
         vpf_by_player: dict[str, int] = {}
         ref_by_player: dict[str, int] = {}
@@ -324,6 +726,8 @@ class GameEngine:
                         "completion_tokens": 0,
                         "reasoning_tokens": 0,
                         "total_tokens": 0,
+                        "cached_tokens": 0,
+                        "cache_write_tokens": 0,
                         "cost_retrieval_failures": 0,
                     },
                 )
@@ -331,12 +735,25 @@ class GameEngine:
                 pu["completion_tokens"] += meta.get("completion_tokens", 0)
                 pu["reasoning_tokens"] += meta.get("reasoning_tokens", 0)
                 pu["total_tokens"] += meta.get("total_tokens", 0)
+                pu["cached_tokens"] += meta.get("cached_tokens", 0)
+                pu["cache_write_tokens"] += meta.get("cache_write_tokens", 0)
                 if meta.get("cost_retrieval_failed"):
                     pu["cost_retrieval_failures"] += 1
 
         def _sum(key: str) -> int:
             return sum(p.get(key, 0) for p in usage_by_player.values())
 
+        usage = {
+            "by_player": usage_by_player,
+            "input_tokens": _sum("input_tokens"),
+            "completion_tokens": _sum("completion_tokens"),
+            "reasoning_tokens": _sum("reasoning_tokens"),
+            "total_tokens": _sum("total_tokens"),
+            "cached_tokens": _sum("cached_tokens"),
+            "cache_write_tokens": _sum("cache_write_tokens"),
+            "cost_retrieval_failures": _sum("cost_retrieval_failures"),
+        }
+
         return {
             "choice_parse_failures": {
                 "total": sum(vpf_by_player.values()),
@@ -354,14 +771,52 @@ class GameEngine:
                 "total": sum(cost_by_player.values()),
                 "by_player": cost_by_player,
             },
-            "usage": {
-                "by_player": usage_by_player,
-                "input_tokens": _sum("input_tokens"),
-                "completion_tokens": _sum("completion_tokens"),
-                "reasoning_tokens": _sum("reasoning_tokens"),
-                "total_tokens": _sum("total_tokens"),
-                "cost_retrieval_failures": _sum("cost_retrieval_failures"),
+            "usage": usage,
+            "prompt_cache": prompt_cache_stats(usage),
+            "timing": timing_stats(
+                self.history.rounds,
+                self.timings,
+                {p.config.player_id: p.config.model for p in self.players},
+            ),
+        }
+
+    def _log_path(self, game_id: str, suffix: str) -> str:
+        return os.path.join(
+            self.game_config.logs_dir,
+            f"{self.game_config.log_prefix}_{game_id}{suffix}",
+        )
+
+    def _game_header(self, game_id: str, timestamp: str) -> dict:
+        """The "game" section of the log (without status and error)."""
+        return {
+            "id": game_id,
+            "timestamp": timestamp,
+            "num_players": self.game_config.num_players,
+            "num_rounds": self.game_config.num_rounds,
+            "log_prefix": self.game_config.log_prefix,
+            "phases": self.game_config.phases,
+            "round_phase_overrides": {
+                str(k): v for k, v in self.game_config.round_phase_overrides.items()
+            },
+            "round_type": self.game_config.round_type,
+            "round_type_overrides": {
+                str(k): v for k, v in self.game_config.round_type_overrides.items()
             },
+            "phase_config": self.game_config.phase_config,
+            "round_phase_config_overrides": {
+                str(k): v
+                for k, v in (self.game_config.round_phase_config_overrides.items())
+            },
+            "rules_prompt": self.game_config.rules_prompt,
+        }
+
+    def _players_log(self) -> dict:
+        """The "players" section of the log (player configs without API keys)."""
+        return {
+            p.config.player_id: {
+                k: v for k, v in asdict(p.config).items() if k != "api_key"
+            }
+            for p in self.players
         }
 
     def _write_log(
@@ -371,53 +826,25 @@ class GameEngine:
         status: str,
         error: str | None,
     ) -> str | None:
-        if self.game_config.logs_dir is None:
+        """
+        Finish the streamed JSONL log and compact it into the JSON log.
+
+        The JSONL file is removed for completed games and kept otherwise, as
+        a record of everything that happened before the failure.
+        """
+        sink = self.history.sink
+        if sink is None:
             return None
 
-        os.makedirs(self.game_config.logs_dir, exist_ok=True)
+        if status != "completed" and self.history.rounds:
+            # Record the state of the interrupted round
+            self.history.end_round(max(self.history.rounds))
+        sink.write_end(status, error, self._compute_stats())
+        sink.close()
+        self.history.sink = None
 
-        output_path = os.path.join(
-            self.game_config.logs_dir,
-            f"{self.game_config.log_prefix}_{game_id}.json",
-        )
-        with open(output_path, "w", encoding="utf-8") as f:
-            output = {
-                "game": {
-                    "id": game_id,
-                    "timestamp": timestamp,
-                    "num_players": self.game_config.num_players,
-                    "num_rounds": self.game_config.num_rounds,
-                    "log_prefix": self.game_config.log_prefix,
-                    "phases": self.game_config.phases,
-                    "round_phase_overrides": {
-                        str(k): v
-                        for k, v in self.game_config.round_phase_overrides.items()
-                    },
-                    "round_type": self.game_config.round_type,
-                    "round_type_overrides": {
-                        str(k): v
-                        for k, v in self.game_config.round_type_overrides.items()
-                    },
-                    "phase_config": self.game_config.phase_config,
-                    "round_phase_config_overrides": {
-                        str(k): v
-                        for k, v in (
-                            self.game_config.round_phase_config_overrides.items()
-                        )
-                    },
-                    "rules_prompt": self.game_config.rules_prompt,
-                    "status": status,
-                    "error": error,
-                },
-                "players": {
-                    p.config.player_id: {
-                        k: v for k, v in asdict(p.config).items() if k != "api_key"
-                    }
-                    for p in self.players
-                },
-                "stats": self._compute_stats(),
-                "history": self.history.to_dict(),
-            }
-            json.dump(output, f, indent=2)
+        output_path = compact_log(sink.path)
+        if status == "completed":
+            os.remove(sink.path)
         self.logger.info("Wrote game history to %s", output_path)
         return output_path
@@ -0,0 +1,453 @@
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, TextIO
+
+from .history import Event, History, RoundLog, SegmentStore
+
+
+class JsonlLogSink:
+    """
+    Streams a game log to disk as JSON Lines while the game runs.
+
+    Each line is one record with a ``type`` key:
+
+    - ``game``: game header and player configs (written once at start)
+    - ``round``: a round has started
+    - ``segment``: a prompt segment, written before the first event after it
+      was added to the store
+    - ``event``: one History event, tagged with its ``round_index``
+    - ``hide``: a player was removed from the active visibility of earlier
+      events, given as ``[round_index, position in round]`` pairs
+    - ``round_result``: vote tally, selected player and final player lists of
+      a completed round
+    - ``checkpoint``: engine state after a completed phase (see
+      :meth:`write_checkpoint`), from which a game can be resumed
+    - ``end``: final status, error and stats
+
+    Records are flushed as they are written, so a killed process keeps every
+    completed record, and the file is fsynced at round boundaries, so a
+    machine crash loses at most the round in progress. Use
+    :func:`compact_log` to turn the stream into the single-JSON log format.
+    """
+
+    def __init__(self, path: str, segments: SegmentStore, append: bool = False) -> None:
+        self.path = path
+        self._segments = segments
+        self._segments_written = 0
+        # (round_index, position in round) of written events, keyed by id()
+        self._positions: Dict[int, tuple[int, int]] = {}
+        self._round_sizes: Dict[int, int] = {}
+        self._file: TextIO = open(path, "a" if append else "w", encoding="utf-8")
+
+    def write_header(self, game: Dict[str, Any], players: Dict[str, Any]) -> None:
+        self._write({"type": "game", "game": game, "players": players})
+        self._sync()
+
+    def write_round_start(self, round_log: RoundLog) -> None:
+        self._round_sizes[round_log.round_index] = 0
+        self._write(
+            {
+                "type": "round",
+                "round_index": round_log.round_index,
+                "final_round": round_log.final_round,
+                "active_player_ids": round_log.active_player_ids,
+                "eliminated_player_ids": round_log.eliminated_player_ids,
+            }
+        )
+
+    def write_event(self, round_index: int, event: Event) -> None:
+        self._write_new_segments()
+        position = self._round_sizes.get(round_index, 0)
+        self._round_sizes[round_index] = position + 1
+        self._positions[id(event)] = (round_index, position)
+        self._write({"type": "event", "round_index": round_index, **event.to_dict()})
+
+    def write_hide(self, player_id: str, events: Iterable[Event]) -> None:
+        positions = [list(self._positions[id(event)]) for event in events]
+        self._write({"type": "hide", "player_id": player_id, "events": positions})
+
+    def write_round_end(self, round_log: RoundLog) -> None:
+        self._write_new_segments()
+        self._write(
+            {
+                "type": "round_result",
+                "round_index": round_log.round_index,
+                "active_player_ids": round_log.active_player_ids,
+                "eliminated_player_ids": round_log.eliminated_player_ids,
+                "vote_tally": round_log.vote_tally,
+                "selected_player": round_log.selected_player,
+            }
+        )
+        self._sync()
+
+    def write_checkpoint(self, state: Dict[str, Any]) -> None:
+        """
+        Record the state needed to resume the game after a completed phase.
+
+        Args:
+            state: JSON-serializable engine state; must include
+                ``round_index`` and ``phases_completed``
+
+        Returns:
+            None
+        """
+        self._write_new_segments()
+        self._write({"type": "checkpoint", **state})
+        self._file.flush()
+
+    def restore(self, history: History) -> None:
+        """
+        Pick up the bookkeeping for a history restored from this log.
+
+        Call after reopening the log with ``append=True`` and loading its
+        rounds into ``history``.
+        """
+        self._segments_written = len(self._segments)
+        for round_index, round_log in history.rounds.items():
+            self._round_sizes[round_index] = len(round_log.events)
+            for position, event in enumerate(round_log.events):
+                self._positions[id(event)] = (round_index, position)
+
+    def write_end(self, status: str, error: str | None, stats: Dict[str, Any]) -> None:
+        self._write_new_segments()
+        self._write({"type": "end", "status": status, "error": error, "stats": stats})
+        self._sync()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def _write_new_segments(self) -> None:
+        """Write the segments added to the store since the last call."""
+        for segment_id, value in self._segments.items_since(self._segments_written):
+            self._write({"type": "segment", "id": segment_id, "value": value})
+            self._segments_written += 1
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+
+def read_log_records(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the records of a JSONL game log.
+
+    A truncated final line (from a killed process) is ignored.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            yield json.loads(line)
+
+
+@dataclass
+class LogCheckpoint:
+    """
+    A streamed game log read up to its last checkpoint.
+
+    Args:
+        game: The game header
+        players: The logged player configs
+        rounds: Rounds with their events as of the checkpoint (in-progress
+            round included, with player lists from the checkpoint)
+        state: The checkpoint record (None if no phase completed)
+        offset: Byte offset just past the checkpoint; later records belong
+            to unfinished work and are discarded on resume
+    """
+
+    game: Dict[str, Any]
+    players: Dict[str, Any]
+    rounds: Dict[int, RoundLog] = field(default_factory=dict)
+    state: Dict[str, Any] | None = None
+    offset: int = 0
+
+
+def load_checkpoint(jsonl_path: str, segments: SegmentStore) -> LogCheckpoint:
+    """
+    Read a JSONL game log up to its last checkpoint.
+
+    Segments up to the checkpoint are added to ``segments``, which the
+    restored events reference.
+
+    Args:
+        jsonl_path: Path to the JSONL log
+        segments: Store to load the prompt segments into
+
+    Returns:
+        The LogCheckpoint
+    """
+    # Find the last checkpoint (or the header if no phase completed)
+    checkpoint_offset = None
+    offset = 0
+    with open(jsonl_path, "rb") as f:
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break
+            offset += len(raw)
+            if raw.startswith(b'{"type": "checkpoint"') or raw.startswith(
+                b'{"type": "game"'
+            ):
+                checkpoint_offset = offset
+    if checkpoint_offset is None:
+        raise ValueError(f"{jsonl_path} has no game header")
+
+    checkpoint: LogCheckpoint | None = None
+    position = 0
+    with open(jsonl_path, "rb") as f:
+        for raw in f:
+            if position >= checkpoint_offset:
+                break
+            position += len(raw)
+            record = json.loads(raw)
+            kind = record["type"]
+            if kind == "game":
+                checkpoint = LogCheckpoint(
+                    game=record["game"], players=record["players"]
+                )
+                continue
+            assert checkpoint is not None
+            rounds = checkpoint.rounds
+            if kind == "segment":
+                segments.add(record["id"], record["value"])
+            elif kind == "round":
+                rounds[record["round_index"]] = RoundLog(
+                    round_index=record["round_index"],
+                    final_round=record["final_round"],
+                    active_player_ids=record["active_player_ids"],
+                    eliminated_player_ids=record["eliminated_player_ids"],
+                )
+            elif kind == "event":
+                rounds[record["round_index"]].events.append(
+                    Event.from_dict(record, segments)
+                )
+            elif kind == "hide":
+                for round_index, event_position in record["events"]:
+                    event = rounds[round_index].events[event_position]
+                    event.active_visibility = event.active_visibility - {
+                        record["player_id"]
+                    }
+            elif kind in ("round_result", "checkpoint"):
+                round_log = rounds[record["round_index"]]
+                round_log.active_player_ids = record["active_player_ids"]
+                round_log.eliminated_player_ids = record["eliminated_player_ids"]
+                if kind == "round_result":
+                    round_log.vote_tally = record["vote_tally"]
+                    round_log.selected_player = record["selected_player"]
+                else:
+                    # Set by the votes phase of the in-progress round
+                    round_log.vote_tally = record["votes"].get("vote_tally")
+                    round_log.selected_player = record["votes"].get("selected_player")
+                    checkpoint.state = record
+
+    assert checkpoint is not None
+    checkpoint.offset = checkpoint_offset
+    return checkpoint
+
+
+def compact_log(jsonl_path: str, json_path: str | None = None) -> str:
+    """
+    Convert a JSONL game log into the single-JSON log format.
+
+    The output is identical to what ``json.dump(log, f, indent=2)`` of the
+    in-memory log would produce, but it is written incrementally: only round
+    metadata and hidden-event markers are held in memory while segments and
+    events are streamed from the JSONL file. Logs without an ``end`` record
+    (killed games) get ``status = "incomplete"`` and empty stats.
+
+    Args:
+        jsonl_path: Path to the JSONL log
+        json_path: Output path (default: ``jsonl_path`` with a .json suffix)
+
+    Returns:
+        The path of the written JSON log
+    """
+    if json_path is None:
+        json_path = os.path.splitext(jsonl_path)[0] + ".json"
+
+    # Pass 1: header, end record, per-round metadata and hidden events
+    game: Dict[str, Any] = {}
+    players: Dict[str, Any] = {}
+    end: Dict[str, Any] = {"status": "incomplete", "error": None, "stats": {}}
+    rounds: Dict[int, Dict[str, Any]] = {}
+    # Line of the latest "round" record per round: events before it belong to
+    # a restarted (discarded) attempt at the round
+    round_starts: Dict[int, int] = {}
+    hidden: Dict[tuple[int, int], set[str]] = {}
+    # Runs of consecutive events of one round, as (round_index, first line)
+    runs: list[tuple[int, int]] = []
+    run_round: int | None = None
+    for line, record in enumerate(read_log_records(jsonl_path)):
+        kind = record["type"]
+        if kind == "event":
+            if record["round_index"] != run_round:
+                run_round = record["round_index"]
+                runs.append((run_round, line))
+        elif kind == "hide":
+            for round_index, position in record["events"]:
+                hidden.setdefault((round_index, position), set()).add(
+                    record["player_id"]
+                )
+        elif kind == "game":
+            game, players = record["game"], record["players"]
+        elif kind == "round":
+            round_index = record["round_index"]
+            run_round = None
+            round_starts[round_index] = line
+            hidden = {k: v for k, v in hidden.items() if k[0] != round_index}
+            rounds[round_index] = {
+                "round_index": round_index,
+                "final_round": record["final_round"],
+                "active_player_ids": record["active_player_ids"],
+                "eliminated_player_ids": record["eliminated_player_ids"],
+                "vote_tally": None,
+                "selected_player": None,
+            }
+        elif kind == "round_result":
+            round_meta = rounds[record["round_index"]]
+            for key in (
+                "active_player_ids",
+                "eliminated_player_ids",
+                "vote_tally",
+                "selected_player",
+            ):
+                round_meta[key] = record[key]
+        elif kind == "end":
+            end = record
+
+    # Events are normally grouped by round in round order, which lets pass 3
+    # read them in a single pass
+    kept_runs = [r for r, line in runs if line > round_starts[r]]
+    grouped = kept_runs == [r for r in rounds if r in kept_runs]
+
+    header = {**game, "status": end["status"], "error": end["error"]}
+
+    with open(json_path, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        f.write(f'  "game": {_dumps_at(header, 1)},\n')
+        f.write(f'  "players": {_dumps_at(players, 1)},\n')
+        f.write(f'  "stats": {_dumps_at(end["stats"], 1)},\n')
+
+        # Pass 2: prompt segment table
+        segments = (
+            (r["id"], r["value"])
+            for r in read_log_records(jsonl_path)
+            if r["type"] == "segment"
+        )
+        f.write('  "prompt_segments": ')
+        _write_streamed_object(f, segments, level=1)
+        f.write(",\n")
+
+        # Pass 3: rounds and their events
+        cursor = _EventCursor(_kept_events(jsonl_path, round_starts))
+        items = []
+        for round_index, round_meta in rounds.items():
+            if not grouped:
+                only = _kept_events(jsonl_path, round_starts, round_index)
+                cursor = _EventCursor(only)
+            events = _apply_hidden(cursor.take(round_index), round_index, hidden)
+            items.append((str(round_index), (round_meta, events)))
+        f.write('  "history": ')
+        _write_streamed_object(
+            f,
+            ((key, _render_round(*value)) for key, value in items),
+            level=1,
+            raw_values=True,
+        )
+        f.write("\n}")
+
+    return json_path
+
+
+def _kept_events(
+    jsonl_path: str, round_starts: Dict[int, int], only: int | None = None
+) -> Iterator[Dict[str, Any]]:
+    """Event records, skipping those of restarted round attempts."""
+    for line, record in enumerate(read_log_records(jsonl_path)):
+        if record["type"] != "event":
+            continue
+        round_index = record["round_index"]
+        if line < round_starts[round_index]:
+            continue
+        if only is None or round_index == only:
+            yield record
+
+
+class _EventCursor:
+    """Reads consecutive runs of one round's events from an event stream."""
+
+    def __init__(self, records: Iterator[Dict[str, Any]]) -> None:
+        self._records = records
+        self._pending: Dict[str, Any] | None = None
+
+    def take(self, round_index: int) -> Iterator[Dict[str, Any]]:
+        while True:
+            record = self._pending or next(self._records, None)
+            self._pending = None
+            if record is None:
+                return
+            if record["round_index"] != round_index:
+                self._pending = record
+                return
+            yield record
+
+
+def _apply_hidden(
+    records: Iterator[Dict[str, Any]],
+    round_index: int,
+    hidden: Dict[tuple[int, int], set[str]],
+) -> Iterator[Dict[str, Any]]:
+    """Turn event records into event dicts with hide records applied."""
+    for position, record in enumerate(records):
+        event = {k: v for k, v in record.items() if k not in ("type", "round_index")}
+        gone = hidden.get((round_index, position))
+        if gone:
+            event["active_visibility"] = [
+                pid for pid in event["active_visibility"] if pid not in gone
+            ]
+        yield event
+
+
+def _render_round(round_meta: Dict[str, Any], events: Iterator[Any]) -> str:
+    """Render a round as json.dumps(indent=2) would inside "history"."""
+    lines = ["{"]
+    for key, value in round_meta.items():
+        lines.append(f"      {json.dumps(key)}: {_dumps_at(value, 3)},")
+    return (
+        "\n".join(lines) + '\n      "events": ' + _dumps_list_at(events, 3) + "\n    }"
+    )
+
+
+def _dumps_at(value: Any, level: int) -> str:
+    """json.dumps(value, indent=2) as it appears nested ``level`` deep."""
+    return json.dumps(value, indent=2).replace("\n", "\n" + "  " * level)
+
+
+def _dumps_list_at(items: Iterator[Any], level: int) -> str:
+    """Render a streamed list as json.dumps(indent=2) would at ``level``."""
+    pad = "  " * (level + 1)
+    rendered = [f"{pad}{_dumps_at(item, level + 1)}" for item in items]
+    if not rendered:
+        return "[]"
+    return "[\n" + ",\n".join(rendered) + "\n" + "  " * level + "]"
+
+
+def _write_streamed_object(
+    f: TextIO,
+    items: Iterator[tuple[str, Any]],
+    level: int,
+    raw_values: bool = False,
+) -> None:
+    """Write a streamed mapping as json.dump(indent=2) would at ``level``."""
+    pad = "  " * (level + 1)
+    first = True
+    for key, value in items:
+        rendered = value if raw_values else _dumps_at(value, level + 1)
+        f.write(("{\n" if first else ",\n") + f"{pad}{json.dumps(key)}: {rendered}")
+        first = False
+    f.write("{}" if first else "\n" + "  " * level + "}")
@@ -1,6 +1,134 @@
+import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Sequence,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from .game_log import JsonlLogSink
+
+_RENDER_PREFIX = (
+    "The following are the game events currently visible to you:\n<game_history>"
+)
+_RENDER_SUFFIX = "\n</game_history>"
+
+
+@dataclass(frozen=True)
+class SegmentRef:
+    """A prompt piece that is already interned in a SegmentStore."""
+
+    segment_id: str
+
+
+class SegmentStore:
+    """
+    Content-addressed store of prompt segments.
+
+    Prompts share most of their text (rules, character prompts, the rendered
+    history), so events store their prompt as a list of segment IDs and each
+    distinct segment is kept once. A segment is either text or a composite: a
+    list of segment IDs whose texts are concatenated. Composites let a
+    rendered history be stored as the previous snapshot plus a delta. IDs are
+    derived from the content, so the same game always produces the same table.
+    """
+
+    def __init__(self) -> None:
+        self._by_id: Dict[str, str | Tuple[str, ...]] = {}
+        # Keyed by text: str hashes are cached on the object, so re-interning
+        # the same string (e.g. a memory rendering) skips the digest
+        self._by_text: Dict[str, str] = {}
+        # IDs in insertion order, for streaming new segments to a log
+        self._order: List[str] = []
+
+    def intern(self, text: str) -> str:
+        """Store a text segment (if new) and return its ID."""
+        segment_id = self._by_text.get(text)
+        if segment_id is None:
+            segment_id = _digest(text)
+            self._by_text[text] = segment_id
+            if segment_id not in self._by_id:
+                self._order.append(segment_id)
+            self._by_id[segment_id] = text
+        return segment_id
+
+    def intern_composite(self, segment_ids: Sequence[str]) -> str:
+        """Store a composite of existing segments (if new) and return its ID."""
+        children = tuple(segment_ids)
+        segment_id = _digest("\0".join(("composite", *children)))
+        if segment_id not in self._by_id:
+            self._by_id[segment_id] = children
+            self._order.append(segment_id)
+        return segment_id
+
+    def resolve(self, segment_ids: Iterable[str]) -> str:
+        """Reconstruct the text of a list of segment IDs."""
+        return "".join(_expand(self._by_id, segment_ids))
+
+    def items_since(self, start: int) -> List[Tuple[str, str | List[str]]]:
+        """Segments added after the first ``start`` ones, in insertion order."""
+        return [
+            (k, v if isinstance(v, str) else list(v))
+            for k in self._order[start:]
+            for v in (self._by_id[k],)
+        ]
+
+    def add(self, segment_id: str, value: str | Sequence[str]) -> None:
+        """Register a segment loaded from a log under its existing ID."""
+        if segment_id not in self._by_id:
+            self._order.append(segment_id)
+        if isinstance(value, str):
+            self._by_id[segment_id] = value
+            self._by_text[value] = segment_id
+        else:
+            self._by_id[segment_id] = tuple(value)
+
+    def to_dict(self) -> Dict[str, str | List[str]]:
+        return {k: v if isinstance(v, str) else list(v) for k, v in self._by_id.items()}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _expand(table: Dict[str, Any], segment_ids: Iterable[str]) -> List[str]:
+    """Expand segment IDs (including nested composites) into their texts."""
+    texts: List[str] = []
+    stack = list(reversed(list(segment_ids)))
+    while stack:
+        value = table[stack.pop()]
+        if isinstance(value, str):
+            texts.append(value)
+        else:
+            stack.extend(reversed(value))
+    return texts
+
+
+def resolve_segments(
+    segment_ids: Iterable[str], table: Dict[str, str | List[str]]
+) -> str:
+    """
+    Rebuild text from segment IDs and a serialized segment table.
+
+    Args:
+        segment_ids: An event's ``prompt_segments``
+        table: A log's top-level ``prompt_segments`` table
+
+    Returns:
+        The reconstructed text
+    """
+    return "".join(_expand(table, segment_ids))
 
 
 @dataclass
@@ -11,38 +139,140 @@ class Event:
     Args:
         heading: The heading of the event
         role: The role of the event
-        prompt: The prompt provided to the player
+        prompt_segments: IDs of the segments that make up the prompt provided
+            to the player (see ``prompt``)
         content: The content of the event (player content or narrator message)
-        visibility: The visibility of the event content
-        active_visibility: Mutable version of visibility to track summarization
+        visibility: The visibility of the event content (stored as an
+            immutable tuple snapshot)
+        active_visibility: Players who still see the event in their rendered
+            history, used to track summarization (stored as a frozenset;
+            shrink it with History.hide_events so History's index stays
+            in sync)
         reasoning: The reasoning provided by the player
         metadata: Parsed metadata about the response (if available)
+        segments: The store the prompt segments are interned in
     """
 
     heading: str
     role: str
-    prompt: str
+    prompt_segments: Tuple[str, ...]
     content: str
-    visibility: List[str]
-    active_visibility: List[str]
+    visibility: Tuple[str, ...]
+    active_visibility: FrozenSet[str]
     reasoning: str | None = None
     metadata: Dict[str, Any] | None = None
     timestamp: str = ""
+    segments: SegmentStore = field(
+        default_factory=SegmentStore, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.prompt_segments = tuple(self.prompt_segments)
+        self.visibility = tuple(self.visibility)
+        self.active_visibility = frozenset(self.active_visibility)
+
+    @property
+    def prompt(self) -> str:
+        """The full prompt provided to the player, rebuilt from its segments."""
+        return self.segments.resolve(self.prompt_segments)
+
+    def active_visibility_list(self) -> List[str]:
+        """Active visibility as a list, in the order of ``visibility``."""
+        ordered = [pid for pid in self.visibility if pid in self.active_visibility]
+        extra = sorted(self.active_visibility.difference(self.visibility))
+        return ordered + extra
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], segments: SegmentStore) -> "Event":
+        """Rebuild an event from :meth:`to_dict` output and its segment store."""
+        return cls(
+            heading=data["heading"],
+            role=data["role"],
+            prompt_segments=data["prompt_segments"],
+            content=data["content"],
+            visibility=data["visibility"],
+            active_visibility=data["active_visibility"],
+            reasoning=data["reasoning"],
+            metadata=data["metadata"],
+            timestamp=data["timestamp"],
+            segments=segments,
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "heading": self.heading,
             "role": self.role,
-            "prompt": self.prompt,
+            "prompt_segments": list(self.prompt_segments),
             "content": self.content,
-            "visibility": self.visibility,
-            "active_visibility": self.active_visibility,
+            "visibility": list(self.visibility),
+            "active_visibility": self.active_visibility_list(),
             "reasoning": self.reasoning,
             "metadata": self.metadata,
             "timestamp": self.timestamp,
         }
 
 
+@dataclass(frozen=True)
+class EventDelta:
+    """
+    A piece of a player's response, streamed before its Event is added.
+
+    Args:
+        round_index: The index of the round
+        heading: The heading the event will have
+        visibility: The visibility the event will have
+        delta: The new text
+        restart: Whether the text streamed so far for the event is
+            discarded, because the response is retried (``delta`` is then
+            empty)
+    """
+
+    round_index: int
+    heading: str
+    visibility: Tuple[str, ...]
+    delta: str
+    restart: bool = False
+
+
+class DeltaEmitter:
+    """
+    Callback that forwards a streamed response to ``History.on_delta`` (see
+    History.delta_emitter).
+
+    Call it with each new piece of text. Call :meth:`restart` before a failed
+    response is retried, so subscribers discard the text they already got.
+    """
+
+    def __init__(
+        self, history: "History", round_index: int, heading: str, visibility: List[str]
+    ) -> None:
+        self._history = history
+        self._round_index = round_index
+        self._heading = heading
+        self._visibility = tuple(visibility)
+        # Whether text was emitted since the last restart
+        self._emitted = False
+
+    def __call__(self, delta: str) -> None:
+        self._emitted = True
+        self._emit(delta, restart=False)
+
+    def restart(self) -> None:
+        """Discard the text emitted so far (a no-op if there is none)."""
+        if self._emitted:
+            self._emitted = False
+            self._emit("", restart=True)
+
+    def _emit(self, delta: str, restart: bool) -> None:
+        on_delta = self._history.on_delta
+        if on_delta is not None:
+            on_delta(
+                EventDelta(
+                    self._round_index, self._heading, self._visibility, delta, restart
+                )
+            )
+
+
 @dataclass
 class RoundLog:
     """
@@ -85,10 +315,67 @@ class RoundLog:
         }
 
 
+@dataclass
+class _Transcript:
+    """
+    A player's rendered history, kept up to date as events are added.
+
+    Args:
+        parts: Rendered lines between the <game_history> tags
+        last_round: Round of the most recent rendered event
+        snapshot: Segment ID covering parts[:snapshotted], stored as the
+            previous snapshot plus the parts added since
+        snapshotted: Number of parts covered by snapshot
+        body: Rendering of parts[:rendered], each part preceded by a newline
+        rendered: Number of parts covered by body
+        text: Cached full rendering of body
+    """
+
+    parts: List[str] = field(default_factory=list)
+    last_round: int | None = None
+    snapshot: str | None = None
+    snapshotted: int = 0
+    body: str = ""
+    rendered: int = 0
+    text: str = f"{_RENDER_PREFIX}{_RENDER_SUFFIX}"
+
+    def append(self, round_index: int, event: Event) -> None:
+        if self.last_round != round_index:
+            self.parts.append(f"Round {round_index}:")
+            self.last_round = round_index
+        self.parts.append(f"{event.heading}:")
+        self.parts.append(f"{event.content}\n")
+
+    def render(self) -> str:
+        """The full rendering, extended with the parts added since the last."""
+        if self.rendered < len(self.parts):
+            self.body += "\n" + "\n".join(self.parts[self.rendered :])
+            self.rendered = len(self.parts)
+            self.text = f"{_RENDER_PREFIX}{self.body}{_RENDER_SUFFIX}"
+        return self.text
+
+
 class History:
-    def __init__(self, on_event: Callable[[Event], None] | None = None) -> None:
+    def __init__(
+        self,
+        on_event: Callable[[Event], None] | None = None,
+        on_delta: Callable[[EventDelta], None] | None = None,
+    ) -> None:
         self.rounds: Dict[int, RoundLog] = {}
         self.on_event = on_event
+        # Optional subscriber to streamed response text (see delta_emitter)
+        self.on_delta = on_delta
+        # Per-player index of the events in each player's active visibility,
+        # keyed by round, so filtering costs O(visible events)
+        self._visible: Dict[str, Dict[int, List[Event]]] = {}
+        # Per-player rendered transcripts. Built on first render, extended in
+        # add_event, and dropped when a player's active visibility shrinks.
+        self._transcripts: Dict[str, _Transcript] = {}
+        # Deduplicated prompt text referenced by events
+        self.segments = SegmentStore()
+        # Optional streaming log (see game_log.JsonlLogSink) that receives
+        # every change to the history as it happens
+        self.sink: "JsonlLogSink | None" = None
 
     def start_round(
         self,
@@ -109,6 +396,11 @@ class History:
         Returns:
             None
         """
+        if round_index in self.rounds:
+            # Restarting a round discards its events
+            for by_round in self._visible.values():
+                by_round.pop(round_index, None)
+            self._transcripts.clear()
 
         self.rounds[round_index] = RoundLog(
             round_index=round_index,
@@ -117,13 +409,50 @@ class History:
             eliminated_player_ids=eliminated_player_ids,
             events=[],
         )
+        if self.sink:
+            self.sink.write_round_start(self.rounds[round_index])
+
+    def load_round(self, round_log: RoundLog) -> None:
+        """
+        Register a round restored from a log, with its events.
+
+        Unlike add_event this does not notify the sink or on_event, since the
+        events were already recorded.
+
+        Args:
+            round_log: The restored round (events must use this history's
+                segment store)
+
+        Returns:
+            None
+        """
+        self.rounds[round_log.round_index] = round_log
+        for event in round_log.events:
+            for player_id in event.active_visibility:
+                self._visible.setdefault(player_id, {}).setdefault(
+                    round_log.round_index, []
+                ).append(event)
+        self._transcripts.clear()
+
+    def end_round(self, round_index: int) -> None:
+        """
+        Mark a round as complete, recording its final state in the sink.
+
+        Args:
+            round_index: The index of the round
+
+        Returns:
+            None
+        """
+        if self.sink:
+            self.sink.write_round_end(self.rounds[round_index])
 
     def add_event(
         self,
         round_index: int,
         heading: str,
         role: str,
-        prompt: str,
+        prompt: str | Sequence[str | SegmentRef],
         content: str,
         visibility: List[str],
         active_visibility: List[str],
@@ -137,7 +466,10 @@ class History:
             round_index: The index of the round
             heading: The heading of the event
             role: The role of the event
-            prompt: The prompt provided to the player
+            prompt: The prompt provided to the player, either as a string or as
+                a sequence of pieces whose concatenation is the prompt. Pieces
+                are text or SegmentRefs (see render_segments_for_player) and
+                are deduplicated, so pass shared text as separate pieces
             content: The content of the event (player content or narrator message)
             visibility: The visibility of the event content
             active_visibility: Mutable version of visibility to track summarization
@@ -147,21 +479,119 @@ class History:
         Returns:
             None
         """
+        pieces = [prompt] if isinstance(prompt, str) else prompt
         event = Event(
             heading=heading,
             role=role,
-            prompt=prompt,
+            prompt_segments=tuple(
+                piece.segment_id
+                if isinstance(piece, SegmentRef)
+                else self.segments.intern(piece)
+                for piece in pieces
+                if piece
+            ),
             content=content,
             visibility=visibility,
             active_visibility=active_visibility,
             reasoning=reasoning,
             metadata=metadata,
             timestamp=datetime.now(timezone.utc).isoformat(),
+            segments=self.segments,
         )
         self.rounds[round_index].events.append(event)
+        for player_id in event.active_visibility:
+            self._visible.setdefault(player_id, {}).setdefault(round_index, []).append(
+                event
+            )
+            transcript = self._transcripts.get(player_id)
+            if transcript is None:
+                continue
+            if (
+                transcript.last_round is not None
+                and round_index < transcript.last_round
+            ):
+                # Out-of-order append: rebuild on the next render
+                del self._transcripts[player_id]
+            else:
+                transcript.append(round_index, event)
+        if self.sink:
+            self.sink.write_event(round_index, event)
         if self.on_event:
             self.on_event(event)
 
+    def delta_emitter(
+        self, round_index: int, heading: str, visibility: List[str]
+    ) -> DeltaEmitter:
+        """
+        Callback that forwards a streamed response to ``on_delta``.
+
+        Deltas are not part of the history: the complete response is still
+        added with :meth:`add_event` (and fires ``on_event``) once it is in.
+
+        Args:
+            round_index: The index of the round
+            heading: The heading of the event the response will become
+            visibility: The visibility of that event
+
+        Returns:
+            A callback taking each new piece of text (a no-op without an
+            ``on_delta`` subscriber)
+        """
+        return DeltaEmitter(self, round_index, heading, visibility)
+
+    def hide_events(self, player_id: str, events: Iterable[Event]) -> None:
+        """
+        Remove a player from the active visibility of events.
+
+        Used by memory strategies once events have been consolidated. The
+        player's cached transcript is dropped and rebuilt on the next render.
+
+        Args:
+            player_id: The player to hide the events from
+            events: The events to hide
+
+        Returns:
+            None
+        """
+        events = list(events)
+        hidden = set()
+        for event in events:
+            if player_id not in event.active_visibility:
+                raise ValueError(
+                    f"Event '{event.heading}' is not visible to {player_id}"
+                )
+            event.active_visibility = event.active_visibility - {player_id}
+            hidden.add(id(event))
+
+        by_round = self._visible.get(player_id, {})
+        for round_index in list(by_round):
+            kept = [e for e in by_round[round_index] if id(e) not in hidden]
+            if kept:
+                by_round[round_index] = kept
+            else:
+                del by_round[round_index]
+        self._transcripts.pop(player_id, None)
+        if self.sink:
+            self.sink.write_hide(player_id, events)
+
+    def visible_events(
+        self, player_id: str, round_index: int | None = None
+    ) -> List[Event]:
+        """
+        Events currently in a player's active visibility, in history order.
+
+        Args:
+            player_id: The ID of the player
+            round_index: Restrict to one round (None for all rounds)
+
+        Returns:
+            List of events
+        """
+        by_round = self._visible.get(player_id, {})
+        if round_index is not None:
+            return list(by_round.get(round_index, []))
+        return [e for idx in self.rounds if idx in by_round for e in by_round[idx]]
+
     def narrate(
         self,
         round_index: int,
@@ -206,21 +636,57 @@ class History:
         Notes:
             - Only events that are visible to the player will be rendered
             - Reasoning is _not_ rendered for any events
+            - The rendering is cached per player and extended as events are
+              added: a render joins only the events added since the last
+              one onto the cached text
         """
-        parts: List[str] = [
-            "The following are the game events currently visible to you:",
-            "<game_history>",
-        ]
-        for round_log in self.rounds.values():
-            visible = [e for e in round_log.events if player_id in e.active_visibility]
-            if not visible:
-                continue
-            parts.append(f"Round {round_log.round_index}:")
-            for event in visible:
-                parts.append(f"{event.heading}:")
-                parts.append(f"{event.content}\n")
-        parts.append("</game_history>")
-        return "\n".join(parts)
+        return self._transcript(player_id).render()
+
+    def render_segments_for_player(self, player_id: str) -> List[str | SegmentRef]:
+        """
+        Render the game history for a player as prompt pieces.
+
+        The pieces concatenate to ``render_for_player(player_id)``. The events
+        are a single interned snapshot, stored as the player's previous
+        snapshot plus the events added since, so each prompt references a
+        constant number of segments and every event's text is stored once.
+
+        Args:
+            player_id: The ID of the player to render the history for
+
+        Returns:
+            List of text pieces and segment references for History.add_event
+        """
+        transcript = self._transcript(player_id)
+        if transcript.snapshotted < len(transcript.parts):
+            new_parts = transcript.parts[transcript.snapshotted :]
+            delta = self.segments.intern("\n" + "\n".join(new_parts))
+            if transcript.snapshot is None:
+                transcript.snapshot = delta
+            else:
+                transcript.snapshot = self.segments.intern_composite(
+                    [transcript.snapshot, delta]
+                )
+            transcript.snapshotted = len(transcript.parts)
+        if transcript.snapshot is None:
+            return [_RENDER_PREFIX, _RENDER_SUFFIX]
+        return [_RENDER_PREFIX, SegmentRef(transcript.snapshot), _RENDER_SUFFIX]
+
+    def _transcript(self, player_id: str) -> _Transcript:
+        transcript = self._transcripts.get(player_id)
+        if transcript is None:
+            transcript = self._build_transcript(player_id)
+            self._transcripts[player_id] = transcript
+        return transcript
+
+    def _build_transcript(self, player_id: str) -> _Transcript:
+        """Render a player's transcript from their visible-event index."""
+        transcript = _Transcript()
+        by_round = self._visible.get(player_id, {})
+        for round_index in self.rounds:
+            for event in by_round.get(round_index, []):
+                transcript.append(round_index, event)
+        return transcript
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -1,5 +1,6 @@
+import time
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
 
 
 @dataclass
@@ -38,6 +39,67 @@ def parse_openrouter_response(raw: Any) -> LLMResponse:
     return LLMResponse(text=text or "", reasoning=reasoning, metadata=metadata)
 
 
+class StreamError(RuntimeError):
+    """Raised when a streamed response reports an error or fails."""
+
+
+class ResponseStream:
+    """
+    Accumulates a streamed OpenRouter response.
+
+    Feed it the stream's events in order: text deltas are forwarded to
+    ``on_delta`` as they arrive, and :meth:`result` parses the final response
+    exactly like a non-streamed one (raising StreamError if the stream ended
+    without one), adding time-to-first-token
+    (``ttft_s``, from the creation of the stream) and generation speed
+    (``tokens_per_s``, completion tokens over the time since the first token)
+    to the metadata.
+
+    Args:
+        on_delta: Callback receiving each new piece of response text
+    """
+
+    def __init__(self, on_delta: Callable[[str], None]) -> None:
+        self.on_delta = on_delta
+        self.started = time.perf_counter()
+        self.first_token: float | None = None
+        self.parts: list[str] = []
+        self.response: Any = None
+
+    def feed(self, event: Any) -> None:
+        event_type = getattr(event, "type", None)
+        if event_type == "response.output_text.delta":
+            if self.first_token is None:
+                self.first_token = time.perf_counter()
+            self.parts.append(event.delta)
+            self.on_delta(event.delta)
+        elif event_type in ("response.completed", "response.incomplete"):
+            self.response = event.response
+        elif event_type == "response.failed":
+            error = getattr(event.response, "error", None)
+            raise StreamError(f"Streamed response failed: {error}")
+        elif event_type == "error":
+            raise StreamError(f"Stream error {event.code}: {event.message}")
+
+    def result(self) -> LLMResponse:
+        """The parsed response, with streaming metrics in its metadata."""
+        finished = time.perf_counter()
+        if self.response is None:
+            # Truncated (e.g. a dropped connection): the text may be partial
+            raise StreamError("Stream ended without a final response")
+        result = parse_openrouter_response(self.response)
+
+        metadata = dict(result.metadata) if result.metadata else {}
+        if self.first_token is not None:
+            metadata["ttft_s"] = round(self.first_token - self.started, 3)
+            completion_tokens = metadata.get("completion_tokens")
+            generation_s = finished - self.first_token
+            if completion_tokens and generation_s > 0:
+                metadata["tokens_per_s"] = round(completion_tokens / generation_s, 1)
+        result.metadata = metadata or None
+        return result
+
+
 def _extract_usage(raw: Any) -> dict[str, Any]:
     usage = getattr(raw, "usage", None)
     if usage is None:
@@ -48,6 +110,14 @@ def _extract_usage(raw: Any) -> dict[str, Any]:
     result["completion_tokens"] = _as_int(getattr(usage, "output_tokens", None))
     result["total_tokens"] = _as_int(getattr(usage, "total_tokens", None))
 
+    it_details = getattr(usage, "input_tokens_details", None)
+    if it_details is not None:
+        # Input tokens served from (or written to) the provider's prompt cache
+        result["cached_tokens"] = _as_int(getattr(it_details, "cached_tokens", None))
+        result["cache_write_tokens"] = _as_int(
+            getattr(it_details, "cache_write_tokens", None)
+        )
+
     ct_details = getattr(usage, "output_tokens_details", None)
     if ct_details is not None:
         result["reasoning_tokens"] = _as_int(
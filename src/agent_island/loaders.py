@@ -1,6 +1,11 @@
+import dataclasses
+import json
 import pathlib
 import tomllib
 
+from .cassette import Cassette
+from .engine import GameConfig
+from .history import resolve_segments
 from .player import (
     AIPlayer,
     ChoiceCollector,
@@ -9,6 +14,7 @@ from .player import (
     Player,
     PlayerConfig,
 )
+from .ratelimit import RateLimits
 
 VALID_PLAYER_TYPES = {"ai", "human"}
 
@@ -48,6 +54,43 @@ def load_game_config_from_toml(config_path: pathlib.Path) -> dict:
     return game
 
 
+def create_game_config(game_data: dict, **overrides) -> GameConfig:
+    """
+    Build a GameConfig from load_game_config_from_toml output.
+
+    Args:
+        game_data: The parsed game config
+        **overrides: GameConfig fields that replace the configured values
+            (e.g. logs_dir or game_id)
+
+    Returns:
+        The GameConfig
+    """
+    fields = {
+        "num_players": game_data["num_players"],
+        "num_rounds": game_data["num_rounds"],
+        "phases": game_data["phases"],
+        "logs_dir": game_data.get("logs_dir"),
+        "rules_prompt": game_data["rules_prompt"],
+        "round_phase_overrides": game_data.get("round_phase_overrides", {}),
+        "round_type": game_data.get("round_type", "elimination"),
+        "round_type_overrides": game_data.get("round_type_overrides", {}),
+        "phase_config": game_data.get("phase_config", {}),
+        "round_phase_config_overrides": game_data.get(
+            "round_phase_config_overrides", {}
+        ),
+        "log_prefix": game_data.get("log_prefix", "gameplay"),
+        "game_id": game_data.get("game_id"),
+        "client_pool": game_data.get("client_pool", {}),
+        "prewarm_clients": game_data.get("prewarm_clients", True),
+        "retry": game_data.get("retry", {}),
+        "stream_responses": game_data.get("stream_responses", False),
+        "prompt_cache_hints": game_data.get("prompt_cache_hints", False),
+    }
+    fields.update(overrides)
+    return GameConfig(**fields)
+
+
 def load_player_configs_from_toml(
     config_path: pathlib.Path, api_key: str
 ) -> list[PlayerConfig]:
@@ -70,20 +113,76 @@ def load_player_configs_from_toml(
             client_kwargs=p.get("client_kwargs", {}),
             memory_strategy=p.get("memory_strategy", "none"),
             player_type=p.get("player_type", "ai"),
+            chain_conversation=p.get("chain_conversation", False),
         )
         for p in players
     ]
 
 
+def load_rate_limits_from_toml(config_path: pathlib.Path) -> dict[str, dict]:
+    """
+    Load per-model rate limits from the ``[rate_limits]`` table of a player
+    config, e.g. ``[rate_limits."openai/gpt-5.2"]`` with ``rpm``, ``tpm`` and
+    ``max_concurrency`` keys.
+
+    Args:
+        config_path: Path to the player config TOML file
+
+    Returns:
+        dict of RateLimits fields keyed by model name
+    """
+    with open(config_path, "rb") as f:
+        data = tomllib.load(f)
+    rate_limits = data.get("rate_limits", {})
+    valid_keys = {f.name for f in dataclasses.fields(RateLimits)}
+    for model, limits in rate_limits.items():
+        unknown = set(limits) - valid_keys
+        if unknown:
+            raise ValueError(
+                f"rate_limits.{model!r} has unknown keys {sorted(unknown)}, "
+                f"must be among {sorted(valid_keys)}"
+            )
+    return rate_limits
+
+
 def create_players(
     player_configs: list[PlayerConfig],
     free_collector: FreeCollector,
     choice_collector: ChoiceCollector,
+    cassette: Cassette | None = None,
 ) -> list[Player]:
     players: list[Player] = []
     for config in player_configs:
         if config.player_type == "human":
             players.append(HumanPlayer(config, free_collector, choice_collector))
         else:
-            players.append(AIPlayer(config))
+            players.append(AIPlayer(config, cassette=cassette))
     return players
+
+
+def load_game_log(log_path: pathlib.Path) -> dict:
+    """
+    Load a JSON game log written by GameEngine.
+
+    Event prompts are stored as segment ID lists; use :func:`resolve_prompt`
+    to rebuild an event's prompt text when it is needed.
+    """
+    with open(log_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def resolve_prompt(event: dict, prompt_segments: dict[str, str | list[str]]) -> str:
+    """
+    Rebuild the exact prompt of a logged event.
+
+    Args:
+        event: An event dict from a game log
+        prompt_segments: The log's top-level ``prompt_segments`` table
+
+    Returns:
+        The prompt text (logs that predate segment storage carry the prompt
+        inline and are returned as-is)
+    """
+    if "prompt" in event:
+        return event["prompt"]
+    return resolve_segments(event["prompt_segments"], prompt_segments)
@@ -1,12 +1,49 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Dict, List
 
+from .prompts import build_system_prompt
+
 if TYPE_CHECKING:
-    from .history import History
-    from .player import Player
+    from .history import Event, History
+    from .player import FreeResponse, Player
+
+
+@dataclass
+class ConsolidationRequest:
+    """
+    A consolidation LLM call prepared by MemoryStrategy.prepare_consolidation.
+
+    Args:
+        round_index: The round being consolidated (for deferred rounds, the
+            round in which they are consolidated)
+        system_prompt: The system prompt for the call
+        context: The rendered events (and prior memory) to consolidate
+        action: The consolidation instruction
+        consumed_events: Events to hide from the player once committed
+        context_segments: ``context`` split into prompt segments for logging
+            (None to log it as a single segment)
+        rounds: Deferred rounds consolidated by the call (None when it
+            consolidates round_index)
+        shared_key: Key of a summary shared by all players, used to request
+            it once (None for a player's own summary)
+        public_summary: Shared summary the player's own summary builds on
+            (None if there is none)
+    """
+
+    round_index: int
+    system_prompt: str
+    context: str
+    action: str
+    consumed_events: List[Event] = field(default_factory=list)
+    context_segments: List[str] | None = None
+    rounds: List[int] | None = None
+    shared_key: str | None = None
+    public_summary: str | None = None
 
 
 class MemoryStrategy(ABC):
@@ -42,6 +79,134 @@ class MemoryStrategy(ABC):
         """
         ...
 
+    async def consolidate_async(
+        self,
+        player: Player,
+        history: History,
+        round_index: int,
+        rules_prompt: str,
+    ) -> None:
+        """
+        Async variant of consolidate, used by GameEngine.play_async().
+
+        The default runs consolidate in a worker thread. Strategies that make
+        LLM calls should override it to use the player's async API.
+        """
+        await asyncio.to_thread(
+            self.consolidate, player, history, round_index, rules_prompt
+        )
+
+    @property
+    def supports_batching(self) -> bool:
+        """
+        Whether the strategy splits consolidation into prepare_consolidation
+        and commit_consolidation (and may share summaries through
+        prepare_shared and commit_shared).
+
+        phase_consolidate_memory batches the calls of these strategies when
+        max_concurrency is not 1, and runs consolidate (or
+        consolidate_async) one player at a time for the others. The default
+        is False; strategies that return True implement both split hooks.
+        """
+        return False
+
+    def prepare_consolidation(
+        self,
+        player: Player,
+        history: History,
+        round_index: int,
+        rules_prompt: str,
+    ) -> ConsolidationRequest | None:
+        """
+        First half of a split consolidation, used when the phase batches the
+        LLM calls of several players (see supports_batching).
+
+        Returns the LLM call to make (or None if no call is needed) without
+        touching the history. The phase answers it and passes the response to
+        commit_consolidation.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not implement prepare_consolidation"
+        )
+
+    def commit_consolidation(
+        self,
+        player: Player,
+        history: History,
+        request: ConsolidationRequest,
+        response: FreeResponse,
+    ) -> None:
+        """
+        Second half of a split consolidation: store the response in memory,
+        log it and clear active_visibility on the consumed events.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not implement commit_consolidation"
+        )
+
+    def prepare_shared(
+        self,
+        player: Player,
+        history: History,
+        round_index: int,
+        rules_prompt: str,
+    ) -> ConsolidationRequest | None:
+        """
+        Build a summarization call whose result all players share.
+
+        phase_consolidate_memory answers the shared calls of all players
+        (deduplicated by ``shared_key``) and passes each response to
+        commit_shared before preparing the players' own consolidations.
+        The default shares nothing.
+        """
+        return None
+
+    def commit_shared(
+        self,
+        player: Player,
+        history: History,
+        request: ConsolidationRequest,
+        response: FreeResponse,
+    ) -> None:
+        """
+        Store the response to a prepare_shared call. Only called for
+        requests returned by prepare_shared, so the default (for strategies
+        that share nothing) is never reached.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not implement commit_shared"
+        )
+
+    def defer(self, round_index: int) -> bool:
+        """
+        Offer to consolidate a round later instead of now.
+
+        phase_consolidate_memory calls this for eliminated players, who may
+        not be prompted again. A strategy that accepts keeps the round's
+        events visible and consolidates them in prepare_deferred. The
+        default declines.
+
+        Returns:
+            Whether the round was deferred
+        """
+        return False
+
+    def prepare_deferred(
+        self,
+        player: Player,
+        history: History,
+        round_index: int,
+        rules_prompt: str,
+    ) -> ConsolidationRequest | None:
+        """
+        Build one consolidation call for all deferred rounds.
+
+        Called (see phases.common.settle_memory) just before the player is prompted
+        in round ``round_index``. The response is passed to
+        commit_consolidation. The default has nothing deferred.
+        """
+        return None
+
     @abstractmethod
     def render(self) -> str:
         """
@@ -55,6 +220,15 @@ class MemoryStrategy(ABC):
         """Serialize the memory state for logging."""
         ...
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> MemoryStrategy:
+        """
+        Restore a strategy from :meth:`to_dict` output (used to resume games).
+
+        The default suits stateless strategies and returns a fresh instance.
+        """
+        return cls()
+
 
 @dataclass
 class SummarizationStrategy(MemoryStrategy):
@@ -69,6 +243,10 @@ class SummarizationStrategy(MemoryStrategy):
     def strategy_name(self) -> str:
         return "summarization"
 
+    @property
+    def supports_batching(self) -> bool:
+        return True
+
     def consolidate(
         self,
         player: Player,
@@ -76,30 +254,61 @@ class SummarizationStrategy(MemoryStrategy):
         round_index: int,
         rules_prompt: str,
     ) -> None:
-        player_id = player.config.player_id
+        request = self.prepare_consolidation(player, history, round_index, rules_prompt)
+        if request is None:
+            return
+        response = player.free_response(
+            system_prompt=request.system_prompt,
+            context=request.context,
+            action=request.action,
+        )
+        self.commit_consolidation(player, history, request, response)
 
-        round_log = history.rounds.get(round_index)
-        if not round_log:
+    async def consolidate_async(
+        self,
+        player: Player,
+        history: History,
+        round_index: int,
+        rules_prompt: str,
+    ) -> None:
+        request = self.prepare_consolidation(player, history, round_index, rules_prompt)
+        if request is None:
             return
+        response = await player.free_response_async(
+            system_prompt=request.system_prompt,
+            context=request.context,
+            action=request.action,
+        )
+        self.commit_consolidation(player, history, request, response)
+
+    def prepare_consolidation(
+        self,
+        player: Player,
+        history: History,
+        round_index: int,
+        rules_prompt: str,
+    ) -> ConsolidationRequest | None:
+        """Collect the events to summarize and build the summarization prompt."""
+        player_id = player.config.player_id
 
         # Collect events visible to this player in the current round
         visible_parts: List[str] = []
-        consumed_events = []
-        for event in round_log.events:
-            if player_id in event.active_visibility:
-                visible_parts.append(f"{event.heading}:")
-                visible_parts.append(f"{event.content}\n")
-                consumed_events.append(event)
+        consumed_events = history.visible_events(player_id, round_index)
+        for event in consumed_events:
+            visible_parts.append(f"{event.heading}:")
+            visible_parts.append(f"{event.content}\n")
 
         if not visible_parts:
-            return
+            return None
 
         visible_events = "\n".join(visible_parts)
+        context_segments = [visible_events]
 
         # Include past summaries so the agent can connect events across rounds
         memory_context = self.render()
         if memory_context:
             visible_events = f"{memory_context}\n\n{visible_events}"
+            context_segments = [memory_context, "\n\n", *context_segments]
 
         action = (
             "Please summarize the events of this round. "
@@ -108,25 +317,38 @@ class SummarizationStrategy(MemoryStrategy):
             "Other players will not be able to see your summary."
         )
 
-        system_prompt = f"""{rules_prompt}
-
-<character>
-{player.config.character_prompt}
-</character>"""
+        system_prompt = build_system_prompt(
+            rules_prompt, player.config.character_prompt
+        )
 
-        response = player.free_response(
+        return ConsolidationRequest(
+            round_index=round_index,
             system_prompt=system_prompt,
             context=visible_events,
             action=action,
+            consumed_events=consumed_events,
+            context_segments=context_segments,
         )
 
-        self.summaries[round_index] = response.text
+    def commit_consolidation(
+        self,
+        player: Player,
+        history: History,
+        request: ConsolidationRequest,
+        response: FreeResponse,
+    ) -> None:
+        """Store the summary, log it, and hide the consumed events."""
+        player_id = player.config.player_id
+
+        self.summaries[request.round_index] = response.text
 
         history.add_event(
-            round_index=round_index,
+            round_index=request.round_index,
             heading=f"Player {player_id}'s Memory Consolidation",
             role=f"player {player_id}",
-            prompt=f"{system_prompt}\n\n{visible_events}\n\n{action}",
+            prompt=(
+                f"{request.system_prompt}\n\n{request.context}\n\n{request.action}"
+            ),
             content=response.text,
             reasoning=response.reasoning,
             metadata=response.metadata,
@@ -135,8 +357,7 @@ class SummarizationStrategy(MemoryStrategy):
         )
 
         # Clear active_visibility on consumed events
-        for event in consumed_events:
-            event.active_visibility.remove(player_id)
+        history.hide_events(player_id, request.consumed_events)
 
     def render(self) -> str:
         if not self.summaries:
@@ -158,6 +379,453 @@ class SummarizationStrategy(MemoryStrategy):
             "summaries": {str(k): v for k, v in self.summaries.items()},
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> SummarizationStrategy:
+        return cls(summaries={int(k): v for k, v in data["summaries"].items()})
+
+
+@dataclass
+class LazySummarizationStrategy(SummarizationStrategy):
+    """
+    Summarization that defers the rounds of eliminated players.
+
+    Eliminated players are often not prompted again until the final vote, if
+    at all. Their rounds stay pending, with the events still visible, until
+    the player is next prompted. Then all pending rounds are summarized in a
+    single call. Rounds of active players are summarized as they end.
+    """
+
+    pending_rounds: List[int] = field(default_factory=list)
+    # Rounds covered by each summary, keyed like summaries (multi-round only)
+    covered_rounds: Dict[int, List[int]] = field(default_factory=dict)
+
+    @property
+    def strategy_name(self) -> str:
+        return "lazy_summarization"
+
+    def defer(self, round_index: int) -> bool:
+        if round_index not in self.pending_rounds:
+            self.pending_rounds.append(round_index)
+        return True
+
+    def prepare_deferred(
+        self,
+        player: Player,
+        history: History,
+        round_index: int,
+        rules_prompt: str,
+    ) -> ConsolidationRequest | None:
+        """Build one summarization prompt over all pending rounds."""
+        if not self.pending_rounds:
+            return None
+        player_id = player.config.player_id
+
+        visible_parts: List[str] = []
+        consumed_events: List[Event] = []
+        for pending in self.pending_rounds:
+            events = history.visible_events(player_id, pending)
+            if not events:
+                continue
+            visible_parts.append(f"Round {pending}:")
+            for event in events:
+                visible_parts.append(f"{event.heading}:")
+                visible_parts.append(f"{event.content}\n")
+            consumed_events.extend(events)
+
+        if not visible_parts:
+            return None
+
+        visible_events = "\n".join(visible_parts)
+        context_segments = [visible_events]
+
+        memory_context = self.render()
+        if memory_context:
+            visible_events = f"{memory_context}\n\n{visible_events}"
+            context_segments = [memory_context, "\n\n", *context_segments]
+
+        rounds = list(self.pending_rounds)
+        if len(rounds) == 1:
+            which = f"round {rounds[0]}"
+        else:
+            which = f"rounds {', '.join(map(str, rounds[:-1]))} and {rounds[-1]}"
+        action = (
+            f"Please summarize the events of {which}. "
+            "This summary will be the only context on these events "
+            "that you will have from now on. "
+            "Other players will not be able to see your summary."
+        )
+
+        system_prompt = build_system_prompt(
+            rules_prompt, player.config.character_prompt
+        )
+
+        return ConsolidationRequest(
+            round_index=round_index,
+            system_prompt=system_prompt,
+            context=visible_events,
+            action=action,
+            consumed_events=consumed_events,
+            context_segments=context_segments,
+            rounds=rounds,
+        )
+
+    def commit_consolidation(
+        self,
+        player: Player,
+        history: History,
+        request: ConsolidationRequest,
+        response: FreeResponse,
+    ) -> None:
+        """Store the summary of the deferred rounds, log it and hide them."""
+        if request.rounds is None:
+            super().commit_consolidation(player, history, request, response)
+            return
+        player_id = player.config.player_id
+
+        last = request.rounds[-1]
+        self.summaries[last] = response.text
+        if len(request.rounds) > 1:
+            self.covered_rounds[last] = list(request.rounds)
+        self.pending_rounds = [
+            r for r in self.pending_rounds if r not in request.rounds
+        ]
+
+        history.add_event(
+            round_index=request.round_index,
+            heading=f"Player {player_id}'s Memory Consolidation",
+            role=f"player {player_id}",
+            prompt=(
+                f"{request.system_prompt}\n\n{request.context}\n\n{request.action}"
+            ),
+            content=response.text,
+            reasoning=response.reasoning,
+            metadata=response.metadata,
+            visibility=[player_id],
+            active_visibility=[],
+        )
+
+        history.hide_events(player_id, request.consumed_events)
+
+    def render(self) -> str:
+        if not self.summaries:
+            return ""
+        parts = [
+            "The following is a summary of your memory from previous rounds:",
+            "<memory>",
+        ]
+        for round_idx in sorted(self.summaries.keys()):
+            covered = self.covered_rounds.get(round_idx)
+            if covered:
+                label = f"Rounds {', '.join(map(str, covered))}"
+            else:
+                label = f"Round {round_idx}"
+            parts.append(f"{label} Summary:")
+            parts.append(self.summaries[round_idx])
+            parts.append("")
+        parts.append("</memory>")
+        return "\n".join(parts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **super().to_dict(),
+            "pending_rounds": list(self.pending_rounds),
+            "covered_rounds": {str(k): v for k, v in self.covered_rounds.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> LazySummarizationStrategy:
+        return cls(
+            summaries={int(k): v for k, v in data["summaries"].items()},
+            pending_rounds=list(data.get("pending_rounds", [])),
+            covered_rounds={
+                int(k): v for k, v in data.get("covered_rounds", {}).items()
+            },
+        )
+
+
+@dataclass
+class HybridSummarizationStrategy(SummarizationStrategy):
+    """
+    Summarization that shares one neutral summary of each round's public
+    events.
+
+    The round's public events (announcements, pitches, vote results,
+    eliminations; those visible to every player in ``history.player_ids``)
+    are summarized once per round without a character prompt. The summary
+    is logged in the round, and every player using this strategy reuses it
+    from there (which also holds for resumed games). Each player then
+    summarizes only their private events (sidebars, votes), in character,
+    and skips the call if there are none. Players outside
+    ``history.player_ids`` (who do not receive the public events)
+    summarize what they saw as in SummarizationStrategy.
+    """
+
+    public_summaries: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def strategy_name(self) -> str:
+        return "hybrid_summarization"
+
+    def consolidate(
+        self,
+        player: Player,
+        history: History,
+        round_index: int,
+        rules_prompt: str,
+    ) -> None:
+        shared = self.prepare_shared(player, history, round_index, rules_prompt)
+        if shared is not None:
+            response = player.free_response(
+                system_prompt=shared.system_prompt,
+                context=shared.context,
+                action=shared.action,
+            )
+            self.commit_shared(player, history, shared, response)
+        super().consolidate(player, history, round_index, rules_prompt)
+
+    async def consolidate_async(
+        self,
+        player: Player,
+        history: History,
+        round_index: int,
+        rules_prompt: str,
+    ) -> None:
+        shared = self.prepare_shared(player, history, round_index, rules_prompt)
+        if shared is not None:
+            response = await player.free_response_async(
+                system_prompt=shared.system_prompt,
+                context=shared.context,
+                action=shared.action,
+            )
+            self.commit_shared(player, history, shared, response)
+        await super().consolidate_async(player, history, round_index, rules_prompt)
+
+    def prepare_shared(
+        self,
+        player: Player,
+        history: History,
+        round_index: int,
+        rules_prompt: str,
+    ) -> ConsolidationRequest | None:
+        """Build the neutral summarization prompt of the round's public events."""
+        request = self._shared_request(player, history, round_index, rules_prompt)
+        if request is None or _find_shared(history, request) is not None:
+            return None
+        return request
+
+    def commit_shared(
+        self,
+        player: Player,
+        history: History,
+        request: ConsolidationRequest,
+        response: FreeResponse,
+    ) -> None:
+        """
+        Log the public summary, where other players will find it.
+
+        The event's role is "shared", so the stats count the call apart from
+        the player whose model made it; the model is kept in the metadata.
+        """
+        history.add_event(
+            round_index=request.round_index,
+            heading=f"Round {request.round_index} Public Summary",
+            role="shared",
+            prompt=(
+                f"{request.system_prompt}\n\n{request.context}\n\n{request.action}"
+            ),
+            content=response.text,
+            reasoning=response.reasoning,
+            metadata={**(response.metadata or {}), "model": player.config.model},
+            visibility=[player.config.player_id],
+            active_visibility=[],
+        )
+
+    def prepare_consolidation(
+        self,
+        player: Player,
+        history: History,
+        round_index: int,
+        rules_prompt: str,
+    ) -> ConsolidationRequest | None:
+        """
+        Build the summarization prompt of the player's private events.
+
+        If the round's public summary is missing from the history, the public
+        events are summarized with the private ones, as in
+        SummarizationStrategy. If the player has no private events, the
+        public summary is stored right away and no call is needed.
+        """
+        player_id = player.config.player_id
+        events = history.visible_events(player_id, round_index)
+        if not events:
+            return None
+
+        shared = self._shared_request(player, history, round_index, rules_prompt)
+        public_summary = _find_shared(history, shared) if shared else None
+        if public_summary is None:
+            private = events
+        else:
+            private = [e for e in events if not _is_public(e, history)]
+
+        if not private:
+            self.public_summaries[round_index] = public_summary
+            history.hide_events(player_id, events)
+            return None
+
+        visible_parts: List[str] = []
+        for event in private:
+            visible_parts.append(f"{event.heading}:")
+            visible_parts.append(f"{event.content}\n")
+        visible_events = "\n".join(visible_parts)
+        context_segments = [visible_events]
+
+        preamble = self.render()
+        if public_summary is not None:
+            public_part = f"Round {round_index} Public Summary:\n{public_summary}"
+            preamble = f"{preamble}\n\n{public_part}" if preamble else public_part
+        if preamble:
+            visible_events = f"{preamble}\n\n{visible_events}"
+            context_segments = [preamble, "\n\n", *context_segments]
+
+        if public_summary is None:
+            action = (
+                "Please summarize the events of this round. "
+                "This summary will be the only context on the events of this "
+                "round that you will have in future rounds. "
+                "Other players will not be able to see your summary."
+            )
+        else:
+            action = (
+                "The public events of this round are summarized above, and "
+                "that summary will stay in your memory. Please summarize the "
+                "private events of this round that only you could see. "
+                "This summary will be the only context on them that you will "
+                "have in future rounds. "
+                "Other players will not be able to see your summary."
+            )
+
+        system_prompt = build_system_prompt(
+            rules_prompt, player.config.character_prompt
+        )
+
+        return ConsolidationRequest(
+            round_index=round_index,
+            system_prompt=system_prompt,
+            context=visible_events,
+            action=action,
+            consumed_events=events,
+            context_segments=context_segments,
+            public_summary=public_summary,
+        )
+
+    def commit_consolidation(
+        self,
+        player: Player,
+        history: History,
+        request: ConsolidationRequest,
+        response: FreeResponse,
+    ) -> None:
+        """Store the private (and public) summary, log it and hide the events."""
+        if request.public_summary is not None:
+            self.public_summaries[request.round_index] = request.public_summary
+        super().commit_consolidation(player, history, request, response)
+
+    def render(self) -> str:
+        rounds = sorted(set(self.summaries) | set(self.public_summaries))
+        if not rounds:
+            return ""
+        parts = [
+            "The following is a summary of your memory from previous rounds:",
+            "<memory>",
+        ]
+        for round_idx in rounds:
+            if round_idx in self.public_summaries:
+                parts.append(f"Round {round_idx} Public Summary:")
+                parts.append(self.public_summaries[round_idx])
+                parts.append("")
+            if round_idx in self.summaries:
+                label = (
+                    "Private Summary"
+                    if round_idx in self.public_summaries
+                    else "Summary"
+                )
+                parts.append(f"Round {round_idx} {label}:")
+                parts.append(self.summaries[round_idx])
+                parts.append("")
+        parts.append("</memory>")
+        return "\n".join(parts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **super().to_dict(),
+            "public_summaries": {str(k): v for k, v in self.public_summaries.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> HybridSummarizationStrategy:
+        return cls(
+            summaries={int(k): v for k, v in data["summaries"].items()},
+            public_summaries={
+                int(k): v for k, v in data.get("public_summaries", {}).items()
+            },
+        )
+
+    def _shared_request(
+        self,
+        player: Player,
+        history: History,
+        round_index: int,
+        rules_prompt: str,
+    ) -> ConsolidationRequest | None:
+        if player.config.player_id not in history.player_ids:
+            return None
+        public = [
+            e
+            for e in history.visible_events(player.config.player_id, round_index)
+            if _is_public(e, history)
+        ]
+        if not public:
+            return None
+
+        visible_parts: List[str] = []
+        for event in public:
+            visible_parts.append(f"{event.heading}:")
+            visible_parts.append(f"{event.content}\n")
+        context = "\n".join(visible_parts)
+
+        system_prompt = rules_prompt.strip()
+        action = (
+            f"Please write a neutral, factual summary of the public events of "
+            f"round {round_index}. Every player will keep this summary as "
+            "their record of these events, so do not take any player's side."
+        )
+        key = hashlib.sha256(
+            "\n\n".join((system_prompt, context, action)).encode("utf-8")
+        ).hexdigest()
+
+        return ConsolidationRequest(
+            round_index=round_index,
+            system_prompt=system_prompt,
+            context=context,
+            action=action,
+            shared_key=key,
+        )
+
+
+def _find_shared(history: History, request: ConsolidationRequest) -> str | None:
+    """The logged response to a shared summarization request, if any."""
+    heading = f"Round {request.round_index} Public Summary"
+    prompt = f"{request.system_prompt}\n\n{request.context}\n\n{request.action}"
+    for event in history.rounds[request.round_index].events:
+        if event.heading == heading and event.prompt == prompt:
+            return event.content
+    return None
+
+
+def _is_public(event: Event, history: History) -> bool:
+    """Whether an event is visible to every player in history.player_ids."""
+    return set(event.visibility) >= set(history.player_ids)
+
 
 @dataclass
 class NoOpStrategy(MemoryStrategy):
@@ -189,6 +857,8 @@ class NoOpStrategy(MemoryStrategy):
 STRATEGY_REGISTRY: Dict[str, type] = {
     "none": NoOpStrategy,
     "summarization": SummarizationStrategy,
+    "lazy_summarization": LazySummarizationStrategy,
+    "hybrid_summarization": HybridSummarizationStrategy,
 }
 
 
@@ -201,3 +871,14 @@ def create_strategy(name: str) -> MemoryStrategy:
             f"Available: {list(STRATEGY_REGISTRY.keys())}"
         )
     return cls()
+
+
+def strategy_from_dict(data: Dict[str, Any]) -> MemoryStrategy:
+    """Restore a MemoryStrategy from its to_dict() output."""
+    cls = STRATEGY_REGISTRY.get(data["strategy"])
+    if cls is None:
+        raise ValueError(
+            f"Unknown memory strategy '{data['strategy']}'. "
+            f"Available: {list(STRATEGY_REGISTRY.keys())}"
+        )
+    return cls.from_dict(data)
@@ -0,0 +1,535 @@
+import argparse
+import hashlib
+import itertools
+import json
+import logging
+import math
+import os
+import random
+import re
+import socket
+import threading
+import time
+from dataclasses import dataclass, field, fields
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX = "/api/v1"
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+# Python list of quoted player IDs, as rendered into actions by the phases
+_ID_LIST_RE = re.compile(r"\[('[^'\]]*'(?:,\s*'[^'\]]*')*)\]")
+_OPPONENTS_RE = re.compile(r"Your opponents are: \[([^\]]*)\]")
+_QUOTED_RE = re.compile(r"'([^']*)'")
+
+_WORDS = (
+    "alliance trust island vote strategy loyal bold quiet pitch sidebar "
+    "round tribe promise plan risk move threat ally game final jury"
+).split()
+
+
+@dataclass(frozen=True)
+class MockServerConfig:
+    """
+    Behavior of the mock server.
+
+    Args:
+        latency: Distribution of the time to first token ("fixed",
+            "uniform", "exponential" or "lognormal")
+        latency_s: Mean time to first token in seconds
+        latency_spread: Spread of the distribution: the relative half-width
+            for "uniform" and sigma for "lognormal" (ignored otherwise)
+        tokens_per_s: Generation speed after the first token (0 for
+            instant generation)
+        error_rate: Probability of a 500 response
+        rate_limit_rate: Probability of a 429 response
+        max_concurrency: Requests served at once before further ones get a
+            429 response (None for no limit)
+        retry_after_s: ``Retry-After`` header of 429 responses (None to omit)
+        reasoning: Add a reasoning block to every response
+        response_words: Length of free-text answers in words
+        input_cost: Cost per input token
+        output_cost: Cost per output token
+        cached_input_cost: Cost per cached input token
+        seed: Seed of the latency and error draws (None for a random seed).
+            Answers only depend on the request, never on the draws.
+    """
+
+    latency: str = "lognormal"
+    latency_s: float = 0.5
+    latency_spread: float = 0.5
+    tokens_per_s: float = 0.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    max_concurrency: int | None = None
+    retry_after_s: float | None = 1.0
+    reasoning: bool = False
+    response_words: int = 40
+    input_cost: float = 1e-6
+    output_cost: float = 4e-6
+    cached_input_cost: float = 1e-7
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution {self.latency!r} "
+                f"(expected one of {LATENCY_DISTRIBUTIONS})"
+            )
+
+
+def count_tokens(text: str) -> int:
+    """Rough token count of a text (4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+def request_text(body: Dict[str, Any]) -> str:
+    """The text of a request's last user turn."""
+    value = body.get("input")
+    if isinstance(value, str):
+        return value
+    for message in reversed(value or []):
+        if message.get("role", "user") != "user":
+            continue
+        content = message.get("content")
+        if isinstance(content, str):
+            return content
+        return "".join(part.get("text", "") for part in content or [])
+    return ""
+
+
+def _prompt_text(body: Dict[str, Any]) -> str:
+    """Everything a request sends to the model, in order."""
+    value = body.get("input")
+    if isinstance(value, str):
+        turns = value
+    else:
+        turns = "\n".join(json.dumps(m, sort_keys=True) for m in value or [])
+    return f"{body.get('instructions') or ''}\n{turns}"
+
+
+def answer(text: str, words: int = 40) -> str:
+    """
+    The mock model's answer to an action.
+
+    Picks a ``<choice>`` among the last list of quoted IDs in the text when
+    a choice is asked for, writes one ``<quip>`` per opponent when quips are
+    asked for, and plain text otherwise. The answer is a pure function of
+    the text, so replays and reruns see the same game.
+
+    Args:
+        text: The request's last user turn
+        words: Length of free-text answers in words
+
+    Returns:
+        The answer text
+    """
+    rng = _text_rng(text)
+    filler = _filler(rng, words)
+
+    if "<quip" in text:
+        match = _OPPONENTS_RE.search(text)
+        opponents = _QUOTED_RE.findall(match.group(1)) if match else []
+        return "\n".join(
+            f'<quip player="{pid}">{" ".join(rng.sample(_WORDS, 6))}.</quip>'
+            for pid in opponents
+        )
+    if "<choice>" in text:
+        lists = _ID_LIST_RE.findall(text)
+        if lists:
+            options = _QUOTED_RE.findall(lists[-1])
+            return f"<choice>{rng.choice(options)}</choice>\n{filler}"
+    return filler
+
+
+def _text_rng(text: str) -> random.Random:
+    return random.Random(hashlib.sha256(text.encode("utf-8")).digest())
+
+
+def _filler(rng: random.Random, words: int) -> str:
+    filler = " ".join(rng.choice(_WORDS) for _ in range(max(words, 1)))
+    return f"{filler[0].upper()}{filler[1:]}."
+
+
+class _State:
+    """Mutable state shared by the request handlers."""
+
+    def __init__(self, config: MockServerConfig) -> None:
+        self.config = config
+        self.lock = threading.Lock()
+        self.rng = random.Random(config.seed)
+        self.ids = itertools.count(1)
+        self.in_flight = 0
+        # Last prompt per system prompt, to simulate prefix caching
+        self.prompts: Dict[str, str] = {}
+        self.stats: Dict[str, int] = {
+            "requests": 0,
+            "completed": 0,
+            "streamed": 0,
+            "errors": 0,
+            "rate_limited": 0,
+        }
+
+    def draw(self) -> tuple[float, float]:
+        """Draw a latency and a uniform number for error injection."""
+        config = self.config
+        with self.lock:
+            if config.latency == "fixed":
+                latency = config.latency_s
+            elif config.latency == "uniform":
+                half = config.latency_s * config.latency_spread
+                latency = self.rng.uniform(
+                    config.latency_s - half, config.latency_s + half
+                )
+            elif config.latency == "exponential" and config.latency_s > 0:
+                latency = self.rng.expovariate(1 / config.latency_s)
+            elif config.latency_s > 0:
+                # Lognormal, parameterized so that the mean is latency_s
+                sigma = config.latency_spread
+                mu = math.log(config.latency_s) - sigma**2 / 2
+                latency = self.rng.lognormvariate(mu, sigma)
+            else:
+                latency = 0.0
+            return max(0.0, latency), self.rng.random()
+
+    def cached_tokens(self, body: Dict[str, Any]) -> int:
+        """Tokens of the prompt prefix shared with the last similar request."""
+        prompt = _prompt_text(body)
+        key = body.get("prompt_cache_key") or body.get("instructions") or ""
+        with self.lock:
+            previous = self.prompts.get(key, "")
+            self.prompts[key] = prompt
+        shared = len(os.path.commonprefix([previous, prompt]))
+        return shared // 4
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_HTTPServer"
+
+    def setup(self) -> None:
+        super().setup()
+        # Send streamed events as they are written, without Nagle delays
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def do_HEAD(self) -> None:
+        # Connection pre-warming sends HEAD requests to the base URL
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self) -> None:
+        self._send_json(404, _error_body(404, "Not found"))
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            self._send_json(400, _error_body(400, "Invalid JSON body"))
+            return
+        if not self.path.rstrip("/").endswith("/responses"):
+            self._send_json(404, _error_body(404, f"No route for {self.path}"))
+            return
+
+        state = self.server.state
+        config = state.config
+        latency, roll = state.draw()
+        with state.lock:
+            state.stats["requests"] += 1
+            over_capacity = (
+                config.max_concurrency is not None
+                and state.in_flight >= config.max_concurrency
+            )
+            if not over_capacity:
+                state.in_flight += 1
+        if over_capacity or roll < config.rate_limit_rate:
+            self._rate_limited()
+            return
+        try:
+            time.sleep(latency)
+            if roll < config.rate_limit_rate + config.error_rate:
+                with state.lock:
+                    state.stats["errors"] += 1
+                self._send_json(500, _error_body(500, "Mock server error"))
+                return
+            response = self._build_response(body)
+            if body.get("stream"):
+                self._stream(response)
+            else:
+                self._generate(response)
+                self._send_json(200, response)
+            with state.lock:
+                state.stats["completed"] += 1
+                state.stats["streamed"] += bool(body.get("stream"))
+        finally:
+            with state.lock:
+                state.in_flight -= 1
+
+    def _rate_limited(self) -> None:
+        state = self.server.state
+        with state.lock:
+            state.stats["rate_limited"] += 1
+        headers = {}
+        if state.config.retry_after_s is not None:
+            headers["Retry-After"] = f"{state.config.retry_after_s:g}"
+        self._send_json(429, _error_body(429, "Rate limit exceeded"), headers)
+
+    def _generate(self, response: Dict[str, Any]) -> None:
+        """Wait for the whole answer to be generated."""
+        tokens_per_s = self.server.state.config.tokens_per_s
+        if tokens_per_s > 0:
+            time.sleep(response["usage"]["output_tokens"] / tokens_per_s)
+
+    def _build_response(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        state = self.server.state
+        config = state.config
+        with state.lock:
+            response_id = f"resp_mock_{next(state.ids)}"
+
+        prompt = request_text(body)
+        text = answer(prompt, config.response_words)
+        output: List[Dict[str, Any]] = []
+        reasoning_tokens = 0
+        if config.reasoning:
+            reasoning = _filler(_text_rng(f"reasoning:{prompt}"), 20)
+            reasoning_tokens = count_tokens(reasoning)
+            output.append(
+                {
+                    "type": "reasoning",
+                    "id": f"rs_{response_id}",
+                    "summary": [],
+                    "content": [{"type": "reasoning_text", "text": reasoning}],
+                }
+            )
+        output.append(
+            {
+                "type": "message",
+                "id": f"msg_{response_id}",
+                "role": "assistant",
+                "status": "completed",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }
+        )
+
+        input_tokens = count_tokens(_prompt_text(body))
+        cached = min(state.cached_tokens(body), input_tokens)
+        output_tokens = count_tokens(text) + reasoning_tokens
+        cost = (
+            (input_tokens - cached) * config.input_cost
+            + cached * config.cached_input_cost
+            + output_tokens * config.output_cost
+        )
+        now = int(time.time())
+        return {
+            "id": response_id,
+            "object": "response",
+            "created_at": now,
+            "completed_at": now,
+            "status": "completed",
+            "model": body.get("model") or "mock",
+            "instructions": body.get("instructions"),
+            "output": output,
+            "usage": {
+                "input_tokens": input_tokens,
+                "input_tokens_details": {"cached_tokens": cached},
+                "output_tokens": output_tokens,
+                "output_tokens_details": {"reasoning_tokens": reasoning_tokens},
+                "total_tokens": input_tokens + output_tokens,
+                "cost": round(cost, 9),
+            },
+            "error": None,
+            "incomplete_details": None,
+            "metadata": {},
+            "tools": [],
+            "tool_choice": "auto",
+            "parallel_tool_calls": True,
+            "temperature": None,
+            "top_p": None,
+            "presence_penalty": None,
+            "frequency_penalty": None,
+        }
+
+    def _stream(self, response: Dict[str, Any]) -> None:
+        """Send the response as server-sent events, word by word."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        message = response["output"][-1]
+        text = message["content"][0]["text"]
+        pieces = re.findall(r"\S+\s*|\s+", text) or [text]
+        tokens_per_s = self.server.state.config.tokens_per_s
+        delay = (
+            response["usage"]["output_tokens"] / tokens_per_s / len(pieces)
+            if tokens_per_s > 0
+            else 0.0
+        )
+
+        sequence = itertools.count()
+        in_progress = {**response, "status": "in_progress", "output": [], "usage": None}
+        self._event({"type": "response.created", "response": in_progress}, sequence)
+        for piece in pieces:
+            self._event(
+                {
+                    "type": "response.output_text.delta",
+                    "item_id": message["id"],
+                    "output_index": len(response["output"]) - 1,
+                    "content_index": 0,
+                    "delta": piece,
+                    "logprobs": [],
+                },
+                sequence,
+            )
+            time.sleep(delay)
+        self._event({"type": "response.completed", "response": response}, sequence)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def _event(self, data: Dict[str, Any], sequence: Iterator[int]) -> None:
+        data["sequence_number"] = next(sequence)
+        payload = json.dumps(data)
+        self.wfile.write(f"event: {data['type']}\ndata: {payload}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+    def _send_json(
+        self, status: int, body: Dict[str, Any], headers: Dict[str, str] | None = None
+    ) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def _error_body(status: int, message: str) -> Dict[str, Any]:
+    return {"error": {"code": status, "message": message}}
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Accept bursts of concurrent connections from load tests
+    request_queue_size = 1024
+
+    def __init__(self, address: tuple[str, int], state: _State) -> None:
+        self.state = state
+        super().__init__(address, _Handler)
+
+
+@dataclass
+class MockServer:
+    """
+    A mock OpenRouter server, run in a background thread.
+
+    Use it as a context manager, or call :meth:`start` and :meth:`stop`:
+
+        with MockServer(MockServerConfig(latency_s=0.2)) as server:
+            game_config.client_pool["server_url"] = server.url
+            ...
+
+    Args:
+        config: Behavior of the server
+        host: Interface to listen on
+        port: Port to listen on (0 for a free port)
+    """
+
+    config: MockServerConfig = field(default_factory=MockServerConfig)
+    host: str = "127.0.0.1"
+    port: int = 0
+
+    def __post_init__(self) -> None:
+        self._state = _State(self.config)
+        self._httpd: _HTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """The API base URL to use as the client pool's ``server_url``."""
+        return f"http://{self.host}:{self.port}{API_PREFIX}"
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Request counts by outcome."""
+        with self._state.lock:
+            return dict(self._state.stats)
+
+    def start(self) -> "MockServer":
+        self._httpd = _HTTPServer((self.host, self.port), self._state)
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="mock-openrouter", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s:%(name)s:%(message)s",
+        datefmt="%H:%M:%S",
+    )
+
+    defaults = MockServerConfig()
+    parser = argparse.ArgumentParser(
+        description="Serve a local mock of OpenRouter's Responses endpoint"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument(
+        "--latency", choices=LATENCY_DISTRIBUTIONS, default=defaults.latency
+    )
+    for config_field in fields(MockServerConfig):
+        if config_field.name == "latency":
+            continue
+        flag = f"--{config_field.name.replace('_', '-')}"
+        default = getattr(defaults, config_field.name)
+        if isinstance(default, bool):
+            parser.add_argument(flag, action="store_true", default=default)
+        else:
+            value_type = float if isinstance(default, float) else int
+            parser.add_argument(flag, type=value_type, default=default)
+    args = parser.parse_args()
+
+    config = MockServerConfig(
+        **{f.name: getattr(args, f.name) for f in fields(MockServerConfig)}
+    )
+    server = MockServer(config, host=args.host, port=args.port)
+    server.start()
+    logger.info("Mock OpenRouter server listening on %s", server.url)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        logger.info("Served %s", server.stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,15 @@
-from typing import Callable
+from typing import Awaitable, Callable
 
 from ..round import RoundContext
-from .consolidate_memory import phase_consolidate_memory
-from .elimination import phase_elimination
-from .opponent_quips import phase_opponent_quips
-from .pitches import phase_pitches
-from .sidebars import phase_sidebars
-from .votes import phase_votes
+from .consolidate_memory import (
+    phase_consolidate_memory,
+    phase_consolidate_memory_async,
+)
+from .elimination import phase_elimination, phase_elimination_async
+from .opponent_quips import phase_opponent_quips, phase_opponent_quips_async
+from .pitches import phase_pitches, phase_pitches_async
+from .sidebars import phase_sidebars, phase_sidebars_async
+from .votes import phase_votes, phase_votes_async
 
 PHASE_REGISTRY: dict[str, Callable[[RoundContext], None]] = {
     "pitches": phase_pitches,
@@ -17,7 +20,19 @@ PHASE_REGISTRY: dict[str, Callable[[RoundContext], None]] = {
     "opponent_quips": phase_opponent_quips,
 }
 
+# Async variants used by GameEngine.play_async(). Phases registered only in
+# PHASE_REGISTRY still work there; they are run in a worker thread.
+ASYNC_PHASE_REGISTRY: dict[str, Callable[[RoundContext], Awaitable[None]]] = {
+    "pitches": phase_pitches_async,
+    "votes": phase_votes_async,
+    "elimination": phase_elimination_async,
+    "sidebars": phase_sidebars_async,
+    "consolidate_memory": phase_consolidate_memory_async,
+    "opponent_quips": phase_opponent_quips_async,
+}
+
 __all__ = [
+    "ASYNC_PHASE_REGISTRY",
     "PHASE_REGISTRY",
     "phase_pitches",
     "phase_votes",
@@ -1,14 +1,296 @@
+import asyncio
+import contextvars
 import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Generator
 
+from ..history import SegmentRef
+from ..player import ChoiceResponse, FreeResponse, Player
+from ..round import RoundContext
 
-def permute_player_ids(player_ids: list[str]) -> list[str]:
+
+def permute_player_ids(player_ids: list[str], rng: random.Random) -> list[str]:
     """
     Permute the player IDs in a random order.
 
     Args:
         players_ids: The list of player IDs to permute
+        rng: The game's random number generator (``RoundContext.rng``)
 
     Returns:
         list[str]: The permuted player IDs
     """
-    return random.sample(player_ids, k=len(player_ids))
+    return rng.sample(player_ids, k=len(player_ids))
+
+
+def render_player_context(
+    context: RoundContext, player: Player
+) -> tuple[str, list[str | SegmentRef]]:
+    """
+    Render a player's memory and visible history.
+
+    Args:
+        context: The round context
+        player: The player to render the context for
+
+    Returns:
+        tuple: (text, segments) - the context to send to the player, and the
+        same text split into prompt segments for History.add_event
+    """
+    player_id = player.config.player_id
+    memory_context = player.memory.render()
+    visible_events = context.history.render_for_player(player_id)
+    segments = context.history.render_segments_for_player(player_id)
+    if memory_context:
+        visible_events = f"{memory_context}\n\n{visible_events}"
+        segments = [memory_context, "\n\n", *segments]
+    return visible_events, segments
+
+
+@dataclass
+class PlayerCall:
+    """
+    A request for a player response, yielded by a phase's step generator.
+
+    Phases are written once as generators that yield ``PlayerCall`` objects and
+    receive the player's response back. :func:`drive_phase` answers them with
+    the blocking Player API and :func:`drive_phase_async` with the async one,
+    so the sync and async engines share the same game logic.
+
+    Args:
+        player: The player to prompt
+        system_prompt: The system prompt for the player
+        context: The rendered context (memory and visible history)
+        action: The action the player is asked to take
+        options: Valid choices for a choice response (None for free responses)
+        llm_instructions: Extra formatting instructions for AI players
+        on_delta: Optional callback for the response text as it streams in
+            (see History.delta_emitter, whose restart() streaming players
+            call before retrying); only used by streaming players
+    """
+
+    player: Player
+    system_prompt: str
+    context: str
+    action: str
+    options: list[str] | None = None
+    llm_instructions: str = ""
+    on_delta: Callable[[str], None] | None = None
+
+    def send(self) -> FreeResponse | ChoiceResponse:
+        """Answer the call with the player's blocking API."""
+        if self.options is None:
+            return self.player.free_response(
+                system_prompt=self.system_prompt,
+                context=self.context,
+                action=self.action,
+                llm_instructions=self.llm_instructions,
+                **self._stream_kwargs(),
+            )
+        return self.player.choice_response(
+            system_prompt=self.system_prompt,
+            context=self.context,
+            options=self.options,
+            action=self.action,
+            llm_instructions=self.llm_instructions,
+            **self._stream_kwargs(),
+        )
+
+    async def send_async(self) -> FreeResponse | ChoiceResponse:
+        """Answer the call with the player's async API."""
+        if self.options is None:
+            return await self.player.free_response_async(
+                system_prompt=self.system_prompt,
+                context=self.context,
+                action=self.action,
+                llm_instructions=self.llm_instructions,
+                **self._stream_kwargs(),
+            )
+        return await self.player.choice_response_async(
+            system_prompt=self.system_prompt,
+            context=self.context,
+            options=self.options,
+            action=self.action,
+            llm_instructions=self.llm_instructions,
+            **self._stream_kwargs(),
+        )
+
+    @property
+    def interactive(self) -> bool:
+        """Whether a human answers the call."""
+        return self.player.config.player_type == "human"
+
+    def _stream_kwargs(self) -> dict:
+        if self.on_delta is None or not self.player.stream:
+            return {}
+        return {"on_delta": self.on_delta}
+
+
+@dataclass
+class CallBatch:
+    """
+    Independent player calls that may be answered concurrently.
+
+    A phase yields a ``CallBatch`` when no call in it depends on another
+    call's response, and receives the responses back as a list in the order
+    of ``calls``, however they were scheduled. Calls answered by humans are
+    never made concurrently: they are answered one at a time, in order,
+    after the other calls.
+
+    Args:
+        calls: The player calls to answer
+        max_concurrency: Maximum number of calls in flight at once
+            (1 answers them one at a time, 0 means no limit)
+    """
+
+    calls: list[PlayerCall]
+    max_concurrency: int = 1
+
+    def send(self) -> list[FreeResponse | ChoiceResponse]:
+        """Answer the calls with the blocking API, using a thread pool."""
+        concurrent = [call for call in self.calls if not call.interactive]
+        workers = self._workers(len(concurrent))
+        if workers <= 1:
+            return [call.send() for call in self.calls]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Each call runs in a copy of the context, so a phase deadline
+            # (see retry.phase_deadline) applies in the worker threads too
+            futures = [
+                pool.submit(contextvars.copy_context().run, PlayerCall.send, call)
+                for call in concurrent
+            ]
+            answered = iter([future.result() for future in futures])
+        return [
+            call.send() if call.interactive else next(answered) for call in self.calls
+        ]
+
+    async def send_async(self) -> list[FreeResponse | ChoiceResponse]:
+        """Answer the calls with the async API, bounded by a semaphore."""
+        concurrent = [call for call in self.calls if not call.interactive]
+        workers = self._workers(len(concurrent))
+        if workers <= 1:
+            return [await call.send_async() for call in self.calls]
+
+        semaphore = asyncio.Semaphore(workers)
+
+        async def bounded(call: PlayerCall) -> FreeResponse | ChoiceResponse:
+            async with semaphore:
+                return await call.send_async()
+
+        answered = iter(await asyncio.gather(*(bounded(c) for c in concurrent)))
+        return [
+            await call.send_async() if call.interactive else next(answered)
+            for call in self.calls
+        ]
+
+    def _workers(self, num_calls: int) -> int:
+        if self.max_concurrency < 0:
+            raise ValueError(
+                f"max_concurrency must be >= 0, got {self.max_concurrency}"
+            )
+        if self.max_concurrency == 0:
+            return num_calls
+        return min(self.max_concurrency, num_calls)
+
+
+PhaseSteps = Generator[
+    PlayerCall | CallBatch,
+    FreeResponse | ChoiceResponse | list[FreeResponse | ChoiceResponse],
+    None,
+]
+
+
+def settle_memory(
+    context: RoundContext, player_ids: list[str], max_concurrency: int = 0
+) -> PhaseSteps:
+    """
+    Consolidate the deferred memory of players about to be prompted.
+
+    Phases that may prompt eliminated players run this first (``yield
+    from``). Every player with deferred rounds gets one consolidation call,
+    and the calls are answered as one batch.
+
+    Args:
+        context: The round context
+        player_ids: The players the phase will prompt
+        max_concurrency: Number of consolidation calls in flight at once
+            (0 means no limit)
+
+    Returns:
+        None
+    """
+    pending = []
+    for player_id in player_ids:
+        player = next(p for p in context.players if p.config.player_id == player_id)
+        request = player.memory.prepare_deferred(
+            player=player,
+            history=context.history,
+            round_index=context.round_index,
+            rules_prompt=context.rules_prompt,
+        )
+        if request is not None:
+            context.logger.info(
+                f"Player {player_id} is consolidating rounds {request.rounds}"
+            )
+            pending.append((player, request))
+
+    if not pending:
+        return
+
+    responses = yield CallBatch(
+        calls=[
+            PlayerCall(
+                player=player,
+                system_prompt=request.system_prompt,
+                context=request.context,
+                action=request.action,
+            )
+            for player, request in pending
+        ],
+        max_concurrency=max_concurrency,
+    )
+
+    for (player, request), response in zip(pending, responses):
+        player.memory.commit_consolidation(
+            player=player,
+            history=context.history,
+            request=request,
+            response=response,
+        )
+
+
+def drive_phase(steps: PhaseSteps) -> None:
+    """
+    Run a phase step generator to completion using the blocking Player API.
+
+    Args:
+        steps: The phase step generator
+
+    Returns:
+        None
+    """
+    try:
+        call = next(steps)
+        while True:
+            call = steps.send(call.send())
+    except StopIteration:
+        pass
+
+
+async def drive_phase_async(steps: PhaseSteps) -> None:
+    """
+    Run a phase step generator to completion using the async Player API.
+
+    Args:
+        steps: The phase step generator
+
+    Returns:
+        None
+    """
+    try:
+        call = next(steps)
+        while True:
+            call = steps.send(await call.send_async())
+    except StopIteration:
+        pass
@@ -1,32 +1,175 @@
+from ..memory import ConsolidationRequest
+from ..player import Player
 from ..round import RoundContext
-from .common import permute_player_ids
+from .common import (
+    CallBatch,
+    PhaseSteps,
+    PlayerCall,
+    drive_phase,
+    drive_phase_async,
+    permute_player_ids,
+)
 
 
-def phase_consolidate_memory(context: RoundContext) -> None:
+def phase_consolidate_memory(
+    context: RoundContext, *, max_concurrency: int = 1
+) -> None:
     """
     Each player consolidates events into memory according to their
     configured strategy.
 
     Runs for all players (active and eliminated) to ensure uniform
-    context management.
+    context management. Strategies may defer the rounds of eliminated
+    players (see MemoryStrategy.defer) until they are next prompted.
 
     Args:
         context: The round context
+        max_concurrency: Number of consolidation calls in flight at once
+            (1 consolidates one player at a time, 0 means no limit). Results
+            are committed in the same permuted order either way. Players
+            whose strategies do not support batching (see
+            MemoryStrategy.supports_batching) consolidate one at a time
+            first.
 
     Returns:
         None
     """
+    players = _consolidating_players(context)
+    batched: list[Player] = []
+    if max_concurrency != 1:
+        batched = [player for player in players if player.memory.supports_batching]
+        players = [player for player in players if not player.memory.supports_batching]
+    for player in players:
+        context.logger.info(f"Player {player.config.player_id} is consolidating memory")
+        player.memory.consolidate(
+            player=player,
+            history=context.history,
+            round_index=context.round_index,
+            rules_prompt=context.rules_prompt,
+        )
+    if batched:
+        drive_phase(_consolidate_batched(context, batched, max_concurrency))
+
+
+async def phase_consolidate_memory_async(
+    context: RoundContext, *, max_concurrency: int = 1
+) -> None:
+    """Async variant of :func:`phase_consolidate_memory`."""
+    players = _consolidating_players(context)
+    batched: list[Player] = []
+    if max_concurrency != 1:
+        batched = [player for player in players if player.memory.supports_batching]
+        players = [player for player in players if not player.memory.supports_batching]
+    for player in players:
+        context.logger.info(f"Player {player.config.player_id} is consolidating memory")
+        await player.memory.consolidate_async(
+            player=player,
+            history=context.history,
+            round_index=context.round_index,
+            rules_prompt=context.rules_prompt,
+        )
+    if batched:
+        await drive_phase_async(_consolidate_batched(context, batched, max_concurrency))
+
+
+def _consolidating_players(context: RoundContext) -> list[Player]:
+    """All players in the permuted order, except those deferring this round."""
     all_player_ids = context.active_player_ids + context.eliminated_player_ids
 
-    for player_id in permute_player_ids(all_player_ids):
+    players: list[Player] = []
+    for player_id in permute_player_ids(all_player_ids, context.rng):
         player = next(
             player for player in context.players if player.config.player_id == player_id
         )
+        if not _deferred(context, player):
+            players.append(player)
+    return players
+
+
+def _consolidate_batched(
+    context: RoundContext, players: list[Player], max_concurrency: int
+) -> PhaseSteps:
+    """
+    Prepare the consolidation of players whose strategies support batching,
+    answer the LLM calls as one batch, then commit the results in order.
+
+    Preparing only reads events still visible to that player, and committing
+    only hides events from that player, so one player's commit never changes
+    another player's request. Summaries shared by several players (see
+    MemoryStrategy.prepare_shared) are requested once, in an earlier batch.
+    """
+    shared: dict[str, tuple[Player, ConsolidationRequest]] = {}
+    for player in players:
+        request = player.memory.prepare_shared(
+            player=player,
+            history=context.history,
+            round_index=context.round_index,
+            rules_prompt=context.rules_prompt,
+        )
+        if request is not None and request.shared_key not in shared:
+            shared[request.shared_key] = (player, request)
+
+    if shared:
+        yield from _answer_and_commit(
+            context, list(shared.values()), max_concurrency, shared=True
+        )
 
+    pending: list[tuple[Player, ConsolidationRequest]] = []
+    for player in players:
+        player_id = player.config.player_id
         context.logger.info(f"Player {player_id} is consolidating memory")
-        player.memory.consolidate(
+        request = player.memory.prepare_consolidation(
             player=player,
             history=context.history,
             round_index=context.round_index,
             rules_prompt=context.rules_prompt,
         )
+        if request is not None:
+            pending.append((player, request))
+
+    yield from _answer_and_commit(context, pending, max_concurrency)
+
+
+def _answer_and_commit(
+    context: RoundContext,
+    pending: list[tuple[Player, ConsolidationRequest]],
+    max_concurrency: int,
+    shared: bool = False,
+) -> PhaseSteps:
+    """Answer consolidation calls as one batch and commit them in order."""
+    responses = yield CallBatch(
+        calls=[
+            PlayerCall(
+                player=player,
+                system_prompt=request.system_prompt,
+                context=request.context,
+                action=request.action,
+            )
+            for player, request in pending
+        ],
+        max_concurrency=max_concurrency,
+    )
+
+    for (player, request), response in zip(pending, responses):
+        commit = (
+            player.memory.commit_shared
+            if shared
+            else player.memory.commit_consolidation
+        )
+        commit(
+            player=player,
+            history=context.history,
+            request=request,
+            response=response,
+        )
+
+
+def _deferred(context: RoundContext, player: Player) -> bool:
+    """Whether an eliminated player's strategy defers this round."""
+    player_id = player.config.player_id
+    if player_id not in context.eliminated_player_ids:
+        return False
+    if not player.memory.defer(context.round_index):
+        return False
+    context.logger.info(f"Player {player_id} defers memory consolidation")
+    return True
@@ -43,3 +43,8 @@ def phase_elimination(context: RoundContext) -> None:
         visibility=context.history.player_ids,
         active_visibility=context.history.player_ids.copy(),
     )
+
+
+async def phase_elimination_async(context: RoundContext) -> None:
+    """Async variant of :func:`phase_elimination` (no player calls)."""
+    phase_elimination(context)
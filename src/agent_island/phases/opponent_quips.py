@@ -1,20 +1,59 @@
 import re
 
+from ..prompts import build_system_prompt
 from ..round import RoundContext
-from .common import permute_player_ids
+from .common import (
+    CallBatch,
+    PhaseSteps,
+    PlayerCall,
+    drive_phase,
+    drive_phase_async,
+    permute_player_ids,
+    render_player_context,
+    settle_memory,
+)
 
 QUIP_RE = re.compile(
     r'<quip\s+player="([^"]+)">(.*?)</quip>', re.IGNORECASE | re.DOTALL
 )
 
 
-def phase_opponent_quips(context: RoundContext) -> None:
+def phase_opponent_quips(context: RoundContext, *, max_concurrency: int = 0) -> None:
     """
     Each AI player writes a short, playful quip about every other player's
     play style. One event is emitted per quip for easy downstream filtering.
+
+    Every player writes from the history as it stood when the phase began,
+    so the quip calls are independent and can be dispatched together (see
+    max_concurrency); the quips are recorded in the permuted player order.
+
+    Args:
+        context: The round context
+        max_concurrency: Number of quip calls in flight at once (0, the
+            default, dispatches all of them at once; 1 collects them one at
+            a time)
+
+    Returns:
+        None
     """
+    drive_phase(_opponent_quips(context, max_concurrency=max_concurrency))
+
+
+async def phase_opponent_quips_async(
+    context: RoundContext, *, max_concurrency: int = 0
+) -> None:
+    """Async variant of :func:`phase_opponent_quips`."""
+    await drive_phase_async(_opponent_quips(context, max_concurrency=max_concurrency))
+
 
-    for player_id in permute_player_ids(context.history.player_ids):
+def _opponent_quips(context: RoundContext, max_concurrency: int) -> PhaseSteps:
+    # Eliminated players may have deferred memory to consolidate first
+    yield from settle_memory(context, context.history.player_ids, max_concurrency)
+
+    calls: list[PlayerCall] = []
+    call_segments: list[list[str]] = []
+
+    for player_id in permute_player_ids(context.history.player_ids, context.rng):
         player = next(
             player for player in context.players if player.config.player_id == player_id
         )
@@ -24,18 +63,11 @@ def phase_opponent_quips(context: RoundContext) -> None:
 
         context.logger.info(f"Player {player.config.player_id} is writing quips")
 
-        system_prompt = f"""
-{context.rules_prompt}
-
-<character>
-{player.config.character_prompt}
-</character>
-        """
+        system_prompt = build_system_prompt(
+            context.rules_prompt, player.config.character_prompt
+        )
 
-        memory_context = player.memory.render()
-        visible_events = context.history.render_for_player(player.config.player_id)
-        if memory_context:
-            visible_events = f"{memory_context}\n\n{visible_events}"
+        visible_events, context_segments = render_player_context(context, player)
 
         opponent_ids = [
             pid for pid in context.history.player_ids if pid != player.config.player_id
@@ -53,11 +85,21 @@ def phase_opponent_quips(context: RoundContext) -> None:
             "Write one `<quip>` tag per opponent."
         )
 
-        response = player.free_response(
-            system_prompt=system_prompt,
-            context=visible_events,
-            action=action,
+        calls.append(
+            PlayerCall(
+                player=player,
+                system_prompt=system_prompt,
+                context=visible_events,
+                action=action,
+            )
         )
+        call_segments.append(context_segments)
+
+    responses = yield CallBatch(calls=calls, max_concurrency=max_concurrency)
+
+    # Record quips in the permuted order, regardless of completion order
+    for call, context_segments, response in zip(calls, call_segments, responses):
+        player = call.player
 
         quips = QUIP_RE.findall(response.text)
 
@@ -68,9 +110,15 @@ def phase_opponent_quips(context: RoundContext) -> None:
             continue
 
         if player.config.player_type == "human":
-            prompt = action
+            prompt = call.action
         else:
-            prompt = f"{system_prompt}\n\n{visible_events}\n\n{action}"
+            prompt = [
+                call.system_prompt,
+                "\n\n",
+                *context_segments,
+                "\n\n",
+                call.action,
+            ]
 
         for i, (target_id, quip_text) in enumerate(quips):
             context.history.add_event(
@@ -1,5 +1,13 @@
+from ..prompts import build_system_prompt
 from ..round import RoundContext
-from .common import permute_player_ids
+from .common import (
+    PhaseSteps,
+    PlayerCall,
+    drive_phase,
+    drive_phase_async,
+    permute_player_ids,
+    render_player_context,
+)
 
 
 def phase_pitches(context: RoundContext) -> None:
@@ -12,6 +20,15 @@ def phase_pitches(context: RoundContext) -> None:
     Returns:
         None
     """
+    drive_phase(_pitches(context))
+
+
+async def phase_pitches_async(context: RoundContext) -> None:
+    """Async variant of :func:`phase_pitches`."""
+    await drive_phase_async(_pitches(context))
+
+
+def _pitches(context: RoundContext) -> PhaseSteps:
 
     # The objective for the pitch depends on the round type
     if context.round_type == "final":
@@ -37,7 +54,7 @@ def phase_pitches(context: RoundContext) -> None:
     )
 
     # Permute the player IDs to avoid order effects
-    for player_id in permute_player_ids(context.active_player_ids):
+    for player_id in permute_player_ids(context.active_player_ids, context.rng):
         # Get the player object from the player ID
         player = next(
             player for player in context.players if player.config.player_id == player_id
@@ -45,38 +62,36 @@ def phase_pitches(context: RoundContext) -> None:
 
         # Elicit the pitch from the player
         context.logger.info(f"Player {player.config.player_id} is making their pitch")
-        memory_context = player.memory.render()
-        visible_events = context.history.render_for_player(player.config.player_id)
-        if memory_context:
-            visible_events = f"{memory_context}\n\n{visible_events}"
+        visible_events, context_segments = render_player_context(context, player)
         action = (
             f"Please make your pitch for why you should {outcome}. "
             f"The remaining players are: {context.active_player_ids}. "
             f"Other players will be able to see your pitch."
         )
 
-        system_prompt = f"""
-{context.rules_prompt}
-
-<character>
-{player.config.character_prompt}
-</character>
-        """
+        system_prompt = build_system_prompt(
+            context.rules_prompt, player.config.character_prompt
+        )
 
-        response = player.free_response(
+        heading = f"Player {player.config.player_id}'s Pitch"
+        response = yield PlayerCall(
+            player=player,
             system_prompt=system_prompt,
             context=visible_events,
             action=action,
+            on_delta=context.history.delta_emitter(
+                context.round_index, heading, context.history.player_ids
+            ),
         )
 
         if player.config.player_type == "human":
             prompt = action
         else:
-            prompt = f"{system_prompt}\n\n{visible_events}\n\n{action}"
+            prompt = [system_prompt, "\n\n", *context_segments, "\n\n", action]
 
         context.history.add_event(
             round_index=context.round_index,
-            heading=f"Player {player.config.player_id}'s Pitch",
+            heading=heading,
             role=f"player {player.config.player_id}",
             prompt=prompt,
             content=response.text,
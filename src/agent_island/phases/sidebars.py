@@ -1,5 +1,17 @@
+from ..player import ChoiceResponse, FreeResponse
+from ..prompts import build_system_prompt
 from ..round import RoundContext
-from .common import permute_player_ids
+from .common import (
+    CallBatch,
+    PhaseSteps,
+    PlayerCall,
+    drive_phase,
+    drive_phase_async,
+    permute_player_ids,
+    render_player_context,
+)
+
+SIDEBAR_MODES = ("sequential", "simultaneous")
 
 
 def phase_sidebars(
@@ -7,23 +19,102 @@ def phase_sidebars(
     *,
     num_exchanges: int = 1,
     messages_per_exchange: int = 2,
+    mode: str = "sequential",
+    max_concurrency: int = 0,
 ) -> None:
     """
     Conduct private 1-on-1 sidebar conversations.
 
-    For each exchange, every active player selects a partner and
-    immediately has a private conversation with them before the
+    In "sequential" mode, for each exchange, every active player selects a
+    partner and immediately has a private conversation with them before the
     next player selects.
 
+    In "simultaneous" mode, every active player selects a partner at once.
+    The conversations are then grouped into waves in which no player takes
+    part in two conversations, and the conversations of a wave advance
+    together, one message at a time. A player's conversations keep the
+    order of the selections.
+
     Args:
         context: The round context
         num_exchanges: Number of select-and-converse cycles
         messages_per_exchange: Total messages exchanged per
             conversation (alternating between the two players)
+        mode: "sequential" or "simultaneous"
+        max_concurrency: Number of calls in flight at once in simultaneous
+            mode (1 answers them one at a time, 0 means no limit)
 
     Returns:
         None
     """
+    drive_phase(
+        _sidebars(
+            context,
+            num_exchanges=num_exchanges,
+            messages_per_exchange=messages_per_exchange,
+            mode=mode,
+            max_concurrency=max_concurrency,
+        )
+    )
+
+
+async def phase_sidebars_async(
+    context: RoundContext,
+    *,
+    num_exchanges: int = 1,
+    messages_per_exchange: int = 2,
+    mode: str = "sequential",
+    max_concurrency: int = 0,
+) -> None:
+    """Async variant of :func:`phase_sidebars`."""
+    await drive_phase_async(
+        _sidebars(
+            context,
+            num_exchanges=num_exchanges,
+            messages_per_exchange=messages_per_exchange,
+            mode=mode,
+            max_concurrency=max_concurrency,
+        )
+    )
+
+
+def schedule_waves(pairs: list[tuple[str, str]]) -> list[list[tuple[str, str]]]:
+    """
+    Group sidebar conversations into waves of disjoint player pairs.
+
+    Each conversation goes into the earliest wave after the last wave of
+    either of its players, so no player is in two conversations of a wave
+    and every player's conversations keep their order in ``pairs``.
+
+    Args:
+        pairs: (initiator ID, target ID) of each conversation, in order
+
+    Returns:
+        list of waves, each a list of pairs in their order in ``pairs``
+    """
+    waves: list[list[tuple[str, str]]] = []
+    next_wave: dict[str, int] = {}
+    for initiator_id, target_id in pairs:
+        wave = max(next_wave.get(initiator_id, 0), next_wave.get(target_id, 0))
+        if wave == len(waves):
+            waves.append([])
+        waves[wave].append((initiator_id, target_id))
+        next_wave[initiator_id] = next_wave[target_id] = wave + 1
+    return waves
+
+
+def _sidebars(
+    context: RoundContext,
+    num_exchanges: int,
+    messages_per_exchange: int,
+    mode: str,
+    max_concurrency: int,
+) -> PhaseSteps:
+    if mode not in SIDEBAR_MODES:
+        raise ValueError(
+            f"Unknown sidebars mode {mode!r}, expected one of {SIDEBAR_MODES}"
+        )
+
     active = context.active_player_ids
     if len(active) < 2:
         context.logger.info("Not enough active players for sidebars")
@@ -42,6 +133,8 @@ def phase_sidebars(
             f"consisting of {messages_per_exchange} "
             f"{'message' if messages_per_exchange == 1 else 'messages'}."
         )
+    if mode == "simultaneous":
+        exchange_text += " Players choose their partners at the same time."
 
     context.history.narrate(
         round_index=context.round_index,
@@ -56,77 +149,21 @@ def phase_sidebars(
     )
 
     for exchange in range(num_exchanges):
-        for player_id in permute_player_ids(active):
-            player = next(p for p in context.players if p.config.player_id == player_id)
-
-            candidates = permute_player_ids([pid for pid in active if pid != player_id])
-
-            memory_context = player.memory.render()
-            visible_events = context.history.render_for_player(player_id)
-            if memory_context:
-                visible_events = f"{memory_context}\n\n{visible_events}"
-
-            action = (
-                "Choose one player for a private sidebar conversation. "
-                f"Choose from: {candidates}."
-            )
-
-            llm_instructions = (
-                "Your choice must be of the following format: "
-                "'<choice>PLAYER ID</choice>'.\n\n"
-                "Example: '<choice>X</choice>' is valid, but "
-                "'<choice>[X]</choice>' and '<choice>XY</choice>' are "
-                "not. Here, we assume X and Y are player IDs."
-            )
-
-            system_prompt = f"""
-{context.rules_prompt}
-
-<character>
-{player.config.character_prompt}
-</character>
-"""
-
-            context.logger.info(
-                "Player %s is choosing a sidebar partner (exchange %d/%d)",
-                player_id,
-                exchange + 1,
-                num_exchanges,
+        if mode == "simultaneous":
+            yield from _simultaneous_exchange(
+                context, exchange, num_exchanges, messages_per_exchange, max_concurrency
             )
+            continue
 
-            response = player.choice_response(
-                system_prompt=system_prompt,
-                context=visible_events,
-                options=candidates,
-                action=action,
-                llm_instructions=llm_instructions,
-            )
-
-            metadata = dict(response.metadata) if response.metadata else {}
-            metadata["sidebar_selection"] = response.selected
-
-            if player.config.player_type == "human":
-                prompt = action
-            else:
-                prompt = (
-                    f"{system_prompt}\n\n{visible_events}"
-                    f"\n\n{action}\n\n{llm_instructions}"
-                )
-
-            context.history.add_event(
-                round_index=context.round_index,
-                heading=f"Player {player_id}'s Sidebar Selection",
-                role=f"player {player_id}",
-                prompt=prompt,
-                content=response.text,
-                reasoning=response.reasoning,
-                metadata=metadata or None,
-                visibility=[player_id],
-                active_visibility=[player_id],
+        for player_id in permute_player_ids(active, context.rng):
+            call, context_segments = _selection_call(
+                context, player_id, exchange, num_exchanges
             )
+            response = yield call
+            _record_selection(context, call, context_segments, response)
 
             if response.selected:
-                _run_sidebar(
+                yield from _run_sidebar(
                     context=context,
                     initiator_id=player_id,
                     target_id=response.selected,
@@ -138,13 +175,174 @@ def phase_sidebars(
                 )
 
 
+def _simultaneous_exchange(
+    context: RoundContext,
+    exchange: int,
+    num_exchanges: int,
+    messages_per_exchange: int,
+    max_concurrency: int,
+) -> PhaseSteps:
+    """Run one exchange with concurrent selections and waves of sidebars."""
+    # Selections are private, so no player's choice depends on another's and
+    # all of them can be collected at once
+    calls: list[PlayerCall] = []
+    call_segments: list[list[str]] = []
+    for player_id in permute_player_ids(context.active_player_ids, context.rng):
+        call, context_segments = _selection_call(
+            context, player_id, exchange, num_exchanges
+        )
+        calls.append(call)
+        call_segments.append(context_segments)
+
+    responses = yield CallBatch(calls=calls, max_concurrency=max_concurrency)
+
+    # Record selections in the permuted order, regardless of completion order
+    pairs: list[tuple[str, str]] = []
+    for call, context_segments, response in zip(calls, call_segments, responses):
+        player_id = call.player.config.player_id
+        _record_selection(context, call, context_segments, response)
+        if response.selected:
+            pairs.append((player_id, response.selected))
+        else:
+            context.logger.warning("Sidebar selection failed for player %s", player_id)
+
+    for wave_index, wave in enumerate(schedule_waves(pairs)):
+        context.logger.info(
+            "Sidebar wave %d (exchange %d/%d): %s",
+            wave_index + 1,
+            exchange + 1,
+            num_exchanges,
+            ", ".join(f"{a} & {b}" for a, b in wave),
+        )
+        for initiator_id, target_id in wave:
+            _open_sidebar(context, initiator_id, target_id)
+
+        # The players of a wave are disjoint and sidebars are private, so the
+        # messages of one conversation never appear in another's context
+        for msg_idx in range(messages_per_exchange):
+            messages = [
+                _message_call(
+                    context, initiator_id, target_id, msg_idx, messages_per_exchange
+                )
+                for initiator_id, target_id in wave
+            ]
+            responses = yield CallBatch(
+                calls=[call for call, _ in messages], max_concurrency=max_concurrency
+            )
+            for (initiator_id, target_id), (call, context_segments), response in zip(
+                wave, messages, responses
+            ):
+                _record_message(
+                    context, initiator_id, target_id, call, context_segments, response
+                )
+
+
+def _selection_call(
+    context: RoundContext, player_id: str, exchange: int, num_exchanges: int
+) -> tuple[PlayerCall, list[str]]:
+    """Build a player's sidebar partner selection call."""
+    player = next(p for p in context.players if p.config.player_id == player_id)
+
+    candidates = permute_player_ids(
+        [pid for pid in context.active_player_ids if pid != player_id], context.rng
+    )
+
+    visible_events, context_segments = render_player_context(context, player)
+
+    action = (
+        "Choose one player for a private sidebar conversation. "
+        f"Choose from: {candidates}."
+    )
+
+    llm_instructions = (
+        "Your choice must be of the following format: "
+        "'<choice>PLAYER ID</choice>'.\n\n"
+        "Example: '<choice>X</choice>' is valid, but "
+        "'<choice>[X]</choice>' and '<choice>XY</choice>' are "
+        "not. Here, we assume X and Y are player IDs."
+    )
+
+    system_prompt = build_system_prompt(
+        context.rules_prompt, player.config.character_prompt
+    )
+
+    context.logger.info(
+        "Player %s is choosing a sidebar partner (exchange %d/%d)",
+        player_id,
+        exchange + 1,
+        num_exchanges,
+    )
+
+    call = PlayerCall(
+        player=player,
+        system_prompt=system_prompt,
+        context=visible_events,
+        options=candidates,
+        action=action,
+        llm_instructions=llm_instructions,
+    )
+    return call, context_segments
+
+
+def _record_selection(
+    context: RoundContext,
+    call: PlayerCall,
+    context_segments: list[str],
+    response: ChoiceResponse,
+) -> None:
+    """Add a player's sidebar selection to the history."""
+    player_id = call.player.config.player_id
+
+    metadata = dict(response.metadata) if response.metadata else {}
+    metadata["sidebar_selection"] = response.selected
+
+    if call.player.config.player_type == "human":
+        prompt = call.action
+    else:
+        prompt = [
+            call.system_prompt,
+            "\n\n",
+            *context_segments,
+            "\n\n",
+            call.action,
+            "\n\n",
+            call.llm_instructions,
+        ]
+
+    context.history.add_event(
+        round_index=context.round_index,
+        heading=f"Player {player_id}'s Sidebar Selection",
+        role=f"player {player_id}",
+        prompt=prompt,
+        content=response.text,
+        reasoning=response.reasoning,
+        metadata=metadata or None,
+        visibility=[player_id],
+        active_visibility=[player_id],
+    )
+
+
 def _run_sidebar(
     context: RoundContext,
     initiator_id: str,
     target_id: str,
     messages_per_exchange: int,
-) -> None:
+) -> PhaseSteps:
     """Run a private sidebar conversation between two players."""
+    _open_sidebar(context, initiator_id, target_id)
+
+    for msg_idx in range(messages_per_exchange):
+        call, context_segments = _message_call(
+            context, initiator_id, target_id, msg_idx, messages_per_exchange
+        )
+        response = yield call
+        _record_message(
+            context, initiator_id, target_id, call, context_segments, response
+        )
+
+
+def _open_sidebar(context: RoundContext, initiator_id: str, target_id: str) -> None:
+    """Announce a sidebar conversation to its two players."""
     pair_visibility = [initiator_id, target_id]
 
     context.history.narrate(
@@ -158,78 +356,101 @@ def _run_sidebar(
         active_visibility=pair_visibility.copy(),
     )
 
+
+def _message_heading(initiator_id: str, target_id: str, speaker_id: str) -> str:
+    return (
+        f"Sidebar between {initiator_id} & {target_id}. Player {speaker_id}'s message"
+    )
+
+
+def _message_call(
+    context: RoundContext,
+    initiator_id: str,
+    target_id: str,
+    msg_idx: int,
+    messages_per_exchange: int,
+) -> tuple[PlayerCall, list[str]]:
+    """Build the call for one message of a sidebar conversation."""
     # Alternate speakers, starting with the initiator
     speakers = [initiator_id, target_id]
+    speaker_id = speakers[msg_idx % 2]
+    listener_id = speakers[(msg_idx + 1) % 2]
 
-    for msg_idx in range(messages_per_exchange):
-        speaker_id = speakers[msg_idx % 2]
-        listener_id = speakers[(msg_idx + 1) % 2]
-
-        player = next(p for p in context.players if p.config.player_id == speaker_id)
-
-        memory_context = player.memory.render()
-        visible_events = context.history.render_for_player(speaker_id)
-        if memory_context:
-            visible_events = f"{memory_context}\n\n{visible_events}"
-
-        is_last = msg_idx == messages_per_exchange - 1
-        if is_last:
-            message_note = (
-                f"This is the final message "
-                f"({msg_idx + 1}/{messages_per_exchange}). "
-                f"No more messages will be sent after this."
-            )
-        else:
-            message_note = f"This is message {msg_idx + 1}/{messages_per_exchange}."
-
-        action = (
-            f"You are in a private sidebar conversation "
-            f"with Player {listener_id}. "
-            f"Only you and Player {listener_id} can see "
-            f"this conversation. "
-            f"{message_note} "
-            f"Please send a message."
+    player = next(p for p in context.players if p.config.player_id == speaker_id)
+
+    visible_events, context_segments = render_player_context(context, player)
+
+    is_last = msg_idx == messages_per_exchange - 1
+    if is_last:
+        message_note = (
+            f"This is the final message "
+            f"({msg_idx + 1}/{messages_per_exchange}). "
+            f"No more messages will be sent after this."
         )
+    else:
+        message_note = f"This is message {msg_idx + 1}/{messages_per_exchange}."
+
+    action = (
+        f"You are in a private sidebar conversation "
+        f"with Player {listener_id}. "
+        f"Only you and Player {listener_id} can see "
+        f"this conversation. "
+        f"{message_note} "
+        f"Please send a message."
+    )
 
-        system_prompt = f"""
-{context.rules_prompt}
+    system_prompt = build_system_prompt(
+        context.rules_prompt, player.config.character_prompt
+    )
 
-<character>
-{player.config.character_prompt}
-</character>
-"""
+    context.logger.info(
+        "Sidebar between %s & %s: Player %s's message (%d/%d)",
+        initiator_id,
+        target_id,
+        speaker_id,
+        msg_idx + 1,
+        messages_per_exchange,
+    )
 
-        context.logger.info(
-            "Sidebar between %s & %s: Player %s's message (%d/%d)",
-            initiator_id,
-            target_id,
-            speaker_id,
-            msg_idx + 1,
-            messages_per_exchange,
-        )
+    call = PlayerCall(
+        player=player,
+        system_prompt=system_prompt,
+        context=visible_events,
+        action=action,
+        on_delta=context.history.delta_emitter(
+            context.round_index,
+            _message_heading(initiator_id, target_id, speaker_id),
+            [initiator_id, target_id],
+        ),
+    )
+    return call, context_segments
 
-        response = player.free_response(
-            system_prompt=system_prompt,
-            context=visible_events,
-            action=action,
-        )
 
-        if player.config.player_type == "human":
-            prompt = action
-        else:
-            prompt = f"{system_prompt}\n\n{visible_events}\n\n{action}"
-
-        context.history.add_event(
-            round_index=context.round_index,
-            heading=(
-                f"Sidebar between {initiator_id} & {target_id}. "
-                f"Player {speaker_id}'s message"
-            ),
-            role=f"player {speaker_id}",
-            prompt=prompt,
-            content=response.text,
-            reasoning=response.reasoning,
-            metadata=response.metadata,
-            visibility=pair_visibility,
-            active_visibility=pair_visibility.copy(),
-        )
+def _record_message(
+    context: RoundContext,
+    initiator_id: str,
+    target_id: str,
+    call: PlayerCall,
+    context_segments: list[str],
+    response: FreeResponse,
+) -> None:
+    """Add one message of a sidebar conversation to the history."""
+    pair_visibility = [initiator_id, target_id]
+    speaker_id = call.player.config.player_id
+
+    if call.player.config.player_type == "human":
+        prompt = call.action
+    else:
+        prompt = [call.system_prompt, "\n\n", *context_segments, "\n\n", call.action]
+
+    context.history.add_event(
+        round_index=context.round_index,
+        heading=_message_heading(initiator_id, target_id, speaker_id),
+        role=f"player {speaker_id}",
+        prompt=prompt,
+        content=response.text,
+        reasoning=response.reasoning,
+        metadata=response.metadata,
+        visibility=pair_visibility,
+        active_visibility=pair_visibility.copy(),
+    )
@@ -1,19 +1,39 @@
-import random
-
+from ..prompts import build_system_prompt
 from ..round import RoundContext
-from .common import permute_player_ids
-
-
-def phase_votes(context: RoundContext) -> None:
+from .common import (
+    CallBatch,
+    PhaseSteps,
+    PlayerCall,
+    drive_phase,
+    drive_phase_async,
+    permute_player_ids,
+    render_player_context,
+    settle_memory,
+)
+
+
+def phase_votes(context: RoundContext, *, max_concurrency: int = 1) -> None:
     """
     Conduct a round phase of votes
 
     Args:
         context: The round context
+        max_concurrency: Number of ballots collected at once (1 collects them
+            one at a time, 0 dispatches all ballots at once). Ballots are
+            recorded in the same permuted order either way.
 
     Returns:
         None
     """
+    drive_phase(_votes(context, max_concurrency=max_concurrency))
+
+
+async def phase_votes_async(context: RoundContext, *, max_concurrency: int = 1) -> None:
+    """Async variant of :func:`phase_votes`."""
+    await drive_phase_async(_votes(context, max_concurrency=max_concurrency))
+
+
+def _votes(context: RoundContext, max_concurrency: int) -> PhaseSteps:
     # Initialize the vote tally
     vote_tally: dict[str, int] = {}
 
@@ -46,11 +66,20 @@ def phase_votes(context: RoundContext) -> None:
         active_visibility=context.history.player_ids.copy(),
     )
 
+    # Eliminated voters may have deferred memory to consolidate first
+    yield from settle_memory(context, voters, max_concurrency)
+
     # Construct list of candidates for the vote
     candidates = context.active_player_ids
 
+    # Prepare every ballot before collecting any of them. Votes are private,
+    # so no voter's context depends on another voter's ballot; collecting them
+    # concurrently yields the same history as collecting them one by one.
+    ballots: list[PlayerCall] = []
+    ballot_segments: list[list[str]] = []
+
     # Permute the player IDs to avoid order effects
-    for voter in permute_player_ids(voters):
+    for voter in permute_player_ids(voters, context.rng):
         # Get the player object from the voter ID
         player = next(
             player for player in context.players if player.config.player_id == voter
@@ -58,14 +87,13 @@ def phase_votes(context: RoundContext) -> None:
 
         # Elicit the vote from the player
         context.logger.info(f"Player {voter} is voting")
-        memory_context = player.memory.render()
-        visible_events = context.history.render_for_player(voter)
-        if memory_context:
-            visible_events = f"{memory_context}\n\n{visible_events}"
+        visible_events, context_segments = render_player_context(context, player)
 
         # Permute candidates at the voter level to avoid order effects
         # Exclude the active voter from the candidates
-        candidates_for_voter = permute_player_ids([c for c in candidates if c != voter])
+        candidates_for_voter = permute_player_ids(
+            [c for c in candidates if c != voter], context.rng
+        )
 
         action = (
             f"{vote_instruction} You cannot vote for yourself. "
@@ -81,21 +109,27 @@ Example: '<choice>X</choice>' is a valid vote, but
 '<choice>[X]</choice>' and '<choice>XY</choice>' are not.
 Here, we assume X and Y are player IDs."""
 
-        system_prompt = f"""
-{context.rules_prompt}
-
-<character>
-{player.config.character_prompt}
-</character>
-"""
+        system_prompt = build_system_prompt(
+            context.rules_prompt, player.config.character_prompt
+        )
 
-        response = player.choice_response(
-            system_prompt=system_prompt,
-            context=visible_events,
-            options=candidates_for_voter,
-            action=action,
-            llm_instructions=llm_instructions,
+        ballots.append(
+            PlayerCall(
+                player=player,
+                system_prompt=system_prompt,
+                context=visible_events,
+                options=candidates_for_voter,
+                action=action,
+                llm_instructions=llm_instructions,
+            )
         )
+        ballot_segments.append(context_segments)
+
+    responses = yield CallBatch(calls=ballots, max_concurrency=max_concurrency)
+
+    # Record ballots in the permuted order, regardless of completion order
+    for ballot, context_segments, response in zip(ballots, ballot_segments, responses):
+        player = ballot.player
 
         if response.selected:
             vote_tally[response.selected] = vote_tally.get(response.selected, 0) + 1
@@ -108,11 +142,17 @@ Here, we assume X and Y are player IDs."""
         metadata["vote"] = response.selected
 
         if player.config.player_type == "human":
-            prompt = action
+            prompt = ballot.action
         else:
-            prompt = (
-                f"{system_prompt}\n\n{visible_events}\n\n{action}\n\n{llm_instructions}"
-            )
+            prompt = [
+                ballot.system_prompt,
+                "\n\n",
+                *context_segments,
+                "\n\n",
+                ballot.action,
+                "\n\n",
+                ballot.llm_instructions,
+            ]
 
         context.history.add_event(
             round_index=context.round_index,
@@ -142,7 +182,7 @@ Here, we assume X and Y are player IDs."""
     # Find selected player
     if not vote_tally:
         # If no valid votes, randomly select a player
-        selected_player_id = random.choice(candidates)
+        selected_player_id = context.rng.choice(candidates)
         context.logger.info(
             f"No valid votes found. Randomly selecting Player {selected_player_id}"
         )
@@ -184,7 +224,7 @@ Here, we assume X and Y are player IDs."""
 
         # If there is a tie, randomly select a player from the tied players
         else:
-            selected_player_id = random.choice(tied_players)
+            selected_player_id = context.rng.choice(tied_players)
             context.logger.info(
                 f"Tie between {tied_players} with "
                 f"{max_votes} vote(s). Randomly selecting "
@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import queue
+import random
 import re
 import time
 from abc import ABC, abstractmethod
@@ -8,8 +10,15 @@ from typing import Callable, Optional, Protocol
 
 from openrouter import OpenRouter
 
-from .llm_response import LLMResponse, parse_openrouter_response
+from .cassette import Cassette
+from .clients import ClientPoolConfig, get_client, metered
+from .conversation import ConversationState
+from .llm_response import LLMResponse, ResponseStream, parse_openrouter_response
 from .memory import MemoryStrategy, create_strategy
+from .prompts import build_player_input, cache_hints
+from .ratelimit import get_limiter, is_rate_limited
+from .retry import RetryPolicy, RetryState
+from .timing import CallTiming
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +29,8 @@ class PlayerConfig:
     Configuration for a player.
 
     AI players require model and api_key. Human players can omit them.
+    With chain_conversation, an AI player's requests form an append-only
+    conversation that only adds newly visible events (see ConversationState).
     """
 
     player_id: str
@@ -29,6 +40,7 @@ class PlayerConfig:
     client_kwargs: dict = field(default_factory=dict)
     memory_strategy: str = "none"
     player_type: str = "ai"
+    chain_conversation: bool = False
 
 
 @dataclass
@@ -61,6 +73,9 @@ class ChoiceCollector(Protocol):
 class Player(ABC):
     config: PlayerConfig
     memory: MemoryStrategy
+    # Whether free_response/choice_response (and their async variants) take
+    # an on_delta callback and stream the response text to it (see AIPlayer)
+    stream: bool = False
 
     @abstractmethod
     def free_response(
@@ -77,6 +92,38 @@ class Player(ABC):
         llm_instructions: str = "",
     ) -> ChoiceResponse: ...
 
+    async def free_response_async(
+        self, system_prompt: str, context: str, action: str, llm_instructions: str = ""
+    ) -> FreeResponse:
+        """
+        Async variant of free_response.
+
+        The default runs the blocking implementation in a worker thread so that
+        players without a native async backend (e.g. humans) still work under
+        GameEngine.play_async().
+        """
+        return await asyncio.to_thread(
+            self.free_response, system_prompt, context, action, llm_instructions
+        )
+
+    async def choice_response_async(
+        self,
+        system_prompt: str,
+        context: str,
+        options: list[str],
+        action: str,
+        llm_instructions: str = "",
+    ) -> ChoiceResponse:
+        """Async variant of choice_response (see free_response_async)."""
+        return await asyncio.to_thread(
+            self.choice_response,
+            system_prompt,
+            context,
+            options,
+            action,
+            llm_instructions,
+        )
+
 
 class AIPlayer(Player):
     def __init__(
@@ -84,21 +131,69 @@ class AIPlayer(Player):
         config: PlayerConfig,
         max_retries: int = 3,
         timeout_ms: int = 600_000,
+        cassette: Cassette | None = None,
+        retry_policy: RetryPolicy | None = None,
+        stream: bool = False,
+        prompt_cache_hints: bool = False,
     ):
         self.config = config
-        self.max_retries = max_retries
-        self.client = OpenRouter(api_key=config.api_key, timeout_ms=timeout_ms)
+        # Stream responses to PlayerCall.on_delta subscribers, recording
+        # time-to-first-token and tokens/sec in the response metadata
+        self.stream = stream
+        # Add provider prompt-caching hints to requests (see prompts.cache_hints)
+        self.prompt_cache_hints = prompt_cache_hints
+        # Append-only conversations (PlayerConfig.chain_conversation)
+        self.conversation: ConversationState | None = (
+            ConversationState() if config.chain_conversation else None
+        )
+        # Retries, backoff, deadlines and circuit breaking (see RetryPolicy);
+        # max_retries is a shorthand for a default policy
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self.timeout_ms = timeout_ms
+        # Optional record/replay store of responses (see Cassette)
+        self.cassette = cassette
+        # Connection pool settings of the client (None for the defaults, see
+        # clients.configure_client_pool); set before the first call
+        self.client_pool: ClientPoolConfig | None = None
+        self._client: OpenRouter | None = None
+        self._jitter = random.Random()
         self.memory: MemoryStrategy = create_strategy(config.memory_strategy)
 
+    @property
+    def max_retries(self) -> int:
+        return self.retry_policy.max_retries
+
+    @property
+    def client(self) -> OpenRouter:
+        """
+        The OpenRouter client, created on first use.
+
+        Players with the same API key, timeout and pool settings share a
+        client (and its connection pool) from the process-wide registry in
+        ``clients``.
+        """
+        if self._client is None:
+            self._client = get_client(
+                self.config.api_key, self.timeout_ms, self.client_pool
+            )
+        return self._client
+
+    @client.setter
+    def client(self, client: OpenRouter) -> None:
+        self._client = client
+
     def free_response(
-        self, system_prompt: str, context: str, action: str, llm_instructions: str = ""
+        self,
+        system_prompt: str,
+        context: str,
+        action: str,
+        llm_instructions: str = "",
+        on_delta: Callable[[str], None] | None = None,
     ) -> FreeResponse:
-        result = self._respond(system_prompt, context, action, llm_instructions)
-        return FreeResponse(
-            text=result.text,
-            reasoning=result.reasoning,
-            metadata=result.metadata,
+        result = self._respond(
+            system_prompt, context, action, llm_instructions, on_delta
         )
+        return self._to_free_response(result)
 
     def choice_response(
         self,
@@ -107,8 +202,50 @@ class AIPlayer(Player):
         options: list[str],
         action: str,
         llm_instructions: str = "",
+        on_delta: Callable[[str], None] | None = None,
+    ) -> ChoiceResponse:
+        result = self._respond(
+            system_prompt, context, action, llm_instructions, on_delta
+        )
+        return self._to_choice_response(result, options)
+
+    async def free_response_async(
+        self,
+        system_prompt: str,
+        context: str,
+        action: str,
+        llm_instructions: str = "",
+        on_delta: Callable[[str], None] | None = None,
+    ) -> FreeResponse:
+        result = await self._respond_async(
+            system_prompt, context, action, llm_instructions, on_delta
+        )
+        return self._to_free_response(result)
+
+    async def choice_response_async(
+        self,
+        system_prompt: str,
+        context: str,
+        options: list[str],
+        action: str,
+        llm_instructions: str = "",
+        on_delta: Callable[[str], None] | None = None,
+    ) -> ChoiceResponse:
+        result = await self._respond_async(
+            system_prompt, context, action, llm_instructions, on_delta
+        )
+        return self._to_choice_response(result, options)
+
+    def _to_free_response(self, result: LLMResponse) -> FreeResponse:
+        return FreeResponse(
+            text=result.text,
+            reasoning=result.reasoning,
+            metadata=result.metadata,
+        )
+
+    def _to_choice_response(
+        self, result: LLMResponse, options: list[str]
     ) -> ChoiceResponse:
-        result = self._respond(system_prompt, context, action, llm_instructions)
         selected = self._extract_choice(result.text, options)
         metadata = dict(result.metadata) if result.metadata else {}
         if selected is None:
@@ -120,61 +257,237 @@ class AIPlayer(Player):
             metadata=metadata or None,
         )
 
+    def _request_kwargs(
+        self,
+        system_prompt: str,
+        context: str,
+        action: str,
+        llm_instructions: str = "",
+    ) -> tuple[dict, Callable[[LLMResponse], LLMResponse]]:
+        """
+        Build a request and the hook to run on its successful response.
+
+        Returns:
+            tuple: (request keyword arguments, callback that commits the
+            response to the player's conversation in chained mode)
+        """
+        request = {
+            "model": self.config.model,
+            "instructions": system_prompt,
+            "input": build_player_input(context, action, llm_instructions),
+            **(cache_hints(system_prompt) if self.prompt_cache_hints else {}),
+            **self.config.client_kwargs,
+        }
+        if self.conversation is None:
+            return request, lambda result: result
+
+        messages, turn, commit = self.conversation.build_input(
+            system_prompt, context, build_player_input("", action, llm_instructions)
+        )
+        request["input"] = messages
+
+        def finish(result: LLMResponse) -> LLMResponse:
+            commit(result.text)
+            metadata = dict(result.metadata) if result.metadata else {}
+            metadata["chained_turn"] = turn
+            result.metadata = metadata
+            return result
+
+        return request, finish
+
     def _respond(
         self,
         system_prompt: str,
         context: str,
         action: str,
         llm_instructions: str = "",
+        on_delta: Callable[[str], None] | None = None,
     ) -> LLMResponse:
-        input_parts = [context, action]
-        if llm_instructions:
-            input_parts.append(llm_instructions)
-
-        last_exc: Exception | None = None
-        for attempt in range(self.max_retries + 1):
-            try:
-                response = self.client.beta.responses.send(
-                    model=self.config.model,
-                    instructions=system_prompt,
-                    input="\n\n".join(input_parts),
-                    **self.config.client_kwargs,
-                )
-                result = parse_openrouter_response(response)
-                if attempt > 0:
-                    meta = dict(result.metadata) if result.metadata else {}
-                    meta["retries"] = attempt
-                    result.metadata = meta
-                return result
-            except Exception as exc:
-                last_exc = exc
-                if attempt < self.max_retries:
-                    wait = 2**attempt  # 1s, 2s, 4s
-                    logger.warning(
-                        "Request failed for player %s (model %s) "
-                        "(attempt %d/%d): %s. Retrying in %ds.",
-                        self.config.player_id,
-                        self.config.model,
-                        attempt + 1,
-                        self.max_retries + 1,
-                        exc,
-                        wait,
-                    )
+        request, finish = self._request_kwargs(
+            system_prompt, context, action, llm_instructions
+        )
+        if self.cassette and self.cassette.mode == "replay":
+            return finish(self._replay(request, on_delta))
+
+        retry = RetryState(self.retry_policy, self.config.model, self._jitter)
+        timing = CallTiming()
+        with metered(timing.transfer):
+            while True:
+                attempt_started = time.perf_counter()
+                try:
+                    timeout_s = retry.before_attempt()
+                    result = self._send(request, timeout_s, on_delta, timing)
+                except Exception as exc:
+                    wait = self._handle_failure(retry, exc)
+                    if wait is None:
+                        raise self._exhausted_error(retry, exc) from exc
+                    _discard_streamed(on_delta)
                     time.sleep(wait)
                 else:
-                    logger.error(
-                        "Request failed for player %s (model %s) "
-                        "after %d attempt(s): %s",
-                        self.config.player_id,
-                        self.config.model,
-                        self.max_retries + 1,
-                        exc,
+                    retry.on_success()
+                    timing.retry_s = attempt_started - timing.started
+                    result = finish(self._annotate(result, retry, timing))
+                    return self._record(request, result)
+
+    async def _respond_async(
+        self,
+        system_prompt: str,
+        context: str,
+        action: str,
+        llm_instructions: str = "",
+        on_delta: Callable[[str], None] | None = None,
+    ) -> LLMResponse:
+        request, finish = self._request_kwargs(
+            system_prompt, context, action, llm_instructions
+        )
+        if self.cassette and self.cassette.mode == "replay":
+            return finish(self._replay(request, on_delta))
+
+        retry = RetryState(self.retry_policy, self.config.model, self._jitter)
+        timing = CallTiming()
+        with metered(timing.transfer):
+            while True:
+                attempt_started = time.perf_counter()
+                try:
+                    timeout_s = retry.before_attempt()
+                    result = await self._send_async(
+                        request, timeout_s, on_delta, timing
                     )
-        raise RuntimeError(
+                except Exception as exc:
+                    wait = self._handle_failure(retry, exc)
+                    if wait is None:
+                        raise self._exhausted_error(retry, exc) from exc
+                    _discard_streamed(on_delta)
+                    await asyncio.sleep(wait)
+                else:
+                    retry.on_success()
+                    timing.retry_s = attempt_started - timing.started
+                    result = finish(self._annotate(result, retry, timing))
+                    return self._record(request, result)
+
+    def _send(
+        self,
+        request: dict,
+        timeout_s: float | None,
+        on_delta: Callable[[str], None] | None = None,
+        timing: CallTiming | None = None,
+    ) -> LLMResponse:
+        """Send one attempt through the model's shared rate limiter."""
+        limiter = get_limiter(self.config.model)
+        tokens = limiter.estimate_tokens(request)
+        waited = time.perf_counter()
+        limiter.acquire(tokens)
+        if timing is not None:
+            timing.queue_s += time.perf_counter() - waited
+        try:
+            kwargs = {**request, **self._timeout_kwargs(timeout_s)}
+            if on_delta is None:
+                response = self.client.beta.responses.send(**kwargs)
+                result = parse_openrouter_response(response)
+            else:
+                stream = ResponseStream(on_delta)
+                with self.client.beta.responses.send(**kwargs, stream=True) as events:
+                    for event in events:
+                        stream.feed(event)
+                result = stream.result()
+        except BaseException as exc:
+            limiter.release(tokens, success=False, rate_limited=is_rate_limited(exc))
+            raise
+        limiter.release(tokens, used_tokens=self._used_tokens(result))
+        return result
+
+    async def _send_async(
+        self,
+        request: dict,
+        timeout_s: float | None,
+        on_delta: Callable[[str], None] | None = None,
+        timing: CallTiming | None = None,
+    ) -> LLMResponse:
+        limiter = get_limiter(self.config.model)
+        tokens = limiter.estimate_tokens(request)
+        waited = time.perf_counter()
+        await limiter.acquire_async(tokens)
+        if timing is not None:
+            timing.queue_s += time.perf_counter() - waited
+        try:
+            kwargs = {**request, **self._timeout_kwargs(timeout_s)}
+            responses = self.client.beta.responses
+            if on_delta is None:
+                response = await responses.send_async(**kwargs)
+                result = parse_openrouter_response(response)
+            else:
+                stream = ResponseStream(on_delta)
+                async with await responses.send_async(**kwargs, stream=True) as events:
+                    async for event in events:
+                        stream.feed(event)
+                result = stream.result()
+        except BaseException as exc:
+            limiter.release(tokens, success=False, rate_limited=is_rate_limited(exc))
+            raise
+        limiter.release(tokens, used_tokens=self._used_tokens(result))
+        return result
+
+    def _replay(
+        self, request: dict, on_delta: Callable[[str], None] | None
+    ) -> LLMResponse:
+        result = self.cassette.replay(request)
+        if on_delta is not None and result.text:
+            on_delta(result.text)
+        return result
+
+    def _timeout_kwargs(self, timeout_s: float | None) -> dict:
+        """Shorten the request timeout to the time left before the deadline."""
+        if timeout_s is None or timeout_s * 1000 >= self.timeout_ms:
+            return {}
+        return {"timeout_ms": max(1, int(timeout_s * 1000))}
+
+    @staticmethod
+    def _used_tokens(result: LLMResponse) -> int | None:
+        return (result.metadata or {}).get("total_tokens")
+
+    @staticmethod
+    def _annotate(
+        result: LLMResponse, retry: RetryState, timing: CallTiming
+    ) -> LLMResponse:
+        result.metadata = timing.annotate(retry.annotate(result.metadata))
+        return result
+
+    def _record(self, request: dict, result: LLMResponse) -> LLMResponse:
+        if self.cassette and self.cassette.mode == "record":
+            self.cassette.record(request, result)
+        return result
+
+    def _handle_failure(self, retry: RetryState, exc: Exception) -> float | None:
+        """Log a failed attempt and return the backoff in seconds (None = give up)."""
+        attempt = retry.attempt
+        wait = retry.on_failure(exc)
+        if wait is not None:
+            logger.warning(
+                "Request failed for player %s (model %s) "
+                "(attempt %d/%d): %s. Retrying in %.1fs.",
+                self.config.player_id,
+                self.config.model,
+                attempt + 1,
+                self.max_retries + 1,
+                exc,
+                wait,
+            )
+            return wait
+        logger.error(
+            "Request failed for player %s (model %s) after %d attempt(s): %s",
+            self.config.player_id,
+            self.config.model,
+            retry.attempt,
+            exc,
+        )
+        return None
+
+    def _exhausted_error(self, retry: RetryState, exc: Exception) -> RuntimeError:
+        return RuntimeError(
             f"Request failed for player {self.config.player_id} "
-            f"(model {self.config.model}) after {self.max_retries + 1} "
-            f"attempt(s): {last_exc}"
-        ) from last_exc
+            f"(model {self.config.model}) after {retry.attempt} "
+            f"attempt(s): {exc}"
+        )
 
     def _extract_choice(
         self, content: str, valid_player_ids: list[str]
@@ -187,6 +500,16 @@ class AIPlayer(Player):
         return None
 
 
+def _discard_streamed(on_delta: Callable[[str], None] | None) -> None:
+    """
+    Tell a streaming subscriber that the text of a failed attempt is
+    discarded, if the callback supports it (see history.DeltaEmitter).
+    """
+    restart = getattr(on_delta, "restart", None)
+    if restart is not None:
+        restart()
+
+
 class HumanPlayer(Player):
     def __init__(
         self, config: PlayerConfig, free: FreeCollector, choice: ChoiceCollector
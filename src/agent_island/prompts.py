@@ -0,0 +1,62 @@
+import hashlib
+
+# Automatic prompt caching: the provider places a cache breakpoint on the last
+# cacheable block of the request
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def build_system_prompt(rules_prompt: str, character_prompt: str) -> str:
+    """
+    Build a player's system prompt.
+
+    Every phase uses this, so all of a player's requests start with the same
+    bytes and the provider's prompt cache can serve them from the first
+    token. Requests are laid out from most to least stable: this system
+    prompt (rules, then character), then the player's memory, the rendered
+    history (settled rounds before the current one) and finally the action
+    and formatting instructions.
+
+    Args:
+        rules_prompt: Prompt with the rules of the game
+        character_prompt: The player's character prompt
+
+    Returns:
+        The system prompt
+    """
+    return (
+        f"{rules_prompt.strip()}\n\n"
+        f"<character>\n{character_prompt.strip()}\n</character>"
+    )
+
+
+def build_player_input(context: str, action: str, llm_instructions: str = "") -> str:
+    """
+    Build the input of a player request: context first, volatile text last.
+
+    Args:
+        context: The player's memory and visible history
+        action: The action the player is asked to take
+        llm_instructions: Extra formatting instructions for AI players
+
+    Returns:
+        The input text
+    """
+    return "\n\n".join(part for part in (context, action, llm_instructions) if part)
+
+
+def cache_hints(instructions: str) -> dict:
+    """
+    Request keyword arguments that help providers reuse cached prefixes.
+
+    Enables automatic cache breakpoints (Anthropic-style ``cache_control``)
+    and routes requests sharing a system prompt to the same cache with a
+    ``prompt_cache_key`` derived from it.
+
+    Args:
+        instructions: The request's system prompt
+
+    Returns:
+        dict of request keyword arguments
+    """
+    key = hashlib.sha256(instructions.encode("utf-8")).hexdigest()[:16]
+    return {"cache_control": CACHE_CONTROL, "prompt_cache_key": key}
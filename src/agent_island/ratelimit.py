@@ -0,0 +1,254 @@
+import asyncio
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from .conversation import input_chars
+
+
+@dataclass(frozen=True)
+class RateLimits:
+    """
+    Limits for one model.
+
+    Args:
+        rpm: Requests per minute (None for no limit)
+        tpm: Tokens per minute (None for no limit). Requests reserve an
+            estimate of their input tokens and are charged their actual
+            total tokens once the response arrives.
+        max_concurrency: Upper bound of the concurrency window (None for no
+            bound)
+    """
+
+    rpm: float | None = None
+    tpm: float | None = None
+    max_concurrency: int | None = None
+
+    def scaled(self, share: float) -> "RateLimits":
+        """The limits for a process getting ``share`` of the quota."""
+        return RateLimits(
+            rpm=self.rpm * share if self.rpm is not None else None,
+            tpm=self.tpm * share if self.tpm is not None else None,
+            max_concurrency=(
+                max(1, math.floor(self.max_concurrency * share))
+                if self.max_concurrency is not None
+                else None
+            ),
+        )
+
+
+class _Bucket:
+    """Token bucket refilled continuously at ``per_minute`` / 60 per second."""
+
+    def __init__(self, per_minute: float) -> None:
+        self.rate = per_minute / 60.0
+        self.capacity = per_minute
+        self.level = per_minute
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` is available (0 if it is now)."""
+        self._refill(now)
+        # A request larger than the bucket waits for a full bucket instead of
+        # blocking forever
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.level -= amount
+
+
+class ModelLimiter:
+    """
+    Rate limiter and concurrency governor for one model.
+
+    Requests wait for the request and token buckets and for a free slot in
+    the concurrency window. The window follows AIMD: it grows by one slot per
+    window of successful requests (up to ``max_concurrency``) and is halved
+    on every 429 response, so throughput settles just under the provider's
+    quota instead of oscillating through retry storms. With no 429s and no
+    ``max_concurrency`` the window never limits anything.
+
+    Safe to share between threads and event loops.
+
+    Args:
+        limits: The model's limits
+    """
+
+    def __init__(self, limits: RateLimits) -> None:
+        self.limits = limits
+        self._cond = threading.Condition()
+        self._requests = _Bucket(limits.rpm) if limits.rpm else None
+        self._tokens = _Bucket(limits.tpm) if limits.tpm else None
+        self.window: float = (
+            float(limits.max_concurrency) if limits.max_concurrency else math.inf
+        )
+        self.in_flight = 0
+        # Async waiters (loop, event) to wake when a slot is released
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+
+    @staticmethod
+    def estimate_tokens(request: Dict[str, Any]) -> int:
+        """Rough input token count of a request (4 characters per token)."""
+        chars = len(request.get("instructions") or "") + input_chars(
+            request.get("input")
+        )
+        return chars // 4 + 1
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Take a slot if possible; otherwise return how long to wait."""
+        if self.in_flight + 1 > max(1.0, self.window):
+            return math.inf  # until a slot is released
+        now = time.monotonic()
+        wait = 0.0
+        if self._requests:
+            wait = max(wait, self._requests.wait_time(1, now))
+        if self._tokens:
+            wait = max(wait, self._tokens.wait_time(tokens, now))
+        if wait > 0:
+            return wait
+        if self._requests:
+            self._requests.take(1)
+        if self._tokens:
+            self._tokens.take(tokens)
+        self.in_flight += 1
+        return 0.0
+
+    def acquire(self, tokens: int) -> None:
+        """Block until the request may be sent."""
+        with self._cond:
+            while True:
+                wait = self._try_acquire(tokens)
+                if wait == 0:
+                    return
+                self._cond.wait(None if wait == math.inf else wait)
+
+    async def acquire_async(self, tokens: int) -> None:
+        """
+        Wait on the running event loop until the request may be sent.
+
+        The waiter sleeps until the buckets refill or release() wakes it
+        (from any thread, through the waiter's loop).
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            waiter = (loop, asyncio.Event())
+            with self._cond:
+                wait = self._try_acquire(tokens)
+                if wait == 0:
+                    return
+                self._async_waiters.append(waiter)
+            try:
+                await asyncio.wait_for(
+                    waiter[1].wait(), None if wait == math.inf else wait
+                )
+            except TimeoutError:
+                pass
+            finally:
+                with self._cond:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+
+    def release(
+        self,
+        reserved_tokens: int,
+        used_tokens: int | None = None,
+        success: bool = True,
+        rate_limited: bool = False,
+    ) -> None:
+        """
+        Free the request's slot and adapt the concurrency window.
+
+        Args:
+            reserved_tokens: Tokens reserved in acquire
+            used_tokens: Actual total tokens (None if unknown)
+            success: Whether the request succeeded
+            rate_limited: Whether the request got a 429 response
+
+        Returns:
+            None
+        """
+        with self._cond:
+            self.in_flight -= 1
+            if self._tokens and used_tokens is not None:
+                # Charge the difference between actual and reserved tokens
+                self._tokens.take(used_tokens - reserved_tokens)
+            if rate_limited:
+                current = self.window if self.window != math.inf else self.in_flight + 1
+                self.window = max(1.0, current / 2)
+            elif success and self.window != math.inf:
+                self.window += 1 / self.window
+                if self.limits.max_concurrency:
+                    self.window = min(self.window, float(self.limits.max_concurrency))
+            self._cond.notify_all()
+            for loop, event in self._async_waiters:
+                try:
+                    loop.call_soon_threadsafe(event.set)
+                except RuntimeError:
+                    pass  # the waiter's loop is closed
+            self._async_waiters.clear()
+
+
+_lock = threading.Lock()
+_limits: Dict[str, RateLimits] = {}
+_limiters: Dict[str, ModelLimiter] = {}
+
+
+def configure_rate_limits(
+    limits: Dict[str, Dict[str, Any]], share: float = 1.0
+) -> None:
+    """
+    Set per-model limits.
+
+    A model's limiter (and its learned concurrency window) is replaced only
+    if its limits change.
+
+    Args:
+        limits: RateLimits fields keyed by model name (e.g. the
+            ``[rate_limits]`` table of a player config)
+        share: Fraction of each quota available to this process (e.g. 1/4
+            for each of 4 worker processes)
+
+    Returns:
+        None
+    """
+    with _lock:
+        for model, fields in limits.items():
+            model_limits = RateLimits(**fields).scaled(share)
+            if _limits.get(model) != model_limits:
+                _limits[model] = model_limits
+                _limiters.pop(model, None)
+
+
+def get_limiter(model: str) -> ModelLimiter:
+    """
+    Get the process-wide limiter of a model.
+
+    Models without configured limits get a limiter that only applies the
+    AIMD concurrency window after 429 responses.
+
+    Args:
+        model: The model name
+
+    Returns:
+        The shared ModelLimiter
+    """
+    with _lock:
+        limiter = _limiters.get(model)
+        if limiter is None:
+            limiter = ModelLimiter(_limits.get(model, RateLimits()))
+            _limiters[model] = limiter
+        return limiter
+
+
+def is_rate_limited(exc: BaseException) -> bool:
+    """Whether an exception is a 429 (Too Many Requests) response."""
+    return getattr(exc, "status_code", None) == 429
@@ -0,0 +1,361 @@
+import contextlib
+import contextvars
+import email.utils
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List
+
+from .ratelimit import is_rate_limited
+
+# Error classes returned by RetryPolicy.classify
+RATE_LIMITED = "rate_limited"
+RETRYABLE = "retryable"
+FATAL = "fatal"
+
+# 4xx statuses that are worth retrying (timeouts and conflicts)
+_RETRYABLE_4XX = {408, 409, 425}
+
+# Absolute time.monotonic() deadline of the running phase (None = no deadline)
+_phase_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "phase_deadline", default=None
+)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending a request while a model's circuit is open."""
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a call's or phase's deadline leaves no time for a request."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How AIPlayer retries failed requests.
+
+    Errors are classified as rate limited (429), retryable (5xx, 408, 409,
+    425, timeouts, connection errors and other unexpected failures) or fatal
+    (any other 4xx, e.g. a bad request or an invalid API key), and fatal
+    errors are never retried. Backoff uses full jitter (a uniform draw up to
+    ``base_delay_s * 2**attempt``, capped at ``max_delay_s``), except that a
+    server's ``Retry-After`` hint is honored when present. No retry is
+    attempted past the call's or the phase's deadline.
+
+    Args:
+        max_retries: Maximum retries per call
+        base_delay_s: Backoff before the first retry (upper bound of the
+            jittered delay)
+        max_delay_s: Upper bound of any jittered backoff
+        call_deadline_s: Total seconds a call may take, retries included
+            (None for no deadline)
+        phase_deadline_s: Total seconds a phase may take; applied by Round
+            to every call made during the phase (None for no deadline)
+        breaker_threshold: Consecutive failures of a model that open its
+            circuit (0 disables the circuit breaker)
+        breaker_reset_s: Seconds an open circuit fails fast before letting a
+            probe request through
+    """
+
+    max_retries: int = 3
+    base_delay_s: float = 1.0
+    max_delay_s: float = 30.0
+    call_deadline_s: float | None = None
+    phase_deadline_s: float | None = None
+    breaker_threshold: int = 5
+    breaker_reset_s: float = 30.0
+
+    @staticmethod
+    def classify(exc: BaseException) -> str:
+        """Classify an error as RATE_LIMITED, RETRYABLE or FATAL."""
+        if isinstance(exc, (CircuitOpenError, DeadlineExceeded)):
+            return FATAL
+        if is_rate_limited(exc):
+            return RATE_LIMITED
+        status = getattr(exc, "status_code", None)
+        if isinstance(status, int) and 400 <= status < 500:
+            return RETRYABLE if status in _RETRYABLE_4XX else FATAL
+        return RETRYABLE
+
+    @staticmethod
+    def retry_after(exc: BaseException) -> float | None:
+        """
+        Seconds the server asked the client to wait, if any.
+
+        Reads the ``retry-after-ms``, ``retry-after`` (seconds or HTTP date)
+        and ``x-ratelimit-reset`` (epoch milliseconds) response headers.
+
+        Args:
+            exc: The request error
+
+        Returns:
+            The delay in seconds, or None without a usable hint
+        """
+        headers = getattr(exc, "headers", None)
+        if not headers:
+            return None
+        try:
+            if "retry-after-ms" in headers:
+                return max(0.0, float(headers["retry-after-ms"]) / 1000)
+            if "retry-after" in headers:
+                value = headers["retry-after"]
+                try:
+                    return max(0.0, float(value))
+                except ValueError:
+                    date = email.utils.parsedate_to_datetime(value)
+                    return max(0.0, date.timestamp() - time.time())
+            if "x-ratelimit-reset" in headers:
+                reset = float(headers["x-ratelimit-reset"]) / 1000
+                return max(0.0, reset - time.time())
+        except (TypeError, ValueError):
+            pass
+        return None
+
+    def backoff(self, attempt: int, rng: random.Random) -> float:
+        """Full-jitter backoff in seconds before retry ``attempt + 1``."""
+        ceiling = min(self.max_delay_s, self.base_delay_s * 2**attempt)
+        return rng.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """
+    Per-model circuit breaker.
+
+    After ``threshold`` consecutive failures the circuit opens and requests
+    fail fast with CircuitOpenError for ``reset_s`` seconds. Then one probe
+    request is let through (half-open): its success closes the circuit and
+    its failure opens it again. Rate-limited and fatal errors do not count,
+    since they say nothing about the model being down.
+
+    Args:
+        threshold: Consecutive failures that open the circuit (0 = never)
+        reset_s: Seconds the circuit stays open before a probe
+    """
+
+    def __init__(self, threshold: int, reset_s: float) -> None:
+        self.threshold = threshold
+        self.reset_s = reset_s
+        self._lock = threading.Lock()
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """The circuit state: "closed", "open" or "half_open"."""
+        if self.opened_at is None:
+            return "closed"
+        if self._probing or time.monotonic() - self.opened_at >= self.reset_s:
+            return "half_open"
+        return "open"
+
+    def before_request(self, model: str) -> str:
+        """
+        Check that a request may be sent.
+
+        Args:
+            model: The model name (for the error message)
+
+        Returns:
+            The circuit state the request is sent in ("closed" or "half_open")
+
+        Raises:
+            CircuitOpenError: The circuit is open, or half-open with a probe
+                already in flight
+        """
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return state
+            if state == "half_open" and not self._probing:
+                self._probing = True
+                return state
+            retry_in = max(0.0, self.opened_at + self.reset_s - time.monotonic())
+            raise CircuitOpenError(
+                f"Circuit open for model {model} after {self.failures} "
+                f"consecutive failures (next probe in {retry_in:.1f}s)"
+            )
+
+    def record(self, success: bool, counted: bool = True) -> None:
+        """
+        Record a request's outcome.
+
+        Args:
+            success: Whether the request succeeded
+            counted: Whether a failure counts towards opening the circuit
+
+        Returns:
+            None
+        """
+        with self._lock:
+            probing, self._probing = self._probing, False
+            if success:
+                self.failures = 0
+                self.opened_at = None
+            elif counted:
+                self.failures += 1
+                if probing or (self.threshold and self.failures >= self.threshold):
+                    self.opened_at = time.monotonic()
+            elif probing:
+                # An uncounted failure says nothing; let another probe through
+                self.opened_at = time.monotonic() - self.reset_s
+
+
+_lock = threading.Lock()
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(model: str, policy: RetryPolicy) -> CircuitBreaker:
+    """
+    Get the process-wide circuit breaker of a model.
+
+    Args:
+        model: The model name
+        policy: Policy whose breaker settings are used if the breaker is new
+
+    Returns:
+        The shared CircuitBreaker
+    """
+    with _lock:
+        breaker = _breakers.get(model)
+        if breaker is None:
+            breaker = CircuitBreaker(policy.breaker_threshold, policy.breaker_reset_s)
+            _breakers[model] = breaker
+        return breaker
+
+
+@contextlib.contextmanager
+def phase_deadline(seconds: float | None) -> Iterator[None]:
+    """
+    Set the deadline of every call made in this context.
+
+    Nested deadlines can only shorten the current one. The deadline follows
+    the context into tasks and ``asyncio.to_thread``; thread pools must run
+    their work in a copy of the context.
+
+    Args:
+        seconds: Seconds from now (None leaves the current deadline)
+    """
+    if seconds is None:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    current = _phase_deadline.get()
+    token = _phase_deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _phase_deadline.reset(token)
+
+
+@dataclass
+class RetryState:
+    """
+    Retry bookkeeping of one AIPlayer call.
+
+    Args:
+        policy: The retry policy
+        model: The model name
+        rng: Source of backoff jitter
+    """
+
+    policy: RetryPolicy
+    model: str
+    rng: random.Random
+    attempt: int = 0
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    breaker_state: str = "closed"
+    deadline: float | None = None
+
+    def __post_init__(self) -> None:
+        self.breaker = get_breaker(self.model, self.policy)
+        self.deadline = _phase_deadline.get()
+        if self.policy.call_deadline_s is not None:
+            call_deadline = time.monotonic() + self.policy.call_deadline_s
+            self.deadline = min(self.deadline or math.inf, call_deadline)
+
+    def remaining(self) -> float | None:
+        """Seconds left before the deadline (None without a deadline)."""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def before_attempt(self) -> float | None:
+        """
+        Check the deadline and the circuit before sending a request.
+
+        Returns:
+            The request timeout in seconds imposed by the deadline (None
+            without a deadline)
+
+        Raises:
+            DeadlineExceeded: The deadline has passed
+            CircuitOpenError: The model's circuit is open
+        """
+        remaining = self.remaining()
+        if remaining is not None and remaining <= 0:
+            raise DeadlineExceeded(f"Deadline exceeded for model {self.model}")
+        self.breaker_state = self.breaker.before_request(self.model)
+        return remaining
+
+    def on_success(self) -> None:
+        self.breaker.record(success=True)
+
+    def on_failure(self, exc: BaseException) -> float | None:
+        """
+        Record a failed attempt and decide whether to retry.
+
+        Args:
+            exc: The request error
+
+        Returns:
+            Seconds to wait before the next attempt (None = give up)
+        """
+        kind = self.policy.classify(exc)
+        # Failing fast sends no request, so it is not an attempt
+        sent = not isinstance(exc, (CircuitOpenError, DeadlineExceeded))
+        if sent:
+            self.breaker.record(success=False, counted=kind == RETRYABLE)
+
+        hint = self.policy.retry_after(exc)
+        delay: float | None = None
+        if kind != FATAL and self.attempt < self.policy.max_retries:
+            if hint is not None:
+                # Honor the server, with a little jitter against a herd
+                delay = hint * (1 + self.rng.uniform(0, 0.1))
+            else:
+                delay = self.policy.backoff(self.attempt, self.rng)
+            remaining = self.remaining()
+            if remaining is not None and delay >= remaining:
+                delay = None
+
+        event: Dict[str, Any] = {
+            "attempt": self.attempt,
+            "error": type(exc).__name__,
+            "status": getattr(exc, "status_code", None),
+            "class": kind,
+            "delay": round(delay, 3) if delay is not None else None,
+        }
+        if hint is not None:
+            event["retry_after"] = round(hint, 3)
+        if self.breaker.state != "closed":
+            event["breaker"] = self.breaker.state
+        self.events.append(event)
+        if sent:
+            self.attempt += 1
+        return delay
+
+    def annotate(self, metadata: Dict[str, Any] | None) -> Dict[str, Any] | None:
+        """Add the retry and breaker events of the call to response metadata."""
+        if not self.events and self.breaker_state == "closed":
+            return metadata
+        meta = dict(metadata) if metadata else {}
+        if self.events:
+            meta["retries"] = self.attempt
+            meta["retry_events"] = self.events
+        if self.breaker_state != "closed":
+            meta["breaker"] = self.breaker_state
+        return meta
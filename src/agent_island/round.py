@@ -1,9 +1,15 @@
+import asyncio
+import inspect
 import logging
+import random
+import time
 from dataclasses import dataclass, field
-from typing import Any, Callable, List
+from typing import Any, Awaitable, Callable, Dict, List
 
 from .history import History
 from .player import Player
+from .retry import phase_deadline
+from .timing import new_timings
 
 
 @dataclass
@@ -22,6 +28,11 @@ class RoundContext:
         history: History for the round
         rules_prompt: Prompt with the rules of the game
         votes: Dictionary of votes for the round
+        rng: The game's random number generator. Phases must use it for all
+            random draws (never the module-level ``random``), so that games
+            sharing a process stay reproducible from their game ID.
+        timings: The game's phase and round timing records, appended to by
+            Round (see timing.new_timings)
     """
 
     round_index: int
@@ -34,32 +45,132 @@ class RoundContext:
     history: History
     rules_prompt: str
     votes: dict[str, Any] = field(default_factory=dict)
+    rng: random.Random = field(default_factory=random.Random)
+    timings: Dict[str, List[Dict[str, Any]]] = field(default_factory=new_timings)
 
 
 class Round:
     def __init__(
-        self, context: RoundContext, phases: List[Callable[[RoundContext], None]]
+        self,
+        context: RoundContext,
+        phases: List[Callable[[RoundContext], None | Awaitable[None]]],
+        on_phase_complete: Callable[[int], None] | None = None,
+        phase_deadline_s: float | None = None,
+        phase_names: List[str] | None = None,
     ):
         """
         Initialize the Round class
 
         Args:
             context: The round context
-            phases: List of phase functions
+            phases: List of phase functions (coroutine functions are only
+                supported by play_async)
+            on_phase_complete: Optional callback receiving the number of
+                completed phases after each phase (used for checkpoints)
+            phase_deadline_s: Optional deadline in seconds for the player
+                calls of each phase (see RetryPolicy.phase_deadline_s)
+            phase_names: Names of the phases in timing records (defaults to
+                the names of the phase functions)
         """
         self.context = context
         self.phases = phases
+        self.on_phase_complete = on_phase_complete
+        self.phase_deadline_s = phase_deadline_s
+        self.phase_names = phase_names or [_phase_name(phase) for phase in phases]
 
-    def play(self):
+    def play(self, start_phase: int = 0):
         """
         Play a round of the game
 
         Args:
+            start_phase: Index of the first phase to run. A value above 0
+                resumes a round whose earlier phases already ran, so the
+                round is not started again.
+
+        Returns:
             None
+        """
+        started = time.perf_counter()
+        if start_phase == 0:
+            self._start()
+
+        for index in range(start_phase, len(self.phases)):
+            phase = self.phases[index]
+            self.context.logger.info(f"Starting {_phase_name(phase)}")
+            phase_started = self._phase_started()
+            with phase_deadline(self.phase_deadline_s):
+                phase(self.context)
+            self._phase_complete(index, phase_started)
+
+        self._round_complete(started, start_phase)
+
+    async def play_async(self, start_phase: int = 0):
+        """
+        Play a round of the game on the running event loop.
+
+        Coroutine phases are awaited; plain phase callables are run in a worker
+        thread so they cannot block the loop.
+
+        Args:
+            start_phase: Index of the first phase to run (see :meth:`play`)
 
         Returns:
             None
         """
+        started = time.perf_counter()
+        if start_phase == 0:
+            self._start()
+
+        for index in range(start_phase, len(self.phases)):
+            phase = self.phases[index]
+            self.context.logger.info(f"Starting {_phase_name(phase)}")
+            phase_started = self._phase_started()
+            with phase_deadline(self.phase_deadline_s):
+                if inspect.iscoroutinefunction(phase):
+                    await phase(self.context)
+                else:
+                    await asyncio.to_thread(phase, self.context)
+            self._phase_complete(index, phase_started)
+
+        self._round_complete(started, start_phase)
+
+    def _phase_started(self) -> tuple[float, int]:
+        """The start time and first event position of a phase."""
+        round_log = self.context.history.rounds[self.context.round_index]
+        return time.perf_counter(), len(round_log.events)
+
+    def _phase_complete(self, index: int, started: tuple[float, int]) -> None:
+        """Record the phase's duration and events, then checkpoint."""
+        start_time, first_event = started
+        round_log = self.context.history.rounds[self.context.round_index]
+        self.context.timings["phases"].append(
+            {
+                "round": self.context.round_index,
+                "index": index,
+                "phase": self.phase_names[index],
+                "duration_s": round(time.perf_counter() - start_time, 3),
+                "events": [first_event, len(round_log.events)],
+            }
+        )
+        if self.on_phase_complete:
+            self.on_phase_complete(index + 1)
+
+    def _round_complete(self, started: float, start_phase: int) -> None:
+        """Record the round's duration, including phases played before a resume."""
+        duration = time.perf_counter() - started
+        duration += sum(
+            record["duration_s"]
+            for record in self.context.timings["phases"]
+            if record["round"] == self.context.round_index
+            and record["index"] < start_phase
+        )
+        self.context.timings["rounds"].append(
+            {"round": self.context.round_index, "duration_s": round(duration, 3)}
+        )
+        self.context.logger.info(f"Round {self.context.round_index} complete")
+
+    def _start(self) -> None:
+        """Open the round in the history and announce it."""
         self.context.logger.info(f"Starting round {self.context.round_index}")
 
         all_player_ids = (
@@ -81,12 +192,7 @@ class Round:
             active_visibility=all_player_ids.copy(),
         )
 
-        for phase in self.phases:
-            name = (
-                getattr(phase, "__name__", None)
-                or getattr(phase, "func", phase).__name__
-            )
-            self.context.logger.info(f"Starting {name}")
-            phase(self.context)
 
-        self.context.logger.info(f"Round {self.context.round_index} complete")
+def _phase_name(phase: Callable) -> str:
+    """Name of a phase callable, unwrapping functools.partial."""
+    return getattr(phase, "__name__", None) or getattr(phase, "func", phase).__name__
@@ -0,0 +1,174 @@
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List
+
+from .clients import TransferMeter
+from .history import RoundLog
+
+
+@dataclass
+class CallTiming:
+    """
+    Where the time of one AIPlayer call went.
+
+    Args:
+        started: time.perf_counter() at the start of the call
+        queue_s: Time spent waiting for the model's rate limiter, over all
+            attempts
+        retry_s: Time spent before the successful attempt (failed attempts
+            and backoff)
+        transfer: HTTP body bytes sent and received, over all attempts
+    """
+
+    started: float = field(default_factory=time.perf_counter)
+    queue_s: float = 0.0
+    retry_s: float = 0.0
+    transfer: TransferMeter = field(default_factory=TransferMeter)
+
+    def annotate(self, metadata: Dict[str, Any] | None) -> Dict[str, Any]:
+        """Add the call's latency breakdown to response metadata."""
+        meta = dict(metadata) if metadata else {}
+        meta["latency_s"] = round(time.perf_counter() - self.started, 3)
+        meta["queue_s"] = round(self.queue_s, 3)
+        meta["retry_s"] = round(self.retry_s, 3)
+        meta["request_bytes"] = self.transfer.sent
+        meta["response_bytes"] = self.transfer.received
+        return meta
+
+
+def new_timings() -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Empty timing records of a game.
+
+    Round.play appends a record per completed phase to "phases"
+    (``{"round", "index", "phase", "duration_s", "events": [first, end]}``,
+    where ``events`` is the range of the round's events the phase added)
+    and one per completed round to "rounds" (``{"round", "duration_s"}``).
+    """
+    return {"phases": [], "rounds": []}
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of sorted values (0.0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def distribution(values: Iterable[float]) -> Dict[str, Any]:
+    """Count, total, p50, p95 and max of a list of durations."""
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "total": round(sum(ordered), 3),
+        "p50": round(percentile(ordered, 50), 3),
+        "p95": round(percentile(ordered, 95), 3),
+        "max": round(ordered[-1], 3) if ordered else 0.0,
+    }
+
+
+def _call_summary(calls: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "calls": len(calls),
+        "latency_s": distribution(c["latency_s"] for c in calls),
+        "queue_s": distribution(c.get("queue_s", 0.0) for c in calls),
+        "retry_s": distribution(c.get("retry_s", 0.0) for c in calls),
+        "request_bytes": sum(c.get("request_bytes", 0) for c in calls),
+        "response_bytes": sum(c.get("response_bytes", 0) for c in calls),
+    }
+
+
+def timing_stats(
+    rounds: Dict[int, RoundLog],
+    timings: Dict[str, List[Dict[str, Any]]],
+    models: Dict[str, str],
+) -> Dict[str, Any]:
+    """
+    The "timing" section of the game stats.
+
+    Args:
+        rounds: The game's round logs
+        timings: Timing records of the game (see new_timings)
+        models: Model of each player, by player ID
+
+    Returns:
+        dict with the game duration, round durations, phase durations
+        (distribution over rounds) and model call latencies by model and by
+        phase (distributions of latency_s, queue_s and retry_s, and bytes
+        transferred)
+    """
+    phase_of: Dict[tuple, str] = {}
+    phase_durations: Dict[str, List[float]] = {}
+    for record in timings["phases"]:
+        phase_durations.setdefault(record["phase"], []).append(record["duration_s"])
+        first, end = record["events"]
+        for position in range(first, end):
+            phase_of[(record["round"], position)] = record["phase"]
+
+    calls_by_model: Dict[str, List[Dict[str, Any]]] = {}
+    calls_by_phase: Dict[str, List[Dict[str, Any]]] = {}
+    for round_index, round_log in rounds.items():
+        for position, event in enumerate(round_log.events):
+            meta = event.metadata or {}
+            if "latency_s" not in meta:
+                continue
+            player_id = event.role.removeprefix("player ")
+            # Shared calls (role "shared") record the model they used
+            model = models.get(player_id) or meta.get("model") or "unknown"
+            calls_by_model.setdefault(model, []).append(meta)
+            phase = phase_of.get((round_index, position), "unknown")
+            calls_by_phase.setdefault(phase, []).append(meta)
+
+    round_durations = {
+        str(record["round"]): round(record["duration_s"], 3)
+        for record in timings["rounds"]
+    }
+    return {
+        "game_s": round(sum(round_durations.values()), 3),
+        "rounds": round_durations,
+        "phases": {
+            name: distribution(durations) for name, durations in phase_durations.items()
+        },
+        "calls": {
+            "by_model": {
+                model: _call_summary(calls) for model, calls in calls_by_model.items()
+            },
+            "by_phase": {
+                phase: _call_summary(calls) for phase, calls in calls_by_phase.items()
+            },
+        },
+    }
+
+
+def merge_timing_stats(sections: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge the timing stats of several games.
+
+    Counts, totals and bytes are summed and maxima are maximized.
+    Percentiles cannot be merged without the underlying samples, so they
+    are dropped.
+
+    Args:
+        sections: "timing" sections of game stats
+
+    Returns:
+        The merged section
+    """
+    merged: Dict[str, Any] = {}
+    for section in sections:
+        _merge_timing_into(merged, section)
+    return merged
+
+
+def _merge_timing_into(target: Dict[str, Any], source: Dict[str, Any]) -> None:
+    for key, value in source.items():
+        if isinstance(value, dict):
+            _merge_timing_into(target.setdefault(key, {}), value)
+        elif key in ("p50", "p95"):
+            continue
+        elif key == "max":
+            target[key] = max(target.get(key, value), value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            target[key] = target.get(key, 0) + value
@@ -0,0 +1,337 @@
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import pathlib
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List
+
+import dotenv
+
+from .engine import GameEngine, prompt_cache_stats
+from .loaders import (
+    create_game_config,
+    create_players,
+    load_game_config_from_toml,
+    load_player_configs_from_toml,
+    load_rate_limits_from_toml,
+)
+from .ratelimit import configure_rate_limits
+from .timing import merge_timing_stats
+
+LOGS_DIR = "logs"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TournamentGame:
+    """
+    One game of a tournament grid.
+
+    Args:
+        game_config: Path to the game config TOML file
+        player_config: Path to the player config TOML file
+        seed: Index of the game among those sharing both configs
+        game_id: The game ID (seeds the game's random draws)
+    """
+
+    game_config: str
+    player_config: str
+    seed: int
+    game_id: str
+
+
+def build_grid(
+    game_configs: List[pathlib.Path],
+    player_configs: List[pathlib.Path],
+    seeds: int,
+    tag: str = "tournament",
+) -> List[TournamentGame]:
+    """
+    Build every (game config, player config, seed) combination.
+
+    Game IDs are derived from the config file names and the seed, so running
+    the same grid again reproduces the same random draws.
+
+    Args:
+        game_configs: Game config TOML files
+        player_configs: Player config TOML files
+        seeds: Number of games per config pair
+        tag: Prefix for the game IDs
+
+    Returns:
+        List of TournamentGame
+    """
+    if seeds < 1:
+        raise ValueError(f"seeds must be >= 1, got {seeds}")
+    return [
+        TournamentGame(
+            game_config=str(game_config),
+            player_config=str(player_config),
+            seed=seed,
+            game_id=f"{tag}-{game_config.stem}-{player_config.stem}-{seed}",
+        )
+        for game_config in game_configs
+        for player_config in player_configs
+        for seed in range(seeds)
+    ]
+
+
+class _NoHumanCollector:
+    def collect(self, *args, **kwargs):
+        raise RuntimeError("Tournament games cannot have human players")
+
+
+def run_game(
+    game: TournamentGame, logs_dir: str | None, rate_limit_share: float = 1.0
+) -> Dict[str, Any]:
+    """
+    Play one tournament game (runs in a worker process).
+
+    Failures are reported in the result instead of raised, so one bad game
+    does not stop the tournament.
+
+    Args:
+        game: The game to play
+        logs_dir: Directory for the game's log (None to skip logging)
+        rate_limit_share: Fraction of the player config's per-model rate
+            limits available to this worker process
+
+    Returns:
+        dict with the game, status, error, log path, elapsed seconds and stats
+    """
+    api_key = os.getenv("OPENROUTER_API_KEY", "")
+    result: Dict[str, Any] = {
+        **asdict(game),
+        "status": "completed",
+        "error": None,
+        "log_path": None,
+        "elapsed": 0.0,
+        "stats": {},
+    }
+    start = time.perf_counter()
+    engine = None
+    try:
+        game_data = load_game_config_from_toml(pathlib.Path(game.game_config))
+        player_configs = load_player_configs_from_toml(
+            pathlib.Path(game.player_config), api_key=api_key
+        )
+        configure_rate_limits(
+            load_rate_limits_from_toml(pathlib.Path(game.player_config)),
+            share=rate_limit_share,
+        )
+        players = create_players(
+            player_configs, _NoHumanCollector(), _NoHumanCollector()
+        )
+        game_config = create_game_config(
+            game_data, logs_dir=logs_dir, game_id=game.game_id
+        )
+        engine = GameEngine(game_config=game_config, players=players)
+        result["log_path"] = engine.play()
+    except Exception as exc:
+        result["status"] = "failed"
+        result["error"] = str(exc)
+    result["elapsed"] = time.perf_counter() - start
+    if engine is not None:
+        result["stats"] = engine._compute_stats()
+    return result
+
+
+def merge_stats(stats: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge GameEngine stats of several games by summing every numeric field
+    (prompt cache hit rates are recomputed from the summed token counts, and
+    timing maxima are maximized while percentiles are dropped).
+
+    Args:
+        stats: Stats dicts as returned by GameEngine._compute_stats
+
+    Returns:
+        The merged stats (per-player entries are summed by player ID)
+    """
+    merged: Dict[str, Any] = {}
+    for game_stats in stats:
+        _merge_into(merged, {k: v for k, v in game_stats.items() if k != "timing"})
+    if "usage" in merged:
+        # Rates do not add up; recompute them from the summed token counts
+        merged["prompt_cache"] = prompt_cache_stats(merged["usage"])
+    timing = [game_stats["timing"] for game_stats in stats if "timing" in game_stats]
+    if timing:
+        merged["timing"] = merge_timing_stats(timing)
+    return merged
+
+
+def _merge_into(target: Dict[str, Any], source: Dict[str, Any]) -> None:
+    for key, value in source.items():
+        if isinstance(value, dict):
+            _merge_into(target.setdefault(key, {}), value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            target[key] = target.get(key, 0) + value
+
+
+def run_tournament(
+    games: List[TournamentGame],
+    max_workers: int,
+    logs_dir: str | None = LOGS_DIR,
+    on_result: Callable[[Dict[str, Any]], None] | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    Play games in parallel across worker processes.
+
+    At most ``max_workers`` games run at once. Each game writes its own log.
+    Rate limits are per process, so each worker gets an equal share of every
+    model's limits and the workers together stay within them.
+
+    Args:
+        games: The games to play
+        max_workers: Number of worker processes
+        logs_dir: Directory for the game logs (None to skip logging)
+        on_result: Optional callback fired as each game finishes
+
+    Returns:
+        Game results (see :func:`run_game`) in the order of ``games``
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+
+    results: List[Dict[str, Any] | None] = [None] * len(games)
+    workers = min(max_workers, len(games)) or 1
+    # spawn: workers must not inherit the parent's HTTP client threads
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(logging.getLogger().getEffectiveLevel(),),
+    ) as executor:
+        futures = {
+            executor.submit(run_game, game, logs_dir, 1 / workers): index
+            for index, game in enumerate(games)
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if on_result:
+                on_result(result)
+    return [r for r in results if r is not None]
+
+
+def _init_worker(level: int) -> None:
+    dotenv.load_dotenv()
+    # Keep per-game INFO noise out of the tournament progress output
+    logging.basicConfig(level=max(level, logging.WARNING))
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build the tournament summary.
+
+    Args:
+        results: Game results from :func:`run_tournament`
+
+    Returns:
+        dict with game counts, merged stats and the per-game results
+    """
+    return {
+        "games": len(results),
+        "completed": sum(r["status"] == "completed" for r in results),
+        "failed": sum(r["status"] != "completed" for r in results),
+        "elapsed": sum(r["elapsed"] for r in results),
+        "stats": merge_stats([r["stats"] for r in results]),
+        "results": results,
+    }
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s:%(name)s:%(message)s",
+        datefmt="%H:%M:%S",
+    )
+    dotenv.load_dotenv()
+
+    parser = argparse.ArgumentParser(
+        description="Run a grid of Agent Island games in parallel"
+    )
+    parser.add_argument(
+        "--game-config",
+        type=pathlib.Path,
+        action="append",
+        required=True,
+        help="Game config TOML file (repeat for several)",
+    )
+    parser.add_argument(
+        "--player-config",
+        type=pathlib.Path,
+        action="append",
+        required=True,
+        help="Player config TOML file (repeat for several)",
+    )
+    parser.add_argument(
+        "--seeds",
+        type=int,
+        default=1,
+        help="Number of games per (game config, player config) pair",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Maximum number of games running at once",
+    )
+    parser.add_argument(
+        "--logs-dir",
+        type=str,
+        default=LOGS_DIR,
+        help="Directory for game logs and the summary",
+    )
+    parser.add_argument(
+        "--tag",
+        type=str,
+        default="tournament",
+        help="Prefix for game IDs and the summary file name",
+    )
+    args = parser.parse_args()
+
+    api_key = os.getenv("OPENROUTER_API_KEY", "")
+    for path in args.player_config:
+        configs = load_player_configs_from_toml(path, api_key=api_key)
+        if any(c.player_type == "human" for c in configs):
+            raise ValueError(f"{path}: tournament games cannot have human players")
+        if configs and not api_key:
+            raise RuntimeError(
+                "OPENROUTER_API_KEY is required for AI players but not set."
+            )
+
+    games = build_grid(args.game_config, args.player_config, args.seeds, args.tag)
+    logger.info(f"Running {len(games)} games with up to {args.max_workers} at once")
+
+    done = 0
+
+    def on_result(result: Dict[str, Any]) -> None:
+        nonlocal done
+        done += 1
+        cost = result["stats"].get("cost", {}).get("total", 0.0)
+        message = (
+            f"[{done}/{len(games)}] {result['game_id']} {result['status']} "
+            f"in {result['elapsed']:.1f}s (cost ${cost:.4f})"
+        )
+        if result["error"]:
+            logger.warning(f"{message}: {result['error']}")
+        else:
+            logger.info(message)
+
+    results = run_tournament(games, args.max_workers, args.logs_dir, on_result)
+    summary = summarize(results)
+
+    os.makedirs(args.logs_dir, exist_ok=True)
+    summary_path = os.path.join(args.logs_dir, f"{args.tag}_summary.json")
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    print(
+        f"\n{summary['completed']}/{summary['games']} games completed; "
+        f"wrote summary to {summary_path}"
+    )